@@ -0,0 +1,142 @@
+"""
+Sync against async execution of the same converted schema.
+
+    $ python -m benchmarks.bench_async -o results.json
+    $ python -m benchmarks.bench_async --sizes 100 1000 --io-latency 0.002
+
+``plain`` queries only the converted fields, so it measures what async
+execution costs by itself. ``io`` also queries a computed field whose
+resolver waits ``--io-latency`` seconds, with ``time.sleep`` on the sync
+schema and ``asyncio.sleep`` on the async one, so async execution can run
+the waits of all the rows concurrently. Needs graphene 3.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import typing
+
+import graphene
+
+import pydantic2graphene
+
+from .bench_execution import Item, _percentile, make_items
+
+QUERIES = {
+    "plain": "{ items { name quantity status } }",
+    "io": "{ items { name stock } }",
+}
+
+
+def make_schema(items: typing.List[Item], io_latency: float, is_async: bool):
+    if is_async:
+
+        async def resolve_stock(root, info):
+            await asyncio.sleep(io_latency)
+            return root.quantity
+
+    else:
+
+        def resolve_stock(root, info):
+            time.sleep(io_latency)
+            return root.quantity
+
+    ItemGql = pydantic2graphene.to_graphene(
+        Item,
+        options={
+            "extra_fields": {"stock": graphene.Int()},
+            "resolvers": {"stock": resolve_stock},
+        },
+        cache=pydantic2graphene.ConversionCache(),
+    )
+
+    class Query(graphene.ObjectType):
+        items = graphene.List(ItemGql)
+
+        @staticmethod
+        def resolve_items(*args, **kwargs):
+            return items
+
+    return graphene.Schema(query=Query)
+
+
+def execute(schema, query: str, is_async: bool):
+    if is_async:
+        # asyncio.run is not on python 3.6
+        loop = asyncio.new_event_loop()
+        try:
+            result = loop.run_until_complete(schema.execute_async(query))
+        finally:
+            loop.close()
+    else:
+        result = schema.execute(query)
+
+    if result.errors:
+        raise RuntimeError(result.errors)
+
+
+def measure(schema, query: str, is_async: bool, repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        execute(schema, query, is_async)
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "p50": _percentile(timings, 50),
+        "p90": _percentile(timings, 90),
+        "p99": _percentile(timings, 99),
+        "mean": statistics.mean(timings),
+    }
+
+
+def run(sizes: typing.List[int], repeat: int, io_latency: float) -> dict:
+    results = []
+    for size in sizes:
+        items = make_items(size)
+        for mode in ("sync", "async"):
+            is_async = mode == "async"
+            schema = make_schema(items, io_latency, is_async)
+            for name, query in QUERIES.items():
+                result = measure(schema, query, is_async, repeat)
+                result.update({"query": name, "size": size, "mode": mode})
+                results.append(result)
+                print(
+                    f"{name:<6} {mode:<6} {size:>8} rows "
+                    f"p50 {result['p50'] * 1000:10.1f} ms "
+                    f"p99 {result['p99'] * 1000:10.1f} ms",
+                    file=sys.stderr,
+                )
+
+    return {
+        "meta": {
+            "graphene": graphene.__version__,
+            "pydantic2graphene": pydantic2graphene.__version__,
+            "repeat": repeat,
+            "io_latency": io_latency,
+        },
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-o", "--output", help="write the results as JSON")
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--io-latency", type=float, default=0.001)
+    args = parser.parse_args(argv)
+
+    if graphene.__version__[:1] < "3":
+        parser.error("async execution needs graphene 3")
+
+    results = run(args.sizes, args.repeat, args.io_latency)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+Conversion benchmarks for to_graphene and ConverterToGrapheneBase.as_class.
+
+    $ python -m benchmarks.bench_conversion -o results.json
+    $ python -m benchmarks.bench_conversion -o new.json --compare results.json
+
+Every scenario builds fresh synthetic models before being timed, "cold"
+runs convert with an empty ConversionCache and "warm" runs convert again
+with the cache filled by a previous conversion.
+"""
+import argparse
+import enum
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import typing
+
+import graphene
+import pydantic
+
+import pydantic2graphene
+
+_FIELD_KINDS = ("scalar", "enum", "constrained")
+
+_SCALAR_TYPES = (str, int, float, bool)
+
+_CONSTRAINED_TYPES = (
+    lambda: pydantic.constr(max_length=10),
+    lambda: pydantic.conint(gt=0),
+    lambda: pydantic.confloat(ge=0),
+)
+
+
+class Color(enum.Enum):
+    RED = "RED"
+    GREEN = "GREEN"
+    BLUE = "BLUE"
+
+
+def make_wide_model(width: int, kind: str) -> pydantic.BaseModel:
+    attrs = {}
+    for i in range(width):
+        if kind == "enum":
+            field_type = Color
+        elif kind == "constrained":
+            field_type = _CONSTRAINED_TYPES[i % len(_CONSTRAINED_TYPES)]()
+        else:
+            field_type = _SCALAR_TYPES[i % len(_SCALAR_TYPES)]
+        attrs[f"field_{i}"] = (field_type, ...)
+
+    return pydantic.create_model(f"Wide{kind.title()}{width}", **attrs)
+
+
+def make_deep_model(depth: int, width: int = 5) -> pydantic.BaseModel:
+    model = make_wide_model(width, "scalar")
+    for level in range(depth):
+        model = pydantic.create_model(
+            f"Level{level}",
+            child=(model, ...),
+            children=(typing.List[model], []),
+            name=(str, ...),
+        )
+
+    return model
+
+
+def _to_graphene(model, cache):
+    return pydantic2graphene.to_graphene(model, cache=cache)
+
+
+def _as_class(model, cache):
+    class Converter(pydantic2graphene.ConverterToGrapheneBase):
+        class Config:
+            pass
+
+    Converter.Config.model = model
+    # as_class always uses the default cache
+    cache = pydantic2graphene.get_default_cache()
+    cache.clear()
+    return Converter.as_class()
+
+
+def _to_graphene_and_schema(model, cache):
+    # nested models are converted lazily, building the schema forces them
+    graphene_class = pydantic2graphene.to_graphene(model, cache=cache)
+    return graphene.Schema(query=graphene_class)
+
+
+_TARGETS = {
+    "to_graphene": _to_graphene,
+    "as_class": _as_class,
+    "to_graphene_schema": _to_graphene_and_schema,
+}
+
+
+def _prepare(target, make_model, cache_state: str):
+    model = make_model()
+    cache = pydantic2graphene.ConversionCache(maxsize=None)
+    if cache_state == "warm":
+        target(model, cache)
+
+    return model, cache
+
+
+def measure(target, make_model, cache_state: str, repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        model, cache = _prepare(target, make_model, cache_state)
+        start = time.perf_counter()
+        target(model, cache)
+        timings.append(time.perf_counter() - start)
+
+    # tracing allocations slows everything down, so memory is measured on
+    # its own run
+    model, cache = _prepare(target, make_model, cache_state)
+    tracemalloc.start()
+    target(model, cache)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.mean(timings),
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def scenarios(quick: bool):
+    widths = (10, 100) if quick else (10, 100, 500, 2000)
+    depths = (1, 5) if quick else (1, 5, 10, 20)
+
+    for width in widths:
+        for kind in _FIELD_KINDS:
+            for target in ("to_graphene", "as_class"):
+                yield (
+                    target,
+                    {"shape": "wide", "width": width, "kind": kind},
+                    lambda w=width, k=kind: make_wide_model(w, k),
+                )
+
+    for depth in depths:
+        yield (
+            "to_graphene_schema",
+            {"shape": "deep", "depth": depth},
+            lambda d=depth: make_deep_model(d),
+        )
+
+
+def run(repeat: int, quick: bool) -> dict:
+    results = []
+    for target, params, make_model in scenarios(quick):
+        for cache_state in ("cold", "warm"):
+            if target == "as_class" and cache_state == "warm":
+                continue
+
+            result = measure(_TARGETS[target], make_model, cache_state, repeat)
+            result.update(
+                {"target": target, "cache": cache_state, "params": params}
+            )
+            results.append(result)
+            print(
+                f"{target:<20} {cache_state:<5} {json.dumps(params):<55} "
+                f"{result['median'] * 1000:10.3f} ms",
+                file=sys.stderr,
+            )
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "graphene": graphene.__version__,
+            "pydantic": str(pydantic.VERSION),
+            "pydantic2graphene": pydantic2graphene.__version__,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def _result_key(result: dict) -> str:
+    return json.dumps(
+        [result["target"], result["cache"], result["params"]], sort_keys=True
+    )
+
+
+def compare(current: dict, baseline: dict):
+    baseline_results = {_result_key(r): r for r in baseline["results"]}
+    for result in current["results"]:
+        previous = baseline_results.get(_result_key(result))
+        if not previous:
+            continue
+
+        time_ratio = result["median"] / previous["median"]
+        memory_ratio = result["peak_memory_bytes"] / max(
+            previous["peak_memory_bytes"], 1
+        )
+        print(
+            f"{_result_key(result):<90} time x{time_ratio:.2f} "
+            f"memory x{memory_ratio:.2f}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-o", "--output", help="write the results as JSON")
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument(
+        "--quick", action="store_true", help="only the smaller scenarios"
+    )
+    parser.add_argument(
+        "--compare", help="results JSON of a previous run to compare with"
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat, args.quick)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline:
+            compare(results, json.load(baseline))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Query execution benchmarks for schemas built from converted models.
+
+    $ python -m benchmarks.bench_execution -o results.json
+    $ python -m benchmarks.bench_execution --sizes 10000 100000 1000000
+
+Every query runs over lists of pydantic instances and reports latency
+percentiles. The time spent inside field resolvers is measured on a
+separate run with a timing middleware (the middleware adds its own
+overhead, so only the ratio is meaningful) to tell whether the generated
+types or graphene's default resolvers dominate list-heavy responses.
+"""
+import argparse
+import datetime
+import decimal
+import enum
+import json
+import platform
+import statistics
+import sys
+import time
+import typing
+import uuid
+
+import graphene
+import pydantic
+
+import pydantic2graphene
+
+
+class Status(enum.Enum):
+    ACTIVE = "ACTIVE"
+    INACTIVE = "INACTIVE"
+
+
+class Owner(pydantic.BaseModel):
+    name: str
+    email: str
+
+
+class Tag(pydantic.BaseModel):
+    name: str
+
+
+class Item(pydantic.BaseModel):
+    id: uuid.UUID
+    name: str
+    quantity: int
+    price: decimal.Decimal
+    is_offer: bool
+    status: Status
+    created_at: datetime.datetime
+    owner: Owner
+    tags: typing.List[Tag] = []
+
+
+QUERIES = {
+    "flat": "{ items { name quantity isOffer } }",
+    "nested": "{ items { name owner { name email } tags { name } } }",
+    "enum": "{ items { name status } }",
+    "scalars": "{ items { id price createdAt } }",
+}
+
+
+def make_items(size: int) -> typing.List[Item]:
+    owners = [
+        Owner.construct(name=f"owner {i}", email=f"owner{i}@example.com")
+        for i in range(100)
+    ]
+    tags = [Tag.construct(name=f"tag {i}") for i in range(10)]
+    now = datetime.datetime(2020, 1, 1)
+    return [
+        Item.construct(
+            id=uuid.UUID(int=i),
+            name=f"item {i}",
+            quantity=i,
+            price=decimal.Decimal(i) / 100,
+            is_offer=bool(i % 2),
+            status=Status.ACTIVE if i % 3 else Status.INACTIVE,
+            created_at=now + datetime.timedelta(seconds=i),
+            owner=owners[i % len(owners)],
+            tags=tags[: i % 4],
+        )
+        for i in range(size)
+    ]
+
+
+def make_schema(items: typing.List[Item], options: dict = None):
+    ItemGql = pydantic2graphene.to_graphene(
+        Item, options=options, cache=pydantic2graphene.ConversionCache()
+    )
+
+    class Query(graphene.ObjectType):
+        items = graphene.List(ItemGql)
+
+        @staticmethod
+        def resolve_items(*args, **kwargs):
+            return items
+
+    return graphene.Schema(query=Query)
+
+
+class ResolverTimer:
+    def __init__(self):
+        self.elapsed = 0.0
+        self.calls = 0
+
+    def resolve(self, next_, root, info, **kwargs):
+        start = time.perf_counter()
+        try:
+            return next_(root, info, **kwargs)
+        finally:
+            self.elapsed += time.perf_counter() - start
+            self.calls += 1
+
+
+def _percentile(values: typing.List[float], percent: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def execute(schema, query: str, middleware=None):
+    kwargs = {"middleware": middleware} if middleware else {}
+    result = schema.execute(query, **kwargs)
+    if result.errors:
+        raise RuntimeError(result.errors)
+    return result
+
+
+def measure(schema, query: str, repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        execute(schema, query)
+        timings.append(time.perf_counter() - start)
+
+    timer = ResolverTimer()
+    start = time.perf_counter()
+    execute(schema, query, [timer])
+    profiled_total = time.perf_counter() - start
+
+    return {
+        "p50": _percentile(timings, 50),
+        "p90": _percentile(timings, 90),
+        "p99": _percentile(timings, 99),
+        "mean": statistics.mean(timings),
+        "resolver_calls": timer.calls,
+        "resolver_time_ratio": timer.elapsed / profiled_total,
+    }
+
+
+VARIANTS = {"default": None, "fast": {"fast_resolvers": True}}
+
+
+def run(sizes: typing.List[int], repeat: int, variants: typing.List[str]):
+    results = []
+    for size in sizes:
+        items = make_items(size)
+        for variant in variants:
+            schema = make_schema(items, VARIANTS[variant])
+            for name, query in QUERIES.items():
+                result = measure(schema, query, repeat)
+                result.update(
+                    {"query": name, "size": size, "variant": variant}
+                )
+                results.append(result)
+                print(
+                    f"{name:<8} {variant:<8} {size:>8} rows "
+                    f"p50 {result['p50'] * 1000:10.1f} ms "
+                    f"p99 {result['p99'] * 1000:10.1f} ms "
+                    f"resolvers {result['resolver_time_ratio']:6.1%}",
+                    file=sys.stderr,
+                )
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "graphene": graphene.__version__,
+            "pydantic": str(pydantic.VERSION),
+            "pydantic2graphene": pydantic2graphene.__version__,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-o", "--output", help="write the results as JSON")
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000])
+    parser.add_argument(
+        "--variants",
+        nargs="+",
+        choices=sorted(VARIANTS),
+        default=sorted(VARIANTS),
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.repeat, args.variants)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -122,7 +122,7 @@ class Query(graphene.ObjectType):
 
     @staticmethod
     def resolve_filter_items(parent, info, filters):
-        return filter_items(ItemFilter(**filters))
+        return filter_items(ItemFilterInputGql.to_pydantic(filters))
 
 
 class CreateItem(graphene.Mutation):
@@ -133,7 +133,7 @@ class CreateItem(graphene.Mutation):
 
     @staticmethod
     def mutate(parent, info, item):
-        return create_item(Item(**item))
+        return create_item(ItemInputGql.to_pydantic(item))
 
 
 class Mutations(graphene.ObjectType):
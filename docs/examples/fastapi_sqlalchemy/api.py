@@ -13,6 +13,7 @@ import sqlalchemy.ext.declarative
 import starlette.graphql
 
 import pydantic2graphene
+from pydantic2graphene import sqlalchemy_helpers
 
 ###############################
 #      SQLAlchemy Conf        #
@@ -153,12 +154,15 @@ class ItemService:
     def __init__(self, session: sqlalchemy.orm.Session):
         self._session = session
 
-    def filter_items(self, filters: ItemFilter) -> typing.List[ItemDB]:
+    def query_items(self, filters: ItemFilter) -> sqlalchemy.orm.Query:
         query = self._session.query(ModelItem)
         for FilterClass in ApplyFilter.__subclasses__():
             query = FilterClass(ModelItem, query, filters).filter()
 
-        return list(map(ItemDB.from_orm, query.all()))
+        return query
+
+    def filter_items(self, filters: ItemFilter) -> typing.List[ItemDB]:
+        return list(map(ItemDB.from_orm, self.query_items(filters).all()))
 
     def create_item(self, item: Item, persist: bool = True) -> ItemDB:
         item = ModelItem(id=ModelItem.generate_id(), **item.dict())
@@ -210,7 +214,15 @@ class Query(graphene.ObjectType):
     @staticmethod
     def resolve_filter_items(parent, info, filters):
         with db_session() as session:
-            return ItemService(session).filter_items(ItemFilter(**filters))
+            query = ItemService(session).query_items(
+                ItemFilterInputGql.to_pydantic(filters)
+            )
+            # only the columns of the requested fields are fetched, the rows
+            # are resolved as they are instead of through ItemDB.from_orm
+            query = sqlalchemy_helpers.load_only(
+                query, info, ItemDB, ModelItem
+            )
+            return query.all()
 
 
 class CreateItem(graphene.Mutation):
@@ -222,7 +234,9 @@ class CreateItem(graphene.Mutation):
     @staticmethod
     def mutate(parent, info, item):
         with db_session() as session:
-            return ItemService(session).create_item(Item(**item))
+            return ItemService(session).create_item(
+                ItemInputGql.to_pydantic(item)
+            )
 
 
 class Mutations(graphene.ObjectType):
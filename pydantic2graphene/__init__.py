@@ -1,7 +1,11 @@
+from .cache import ConversionCache
 from .converter_helpers import (
     ConverterToGrapheneBase,
     ToGrapheneOptions,
+    get_default_cache,
     to_graphene,
+    to_graphene_connection,
+    to_graphene_many,
 )
 from .errors import (
     FieldNotSupported,
@@ -10,6 +14,24 @@ from .errors import (
     InvalidType,
     Pydantic2GrapheneException,
 )
+from .instrumentation import (
+    ConversionHooks,
+    add_hooks,
+    remove_hooks,
+    reset_stats,
+    stats,
+)
+from .filtering import FilterInputObjectType, to_graphene_filter
+from .executor import (
+    BlockingExecutor,
+    get_blocking_executor,
+    set_blocking_executor,
+)
+from .fields import TypeRegistry, default_type_registry, register_type
+from .pagination import paginate
+from .projection import get_include
+from .registry import ModelRegistry
+from .snapshot import SnapshotStore
 from .version import VERSION
 
 __version__ = VERSION
@@ -18,8 +40,29 @@ __version__ = VERSION
 __all__ = (
     "__version__",
     "to_graphene",
+    "to_graphene_many",
+    "to_graphene_connection",
+    "paginate",
+    "ModelRegistry",
+    "TypeRegistry",
+    "default_type_registry",
+    "register_type",
     "ConverterToGrapheneBase",
     "ToGrapheneOptions",
+    "ConversionCache",
+    "SnapshotStore",
+    "get_include",
+    "to_graphene_filter",
+    "FilterInputObjectType",
+    "BlockingExecutor",
+    "get_blocking_executor",
+    "set_blocking_executor",
+    "ConversionHooks",
+    "add_hooks",
+    "remove_hooks",
+    "stats",
+    "reset_stats",
+    "get_default_cache",
     "Pydantic2GrapheneException",
     "FieldNotSupported",
     "InvalidType",
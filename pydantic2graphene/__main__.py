@@ -0,0 +1,5 @@
+import sys
+
+from .codegen import main
+
+sys.exit(main())
@@ -0,0 +1,262 @@
+import collections
+import gc
+import threading
+import typing
+import weakref
+
+_MISSING = object()
+
+CacheStats = collections.namedtuple(
+    "CacheStats", ["hits", "misses", "evictions", "size", "maxsize"]
+)
+
+CacheKey = collections.namedtuple(
+    "CacheKey", ["model", "graphene_type", "fingerprint", "namespace"]
+)
+CacheKey.__new__.__defaults__ = ((), None)
+
+
+class ConversionCache:
+    """
+    LRU cache for the graphene classes created by the converter.
+
+    Keys are ``CacheKey(pydantic_model, graphene_type, fingerprint,
+    namespace)`` tuples. By default the cache is unbounded, evicting a
+    class still used by a schema makes the next conversion build a second
+    class with the same name; ``maxsize`` bounds it. Any ``dict``
+    may be used as ``storage``; the recency order is kept by re-inserting
+    hit keys.
+
+    The cache is thread safe and ``get_or_create`` is single-flight:
+    concurrent calls for the same key wait for the first one to finish.
+
+    With ``weak=True`` the models are held by weak references and their
+    entries are dropped once the model is garbage collected.
+    """
+
+    def __init__(
+        self,
+        maxsize: typing.Optional[int] = None,
+        storage: typing.MutableMapping = None,
+        weak: bool = False,
+    ):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize must be a positive integer or None")
+
+        self.maxsize = maxsize
+        self.weak = weak
+        self._data = storage if storage is not None else {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.RLock()
+        self._in_flight = {}
+        # model (or weak reference to it) -> keys stored for the model
+        self._keys_by_model = {}
+        self._model_refs = weakref.WeakKeyDictionary()
+        # weak reference callbacks only queue the removal, it is applied
+        # while holding the lock to not mutate the storage mid operation
+        self._pending_removals = []
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._apply_pending_removals()
+            return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            self._apply_pending_removals()
+            return self._lookup_key(key) in self._data
+
+    def __getitem__(self, key):
+        with self._lock:
+            self._apply_pending_removals()
+            return self._data[self._lookup_key(key)]
+
+    def __setitem__(self, key, value):
+        self.set(key, value)
+
+    def reference(self, obj) -> typing.Callable:
+        """
+        Zero argument callable returning ``obj``, weak on weak caches so
+        cached values can refer to models without keeping them alive.
+        """
+        if self.weak:
+            return weakref.ref(obj)
+
+        return lambda: obj
+
+    def _lookup_key(self, key):
+        if not self.weak or not isinstance(key, CacheKey):
+            return key
+
+        return key._replace(model=weakref.ref(key.model))
+
+    def _storage_key(self, key):
+        if not self.weak or not isinstance(key, CacheKey):
+            return key
+
+        model_ref = self._model_refs.get(key.model)
+        if model_ref is None:
+            model_ref = weakref.ref(key.model, self._pending_removals.append)
+            self._model_refs[key.model] = model_ref
+
+        return key._replace(model=model_ref)
+
+    def get(self, key, default=None):
+        with self._lock:
+            self._apply_pending_removals()
+            key = self._lookup_key(key)
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._data[key] = value  # mark as most recently used
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._apply_pending_removals()
+            key = self._storage_key(key)
+            self._data.pop(key, None)
+            self._data[key] = value
+            if isinstance(key, CacheKey):
+                self._keys_by_model.setdefault(key.model, set()).add(key)
+            self._evict()
+
+    def get_or_create(self, key, factory: typing.Callable):
+        while True:
+            with self._lock:
+                value = self.get(key, _MISSING)
+                if value is not _MISSING:
+                    return value
+
+                lookup_key = self._lookup_key(key)
+                in_flight = self._in_flight.get(lookup_key)
+                if in_flight is None:
+                    in_flight = self._in_flight[lookup_key] = _InFlight()
+                    break
+
+            # the same thread asking again for a key it is creating would
+            # deadlock, so it creates the value by itself
+            if in_flight.owner == threading.get_ident():
+                return factory()
+
+            in_flight.done.wait()
+
+        try:
+            value = factory()
+            self.set(key, value)
+        finally:
+            with self._lock:
+                del self._in_flight[lookup_key]
+            in_flight.done.set()
+
+        return value
+
+    def _remove(self, key):
+        self._data.pop(key, None)
+        if not isinstance(key, CacheKey):
+            return
+
+        model_keys = self._keys_by_model.get(key.model)
+        if model_keys is None:
+            return
+
+        model_keys.discard(key)
+        if not model_keys:
+            del self._keys_by_model[key.model]
+
+    def _evict(self):
+        if self.maxsize is None:
+            return
+
+        while len(self._data) > self.maxsize:
+            self._remove(next(iter(self._data)))
+            self.evictions += 1
+
+    def _apply_pending_removals(self):
+        while self._pending_removals:
+            while self._pending_removals:
+                model_ref = self._pending_removals.pop()
+                for key in self._keys_by_model.pop(model_ref, ()):
+                    self._data.pop(key, None)
+
+            # the removed entries may have been the last references to
+            # other models, e.g. nested models and enums, classes are only
+            # freed by the garbage collector
+            gc.collect()
+
+    def invalidate_key(self, key):
+        """Remove the entry of ``key``."""
+        with self._lock:
+            self._apply_pending_removals()
+            self._remove(self._lookup_key(key))
+
+    def invalidate(self, model):
+        """Remove every entry created for ``model``."""
+        with self._lock:
+            self._apply_pending_removals()
+            model_key = self._model_refs.get(model) if self.weak else model
+            for key in list(self._keys_by_model.get(model_key, ())):
+                self._remove(key)
+
+    def clear(self, namespace: str = None):
+        """Remove all entries, or only the ones of ``namespace``."""
+        with self._lock:
+            self._apply_pending_removals()
+            if namespace is None:
+                self._data.clear()
+                self._keys_by_model.clear()
+                return
+
+            for key in list(self._data):
+                if isinstance(key, CacheKey) and key.namespace == namespace:
+                    self._remove(key)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            self._apply_pending_removals()
+            return CacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                size=len(self._data),
+                maxsize=self.maxsize,
+            )
+
+
+class _InFlight:
+    def __init__(self):
+        self.owner = threading.get_ident()
+        self.done = threading.Event()
+
+
+def freeze(value):
+    """
+    Turn ``value`` into a hashable structure that compares equal for equal
+    inputs, e.g. graphene fields (which are not hashable) are described by
+    their class and attributes.
+    """
+    if isinstance(value, typing.Mapping):
+        return tuple(sorted((repr(k), freeze(v)) for k, v in value.items()))
+
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted((freeze(v) for v in value), key=repr))
+
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        pass
+
+    if hasattr(value, "__dict__"):
+        return (value.__class__, freeze(vars(value)))
+
+    return (value.__class__, repr(value))
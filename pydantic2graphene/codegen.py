@@ -0,0 +1,360 @@
+import argparse
+import ast
+import enum
+import importlib
+import inspect
+import pathlib
+import sys
+import typing
+
+import graphene
+import pydantic
+
+from . import converter, converter_helpers, errors, inputs, plan, types
+from .version import VERSION
+
+_GRAPHENE_TYPES = {
+    "object": graphene.ObjectType,
+    "input": graphene.InputObjectType,
+    "interface": graphene.Interface,
+}
+
+# options changing the converted classes at runtime, e.g. with resolvers,
+# they are not written to generated modules
+_UNSUPPORTED_OPTIONS = (
+    "extra_fields",
+    "interfaces",
+    "inherit_interfaces",
+    "connection_fields",
+    "fast_resolvers",
+    "loaders",
+    "resolvers",
+    "blocking_resolvers",
+)
+
+_HEADER = '''"""
+Generated by pydantic2graphene {version} (graphene {graphene_version})
+from {source}, do not edit.
+"""
+# flake8: noqa'''
+
+
+class _ModuleWriter:
+    def __init__(self, options: typing.Mapping = None):
+        self.options = options or {}
+        self.cache = converter.ConversionCache(maxsize=None)
+        self.imports = {"graphene"}
+        self.enums = {}
+        self.classes = {}
+        self.pending = []
+
+    def _import(self, obj) -> str:
+        if getattr(graphene, obj.__name__, None) is obj:
+            return f"graphene.{obj.__name__}"
+
+        self.imports.add(obj.__module__)
+        return f"{obj.__module__}.{obj.__qualname__}"
+
+    def _get_converter(self, pydantic_model, graphene_type):
+        return converter.ToGraphene(
+            pydantic_model,
+            graphene_type,
+            options=self.options.get(pydantic_model),
+            cache=self.cache,
+        )
+
+    def _class_name(self, pydantic_model, graphene_type) -> str:
+        key = (pydantic_model, graphene_type)
+        if key not in self.classes:
+            to_graphene = self._get_converter(pydantic_model, graphene_type)
+            self.classes[key] = (
+                to_graphene.options.class_name
+                or to_graphene._generate_class_name()
+            )
+            self.pending.append(key)
+
+        return self.classes[key]
+
+    def _enum_name(self, graphene_enum) -> str:
+        python_enum = graphene_enum._meta.enum
+        if python_enum not in self.enums:
+            self.enums[python_enum] = f"{python_enum.__name__}Gql"
+
+        return self.enums[python_enum]
+
+    def _default_value(self, field_plan: plan.FieldPlan, graphene_type) -> str:
+        default = field_plan.default
+        if isinstance(default, enum.Enum):
+            return f"{self._import(type(default))}.{default.name}"
+
+        if converter._IS_GRAPHENE_V3_OR_LATER and isinstance(
+            default, (list, set)
+        ):
+            if issubclass(graphene_type, graphene.InputObjectType):
+                return None
+            self.imports.add("dataclasses")
+            factory = type(default).__name__
+            return f"dataclasses.field(default_factory={factory})"
+
+        try:
+            if ast.literal_eval(repr(default)) == default:
+                return repr(default)
+        except (ValueError, SyntaxError):
+            pass
+
+        code = self._constructor_call(default)
+        if code is None:
+            raise errors.FieldNotSupported(
+                f"{field_plan.name}, the default {default!r} can not be"
+                " generated"
+            )
+
+        return code
+
+    def _constructor_call(self, value) -> typing.Optional[str]:
+        """
+        ``repr`` of values like ``Decimal('1.5')`` with the class imported,
+        when evaluating it gives the value back.
+        """
+        value_type = type(value)
+        code = repr(value)
+        for prefix in (
+            f"{value_type.__module__}.{value_type.__qualname__}(",
+            f"{value_type.__qualname__}(",
+        ):
+            if code.startswith(prefix):
+                break
+        else:
+            return None
+
+        module = importlib.import_module(value_type.__module__)
+        call = code.replace(prefix, "(", 1)
+        try:
+            if eval(f"value_type{call}", {"value_type": value_type}) != value:
+                return None
+        except Exception:
+            return None
+
+        if getattr(module, value_type.__qualname__, None) is not value_type:
+            return None
+
+        return self._import(value_type) + call
+
+    def _field(self, field_plan: plan.FieldPlan, graphene_type) -> str:
+        if field_plan.error:
+            raise field_plan.error.with_traceback(None)
+
+        if field_plan.kind == plan.UNION:
+            raise errors.FieldNotSupported(
+                f"{field_plan.name}, unions can not be generated"
+            )
+
+        if field_plan.kind == plan.MODEL:
+            nested_type = graphene.ObjectType
+            if graphene_type == graphene.InputObjectType:
+                nested_type = graphene_type
+            name = self._class_name(field_plan.model, nested_type)
+            field_type = f"lambda: {name}"
+        elif field_plan.kind == plan.ENUM:
+            field_type = self._enum_name(field_plan.graphene_type)
+        else:
+            field_type = self._import(field_plan.graphene_type)
+
+        args = f"required={field_plan.required}"
+        default = self._default_value(field_plan, graphene_type)
+        if default is not None:
+            args += f", default_value={default}"
+
+        if not field_plan.is_list:
+            return f"graphene.Field({field_type}, {args})"
+
+        if field_plan.required:
+            field_type = f"graphene.NonNull({field_type})"
+        return f"graphene.List({field_type}, {args})"
+
+    def _model_reference(self, pydantic_model) -> str:
+        if "<locals>" in pydantic_model.__qualname__:
+            raise errors.InvalidConfigClass(
+                f"{pydantic_model} is not importable, its classes can not be"
+                " generated"
+            )
+
+        return f"lambda: {self._import(pydantic_model)}"
+
+    def _input_field(
+        self, field_plan: plan.FieldPlan, pydantic_model, graphene_type
+    ) -> str:
+        nested = None
+        if field_plan.kind == plan.MODEL:
+            name = self._class_name(field_plan.model, graphene_type)
+            nested = f"lambda: {name}"
+        coerce = inputs.needs_coercion(
+            field_plan, pydantic_model.__fields__[field_plan.name]
+        )
+        return (
+            f"pydantic2graphene.inputs.InputField({field_plan.name!r},"
+            f" {field_plan.alias!r}, {field_plan.is_list}, {nested},"
+            f" {coerce})"
+        )
+
+    def _class(self, pydantic_model, graphene_type) -> str:
+        to_graphene = self._get_converter(pydantic_model, graphene_type)
+        options = to_graphene.options
+        for name in _UNSUPPORTED_OPTIONS:
+            if getattr(options, name):
+                raise errors.InvalidConfigClass(
+                    f"{pydantic_model} has {name}, it can not be generated"
+                )
+
+        is_input_type = issubclass(graphene_type, graphene.InputObjectType)
+        lines = [
+            f"class {self.classes[(pydantic_model, graphene_type)]}"
+            f"({self._import(graphene_type)}):"
+        ]
+        input_fields = []
+        for field_plan in to_graphene.get_model_plan().fields:
+            if field_plan.name in options.exclude_fields:
+                continue
+
+            field = self._field(field_plan, graphene_type)
+            lines.append(f"    {field_plan.name} = {field}")
+            if is_input_type:
+                input_fields.append(
+                    self._input_field(
+                        field_plan, pydantic_model, graphene_type
+                    )
+                )
+
+        if options.id_field_name:
+            lines.append(
+                f"    {options.id_field_name} = graphene.ID(required=True)"
+            )
+
+        # the attributes to_graphene sets to resolve interfaces and build
+        # models from inputs
+        model_reference = self._model_reference(pydantic_model)
+        self.imports.add("pydantic2graphene")
+        lines.append(
+            f"    _get_pydantic_model = staticmethod({model_reference})"
+        )
+        if is_input_type:
+            lines.append(
+                "    to_pydantic = pydantic2graphene.inputs.make_to_pydantic("
+            )
+            lines.append(f"        {model_reference},")
+            lines.append("        [")
+            lines.extend(f"            {field}," for field in input_fields)
+            lines.append("        ],")
+            lines.append("    )")
+        elif issubclass(graphene_type, graphene.Interface):
+            lines.append(
+                "    resolve_type = pydantic2graphene.resolvers"
+                ".make_resolve_type("
+            )
+            lines.append("        graphene.Interface.resolve_type.__func__")
+            lines.append("    )")
+
+        return "\n".join(lines)
+
+    def write(
+        self,
+        models: typing.Iterable[pydantic.BaseModel],
+        graphene_types: typing.Iterable[types.GrapheneObjectType],
+        source: str,
+    ) -> str:
+        for graphene_type in graphene_types:
+            for pydantic_model in models:
+                self._class_name(pydantic_model, graphene_type)
+
+        classes = []
+        while self.pending:
+            classes.append(self._class(*self.pending.pop(0)))
+
+        enums = [
+            f"{name} = graphene.Enum.from_enum({self._import(python_enum)})"
+            for python_enum, name in self.enums.items()
+        ]
+
+        header = _HEADER.format(
+            version=VERSION,
+            graphene_version=graphene.__version__,
+            source=source,
+        )
+        imports = "\n".join(f"import {name}" for name in sorted(self.imports))
+        sections = [header, imports] + (["\n".join(enums)] if enums else [])
+        return "\n\n".join(sections) + "\n\n\n" + "\n\n\n".join(classes) + "\n"
+
+
+def generate_module(
+    models: typing.Union[typing.Iterable[pydantic.BaseModel], object],
+    graphene_types: typing.Iterable[types.GrapheneObjectType] = (
+        graphene.ObjectType,
+    ),
+    options: typing.Mapping[
+        pydantic.BaseModel,
+        typing.Union[converter.ToGrapheneOptions, dict],
+    ] = None,
+) -> str:
+    """
+    Source code of a module with static graphene classes for ``models``
+    (an iterable of models or a module), built from the same field plans
+    used by ``to_graphene``.
+    """
+    source = "models"
+    if inspect.ismodule(models):
+        source = models.__name__
+
+    ordered = converter_helpers._sort_by_dependencies(
+        converter_helpers._collect_models(models)
+    )
+    return _ModuleWriter(options).write(ordered, graphene_types, source)
+
+
+def main(argv: typing.List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m pydantic2graphene")
+    commands = parser.add_subparsers(dest="command")
+    codegen = commands.add_parser(
+        "codegen", help="generate a module with static graphene classes"
+    )
+    codegen.add_argument("module", help="module with the pydantic models")
+    codegen.add_argument("-o", "--output", help="file to write, or stdout")
+    codegen.add_argument(
+        "-t",
+        "--graphene-type",
+        action="append",
+        choices=sorted(_GRAPHENE_TYPES),
+        help="graphene types to generate (default: object)",
+    )
+    codegen.add_argument(
+        "--check",
+        action="store_true",
+        help="fail if the output file is not up to date",
+    )
+    args = parser.parse_args(argv)
+    if args.command != "codegen":
+        parser.print_help()
+        return 2
+
+    sys.path.insert(0, "")
+    module = importlib.import_module(args.module)
+    graphene_types = [
+        _GRAPHENE_TYPES[name] for name in args.graphene_type or ["object"]
+    ]
+    source = generate_module(module, graphene_types)
+
+    if args.check:
+        if not args.output:
+            parser.error("--check requires --output")
+
+        output = pathlib.Path(args.output)
+        if not output.exists() or output.read_text() != source:
+            print(f"{args.output} is out of date", file=sys.stderr)
+            return 1
+        return 0
+
+    if not args.output:
+        sys.stdout.write(source)
+        return 0
+
+    pathlib.Path(args.output).write_text(source)
+    return 0
@@ -1,6 +1,8 @@
 import inspect
-import logging
+import pathlib
+import time
 import typing
+import weakref
 
 import graphene
 import pydantic
@@ -11,10 +13,26 @@ try:
 except ModuleNotFoundError:
     dataclasses = None
 
-from . import errors, fields, types
-
-_module_cache = {}
+from . import (
+    errors,
+    executor,
+    fields,
+    inputs,
+    instrumentation,
+    loaders,
+    pagination,
+    plan,
+    resolvers,
+    types,
+    unions,
+)
+from .registry import ModelRegistry
+from .snapshot import SnapshotStore
+from .cache import CacheKey, ConversionCache, freeze
+
+_module_cache = ConversionCache()
 _IS_GRAPHENE_V3_OR_LATER = int(graphene.__version__[:1]) >= 3
+_NO_DEFAULT = object()
 
 
 def _get_pydantic_class_name(pydantic_model: pydantic.BaseModel) -> str:
@@ -35,6 +53,39 @@ def _get_pydantic_fields(
     return pydantic_model.__fields__.values()
 
 
+def _get_field_type(pydantic_field: pydantic.fields.ModelField):
+    type_ = pydantic_field.type_
+    if fields.is_list_shape(pydantic_field.shape):
+        type_args = getattr(type_, "__args__", None)
+        if type_args:
+            return type_args[0]
+
+    return type_
+
+
+def get_nested_models(
+    pydantic_model: pydantic.BaseModel,
+) -> typing.List[pydantic.BaseModel]:
+    nested = []
+    for field in _get_pydantic_fields(pydantic_model):
+        type_ = _get_field_type(field)
+        if fields.is_pydantic_base_model(type_) and type_ not in nested:
+            nested.append(type_)
+
+    return nested
+
+
+_CACHE_OPTIONS = {"use_cache", "cache_namespace", "snapshot"}
+
+# options that nested models take from the model using them
+_INHERITED_OPTIONS = (
+    "type_registry",
+    "cache_namespace",
+    "snapshot",
+    "fast_resolvers",
+)
+
+
 class ToGrapheneOptions(pydantic.BaseModel):
     id_field_name: str = None
 
@@ -46,6 +97,63 @@ class ToGrapheneOptions(pydantic.BaseModel):
 
     use_cache: bool = True
 
+    cache_namespace: str = None
+
+    type_registry: fields.TypeRegistry = None
+
+    snapshot: SnapshotStore = None
+
+    fast_resolvers: bool = False
+
+    connection_fields: typing.Set[str] = set()
+
+    # field name -> batch load function, called with the id_field_name
+    # values of the parents
+    loaders: typing.Mapping[str, typing.Callable] = {}
+
+    # field name -> resolver, coroutine functions are awaited on graphene 3
+    resolvers: typing.Mapping[str, typing.Callable] = {}
+
+    # fields whose resolvers block, run in a thread pool on graphene 3
+    blocking_resolvers: typing.Set[str] = set()
+
+    blocking_executor: executor.BlockingExecutor = None
+
+    # interfaces implemented by the object type
+    interfaces: typing.Sequence[typing.Any] = ()
+
+    # pydantic base classes with fields become interfaces of the object type
+    inherit_interfaces: bool = False
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    @pydantic.validator("snapshot", pre=True)
+    def validate_snapshot(cls, value):
+        if isinstance(value, (str, pathlib.PurePath)):
+            return SnapshotStore(value)
+
+        return value
+
+    @pydantic.validator("resolvers")
+    def validate_resolvers(cls, value):
+        for k, v in value.items():
+            if not _IS_GRAPHENE_V3_OR_LATER and inspect.iscoroutinefunction(v):
+                raise errors.InvalidConfigClass(
+                    f'Invalid resolver "{k}", async resolvers need graphene 3'
+                )
+
+        return value
+
+    @pydantic.validator("blocking_resolvers")
+    def validate_blocking_resolvers(cls, value):
+        if value and not _IS_GRAPHENE_V3_OR_LATER:
+            raise errors.InvalidConfigClass(
+                '"blocking_resolvers" need graphene 3 async execution'
+            )
+
+        return value
+
     @pydantic.validator("extra_fields")
     def validate_extra_fields(cls, value):
         if not value:
@@ -59,9 +167,16 @@ class ToGrapheneOptions(pydantic.BaseModel):
 
         return value
 
+    def fingerprint(self) -> tuple:
+        # cache options change how the cache is used, not what gets built
+        return freeze(
+            {k: v for k, v in self.__dict__.items() if k not in _CACHE_OPTIONS}
+        )
+
 
 class ToGraphene:
-    _cache: dict
+    _cache: ConversionCache
+    registry: ModelRegistry
     options: ToGrapheneOptions
     pydantic_model: pydantic.BaseModel
     graphene_type: types.GrapheneObjectType
@@ -71,7 +186,9 @@ class ToGraphene:
         pydantic_model: pydantic.BaseModel,
         graphene_type: types.GrapheneObjectType = graphene.ObjectType,
         options: typing.Union[ToGrapheneOptions, dict] = None,
-        cache: dict = None,
+        cache: typing.Union[ConversionCache, dict] = None,
+        registry: ModelRegistry = None,
+        hooks: typing.Iterable[instrumentation.ConversionHooks] = (),
     ):
         options = options or {}
         if not isinstance(options, ToGrapheneOptions):
@@ -80,21 +197,59 @@ class ToGraphene:
         self.options = options
         self.pydantic_model = pydantic_model
         self.graphene_type = graphene_type
-        self._cache = cache or _module_cache
+        if cache is None:
+            cache = _module_cache
+        elif not isinstance(cache, ConversionCache):
+            cache = ConversionCache(maxsize=None, storage=cache)
+        self._cache = cache
+        if registry is None:
+            # also used by nested models to find the classes converted by
+            # this conversion, e.g. on self referencing models
+            registry = ModelRegistry(graphene_type, weak=cache.weak)
+        self.registry = registry
+        self.type_registry = (
+            options.type_registry or fields.default_type_registry
+        )
+        self.hooks = tuple(hooks)
+
+    def _notify(self, event: str, *args):
+        for hooks in instrumentation.get_hooks() + self.hooks:
+            getattr(hooks, event)(*args)
 
-    def _get_from_cache(
+    def _get_cache_key(
         self,
         pydantic_model: pydantic.BaseModel,
         graphene_type: types.GrapheneObjectType = graphene.ObjectType,
-    ) -> types.GrapheneObjectType:
-        cache_key = (pydantic_model, graphene_type)
+        fingerprint: tuple = (),
+    ) -> CacheKey:
         if not inspect.isclass(pydantic_model):  # when instance get the class
-            cache_key = (pydantic_model.__class__, graphene_type)
+            pydantic_model = pydantic_model.__class__
+
+        return CacheKey(
+            pydantic_model,
+            graphene_type,
+            fingerprint,
+            self.options.cache_namespace,
+        )
+
+    def _get_or_create(self, cache_key: CacheKey, factory: typing.Callable):
+        if not self.options.use_cache:
+            value = factory()
+            self._cache[cache_key] = value
+            return value
 
-        if self.options.use_cache and cache_key in self._cache:
-            return (cache_key, self._cache[cache_key])
+        created = False
 
-        return (cache_key, None)
+        def create():
+            nonlocal created
+            created = True
+            self._notify("on_cache_miss", cache_key)
+            return factory()
+
+        value = self._cache.get_or_create(cache_key, create)
+        if not created:
+            self._notify("on_cache_hit", cache_key)
+        return value
 
     def _generate_class_name(self):
         _name = _get_pydantic_class_name(self.pydantic_model)
@@ -107,105 +262,392 @@ class ToGraphene:
 
         return f"{_name}Gql"
 
-    def _convert_to_graphene_field(
-        self, pydantic_field: pydantic.fields.ModelField
-    ):
-        shape = pydantic_field.shape
-        if fields.is_not_supported_shape(shape):
-            raise errors.FieldNotSupported(pydantic_field.name)
-
-        type_ = pydantic_field.type_
-        type_args = getattr(type_, "__args__", [])
-
-        if fields.is_list_shape(shape) and len(type_args):
-            type_ = type_args[0]
-            if len(type_args) > 1:
-                logging.warn(
-                    "%s, has multiple only the first type was used",
-                    pydantic_field.name,
-                )
+    def _convert_enum(self, enum_type) -> graphene.Enum:
+        cache_key = self._get_cache_key(enum_type, graphene.Enum)
+        if not self._cache.weak:
+            return self._get_or_create(
+                cache_key, lambda: graphene.Enum.from_enum(enum_type)
+            )
+
+        # the graphene enum refers to enum_type, a weak cache holds it
+        # weakly to not keep enum_type alive; the classes using it do
+        graphene_enum = None
+
+        def create():
+            nonlocal graphene_enum
+            graphene_enum = graphene.Enum.from_enum(enum_type)
+            return weakref.ref(graphene_enum)
+
+        graphene_enum = self._get_or_create(cache_key, create)()
+        if graphene_enum is None:  # no class used it anymore
+            self._cache.invalidate_key(cache_key)
+            graphene_enum = self._get_or_create(cache_key, create)()
 
-        if fields.is_enum_type(type_):
-            cache_key, cached_obj = self._get_from_cache(type_, graphene.Enum)
-            if cached_obj:
-                return cached_obj
+        return graphene_enum
 
-            graphene_enum = graphene.Enum.from_enum(type_)
-            self._cache[cache_key] = graphene_enum
-            return graphene_enum
+    def _get_type_registry_fingerprint(self) -> tuple:
+        # registering a type changes the version, so the cached plans and
+        # classes built before that are not used anymore
+        return (self.type_registry, self.type_registry.version)
 
-        if fields.is_pydantic_base_model(type_):
-            if self.graphene_type == graphene.InputObjectType:
-                obj_type = self.graphene_type
-            else:
-                obj_type = graphene.ObjectType
+    def get_model_plan(self) -> plan.ModelPlan:
+        cache_key = self._get_cache_key(
+            self.pydantic_model,
+            plan.ModelPlan,
+            self._get_type_registry_fingerprint(),
+        )
+        return self._get_or_create(cache_key, self._compile_model_plan)
 
-            return ToGraphene(type_, obj_type).convert()
+    def _compile_model_plan(self) -> plan.ModelPlan:
+        snapshot = self.options.snapshot
+        if snapshot is None:
+            return plan.compile_model_plan(
+                self.pydantic_model, self._convert_enum, self.type_registry
+            )
 
-        field = fields.get_grapehene_field_by_type(type_)
-        if field:
-            return field
+        fingerprint = snapshot.fingerprint(
+            self.pydantic_model, self.type_registry
+        )
+        model_plan = snapshot.load_plan(fingerprint, self._convert_enum)
+        if model_plan is None:
+            model_plan = plan.compile_model_plan(
+                self.pydantic_model, self._convert_enum, self.type_registry
+            )
+            snapshot.save_plan(fingerprint, model_plan)
+
+        return model_plan
+
+    def _nested_model_thunk(
+        self, pydantic_model: pydantic.BaseModel, graphene_type
+    ) -> typing.Callable:
+        return _nested_model_thunk(
+            self._cache.reference(pydantic_model),
+            graphene_type,
+            {name: getattr(self.options, name) for name in _INHERITED_OPTIONS},
+            self._cache,
+            self.registry,
+            self.hooks,
+        )
 
-        if fields.is_field_not_allowed_type(type_):
-            raise errors.InvalidListType(
-                "Lists must be type, e.g typing.List[int]"
+    def _convert_to_graphene_field(self, field_plan: plan.FieldPlan):
+        if field_plan.kind == plan.UNION:
+            if self._is_input_type():
+                raise errors.FieldNotSupported(
+                    f'"{field_plan.name}" is a union, input types can not'
+                    " have unions"
+                )
+
+            return _union_thunk(
+                [
+                    self._nested_model_thunk(model, graphene.ObjectType)
+                    for model in field_plan.model
+                ]
             )
 
-        outer_type_ = getattr(pydantic_field, "outer_type_", None)
-        if outer_type_:
-            field_outer = fields.get_grapehene_field_by_type(outer_type_)
-            if field_outer:
-                return field_outer
+        if field_plan.kind != plan.MODEL:
+            return field_plan.graphene_type
 
-    def _get_graphene_default_value(
-        self,
-        pydantic_field: pydantic.fields.ModelField,
-    ):
-        default_value = pydantic_field.default
+        if self.graphene_type == graphene.InputObjectType:
+            obj_type = self.graphene_type
+        else:
+            obj_type = graphene.ObjectType
+
+        return self._nested_model_thunk(field_plan.model, obj_type)
+
+    def _get_graphene_default_value(self, field_plan: plan.FieldPlan):
+        default_value = field_plan.default
 
         if not _IS_GRAPHENE_V3_OR_LATER:
             return default_value
 
         if isinstance(default_value, (list, set)):
+            # the dataclasses field is only understood by object types, inputs
+            # are left without default and get the model one in to_pydantic
+            if self._is_input_type():
+                return _NO_DEFAULT
             if not dataclasses:
                 return None
             return dataclasses.field(default_factory=type(default_value))
 
         return default_value
 
-    def _get_graphene_field(self, pydantic_field: pydantic.fields.ModelField):
-        args = {
-            "required": pydantic_field.required,
-            "default_value": self._get_graphene_default_value(pydantic_field),
-        }
-        field = self._convert_to_graphene_field(pydantic_field)
-        if not field:
-            raise errors.FieldNotSupported(pydantic_field.name)
+    def _get_connection_field(self, field_plan: plan.FieldPlan):
+        if (
+            field_plan.kind != plan.MODEL
+            or not field_plan.is_list
+            or self._is_input_type()
+        ):
+            raise errors.FieldNotSupported(
+                f'"{field_plan.name}" can not be a connection, only lists of'
+                " models on object types can"
+            )
+
+        return pagination.connection_field(
+            self._convert_to_graphene_field(field_plan),
+            required=field_plan.required,
+        )
+
+    def _get_graphene_field(self, field_plan: plan.FieldPlan):
+        if field_plan.error:
+            raise field_plan.error.with_traceback(None)
+
+        if field_plan.name in self.options.connection_fields:
+            return self._get_connection_field(field_plan)
 
-        if fields.is_list_shape(pydantic_field.shape):
-            if pydantic_field.required:
+        args = {"required": field_plan.required}
+        default_value = self._get_graphene_default_value(field_plan)
+        if default_value is not _NO_DEFAULT:
+            args["default_value"] = default_value
+        field = self._convert_to_graphene_field(field_plan)
+
+        if field_plan.is_list:
+            if field_plan.required:
                 return graphene.List(graphene.NonNull(field), **args)
             return graphene.List(field, **args)
 
         return graphene.Field(field, **args)
 
     def convert(self) -> types.GrapheneObjectType:
+        cache_key = self._get_cache_key(
+            self.pydantic_model,
+            self.graphene_type,
+            self.options.fingerprint() + self._get_type_registry_fingerprint(),
+        )
+        graphene_class = self._get_or_create(cache_key, self._create_class)
+        self.registry.register(
+            self.pydantic_model, self.graphene_type, graphene_class
+        )
+
+        return graphene_class
+
+    def _is_input_type(self) -> bool:
+        return issubclass(self.graphene_type, graphene.InputObjectType)
+
+    def _use_fast_resolvers(self) -> bool:
+        # input types are not resolved
+        return self.options.fast_resolvers and not self._is_input_type()
+
+    def _get_input_field(
+        self, field_plan: plan.FieldPlan
+    ) -> inputs.InputField:
+        nested = None
+        if field_plan.kind == plan.MODEL:
+            nested = self._convert_to_graphene_field(field_plan)
+
+        return inputs.InputField(
+            name=field_plan.name,
+            alias=field_plan.alias,
+            is_list=field_plan.is_list,
+            nested=nested,
+            coerce=inputs.needs_coercion(
+                field_plan, self.pydantic_model.__fields__[field_plan.name]
+            ),
+        )
+
+    def _validate_loaders(self):
+        if not self.options.loaders or self._is_input_type():
+            return
+
+        if not self.options.id_field_name:
+            raise errors.InvalidConfigClass(
+                '"loaders" are keyed by "id_field_name", it must be set'
+            )
+
+        model_fields = self.pydantic_model.__fields__
+        for name in self.options.loaders:
+            if name not in model_fields:
+                raise errors.InvalidConfigClass(
+                    f'Invalid loader "{name}", it is not a model field'
+                )
+
+    def _get_blocking_resolver(
+        self, name: str, graphene_attrs: dict
+    ) -> typing.Callable:
+        resolver = graphene_attrs.get(f"resolve_{name}")
+        if resolver is None:
+            pydantic_field = self.pydantic_model.__fields__.get(name)
+            alias = pydantic_field.alias if pydantic_field else None
+            resolver = resolvers.make_field_resolver(name, alias)
+        else:
+            resolver = resolver.__func__
+
+        if inspect.iscoroutinefunction(resolver):
+            raise errors.InvalidConfigClass(
+                f'Invalid blocking resolver "{name}", it is already async'
+            )
+
+        blocking_executor = self.options.blocking_executor
+        return resolvers.make_blocking_resolver(
+            resolver,
+            # the default executor is looked up on each call, so it can be
+            # replaced after the conversion
+            lambda: blocking_executor or executor.get_blocking_executor(),
+        )
+
+    def _get_base_converter(
+        self, pydantic_model: pydantic.BaseModel
+    ) -> "ToGraphene":
+        options = self.registry.get_options(pydantic_model) or {}
+        if isinstance(options, ToGrapheneOptions):
+            options = options.dict(exclude_unset=True)
+
+        inherited_options = {
+            name: getattr(self.options, name) for name in _INHERITED_OPTIONS
+        }
+        return ToGraphene(
+            pydantic_model,
+            graphene.Interface,
+            options={**inherited_options, **options},
+            cache=self._cache,
+            registry=self.registry,
+            hooks=self.hooks,
+        )
 
-        cache_key, cached_obj = self._get_from_cache(
-            self.pydantic_model, self.graphene_type
+    def _get_inherited_fields(
+        self,
+    ) -> typing.Tuple[tuple, typing.FrozenSet[str]]:
+        """
+        Interfaces of the pydantic bases and the fields the object type
+        gets from them, the fields the nearest base has unchanged.
+        """
+        if not self.options.inherit_interfaces or not issubclass(
+            self.graphene_type, graphene.ObjectType
+        ):
+            return (), frozenset()
+
+        bases = [
+            base
+            for base in reversed(self.pydantic_model.__mro__[1:])
+            if fields.is_pydantic_base_model(base) and base.__fields__
+        ]
+        if not bases:
+            return (), frozenset()
+
+        # the interfaces would expose the excluded fields again
+        for name in sorted(self.options.exclude_fields):
+            if any(name in base.__fields__ for base in bases):
+                raise errors.InvalidConfigClass(
+                    f'"{name}" can not be excluded with inherit_interfaces,'
+                    " it is a field of a base class"
+                )
+
+        base_converters = [self._get_base_converter(base) for base in bases]
+        interfaces = tuple(c.convert() for c in base_converters)
+        model_plans = {
+            field_plan.name: field_plan
+            for field_plan in self.get_model_plan().fields
+        }
+        for base_converter, interface in zip(base_converters, interfaces):
+            self._check_base_plans(base_converter, interface, model_plans)
+
+        interface_plans = base_converters[-1].get_model_plan().fields
+        inherited = frozenset(
+            field_plan.name
+            for field_plan in interface_plans
+            if model_plans.get(field_plan.name) == field_plan
+            and field_plan.name in interfaces[-1]._meta.fields
         )
-        if cached_obj:
-            return cached_obj
+        return interfaces, inherited
 
+    def _check_base_plans(
+        self,
+        base_converter: "ToGraphene",
+        interface: types.GrapheneObjectType,
+        model_plans: typing.Mapping[str, plan.FieldPlan],
+    ):
+        """
+        Raise when a field the model has unchanged from a base is converted
+        to another type by the interface of the base, e.g. when the base is
+        converted with another type_registry.
+        """
+        own_plans = {
+            field_plan.name: field_plan
+            for field_plan in ToGraphene(
+                base_converter.pydantic_model,
+                self.graphene_type,
+                self.options,
+                self._cache,
+                self.registry,
+            )
+            .get_model_plan()
+            .fields
+        }
+        for field_plan in base_converter.get_model_plan().fields:
+            name = field_plan.name
+            if (
+                name in interface._meta.fields
+                and model_plans.get(name) == own_plans.get(name)
+                and model_plans.get(name) != field_plan
+            ):
+                raise errors.InvalidConfigClass(
+                    f'"{name}" of {interface._meta.name} is converted with'
+                    f" other options than the same field of"
+                    f" {self.pydantic_model.__name__}, convert the base with"
+                    " the same type_registry"
+                )
+
+    def _get_type_resolution_attrs(self, interfaces: tuple = ()) -> dict:
+        model_reference = self._cache.reference(self.pydantic_model)
+        attrs = {"_get_pydantic_model": staticmethod(model_reference)}
+        if issubclass(self.graphene_type, graphene.ObjectType):
+            interfaces += tuple(self.options.interfaces)
+            if interfaces:
+                attrs["Meta"] = type("Meta", (), {"interfaces": interfaces})
+        elif issubclass(self.graphene_type, graphene.Interface):
+            attrs["resolve_type"] = resolvers.make_resolve_type(
+                graphene.Interface.resolve_type.__func__
+            )
+
+        return attrs
+
+    def _create_class(self) -> types.GrapheneObjectType:
+        start = time.perf_counter()
+        self._validate_loaders()
+        self._notify("on_model_start", self.pydantic_model, self.graphene_type)
+
+        interfaces, inherited_fields = self._get_inherited_fields()
         graphene_attrs = {}
-        for field in _get_pydantic_fields(self.pydantic_model):
-            if field.name in self.options.extra_fields:
+        input_fields = []
+        for field_plan in self.get_model_plan().fields:
+            if field_plan.name in self.options.extra_fields:
                 continue
 
-            if field.name in self.options.exclude_fields:
+            if field_plan.name in self.options.exclude_fields:
                 continue
 
-            graphene_attrs[field.name] = self._get_graphene_field(field)
+            # inherited fields are declared once, by the interface
+            if field_plan.name not in inherited_fields:
+                field_start = time.perf_counter()
+                graphene_attrs[field_plan.name] = self._get_graphene_field(
+                    field_plan
+                )
+                self._notify(
+                    "on_field_resolved",
+                    self.pydantic_model,
+                    self.graphene_type,
+                    field_plan,
+                    time.perf_counter() - field_start,
+                )
+            if self._use_fast_resolvers():
+                graphene_attrs[f"resolve_{field_plan.name}"] = staticmethod(
+                    resolvers.make_field_resolver(
+                        field_plan.name, field_plan.alias
+                    )
+                )
+            if self._is_input_type():
+                input_fields.append(self._get_input_field(field_plan))
+            elif field_plan.name in self.options.loaders:
+                graphene_attrs[f"resolve_{field_plan.name}"] = staticmethod(
+                    loaders.make_loader_resolver(
+                        self.options.loaders[field_plan.name],
+                        self.options.id_field_name,
+                    )
+                )
+
+        if self._is_input_type():
+            graphene_attrs["to_pydantic"] = inputs.make_to_pydantic(
+                self._cache.reference(self.pydantic_model), input_fields
+            )
 
         graphene_attrs.update(self.options.extra_fields)
 
@@ -214,9 +656,148 @@ class ToGraphene:
                 required=True
             )
 
+        field_names = inherited_fields.union(graphene_attrs)
+        for name, resolver in self.options.resolvers.items():
+            if name not in field_names:
+                raise errors.InvalidConfigClass(
+                    f'Invalid resolver "{name}", there is no such field'
+                )
+            graphene_attrs[f"resolve_{name}"] = staticmethod(resolver)
+
+        for name in self.options.blocking_resolvers:
+            if name not in field_names:
+                raise errors.InvalidConfigClass(
+                    f'Invalid blocking resolver "{name}", there is no such'
+                    " field"
+                )
+            graphene_attrs[f"resolve_{name}"] = staticmethod(
+                self._get_blocking_resolver(name, graphene_attrs)
+            )
+
+        graphene_attrs.update(self._get_type_resolution_attrs(interfaces))
+
         class_name = self.options.class_name or self._generate_class_name()
 
-        GrapheneClass = type(class_name, (self.graphene_type,), graphene_attrs)
+        graphene_class = type(
+            class_name, (self.graphene_type,), graphene_attrs
+        )
+        self._notify(
+            "on_class_created",
+            self.pydantic_model,
+            self.graphene_type,
+            graphene_class,
+            time.perf_counter() - start,
+        )
+        return graphene_class
+
+
+def _nested_model_thunk(
+    model_reference: typing.Callable,
+    graphene_type: types.GrapheneObjectType,
+    inherited_options: dict,
+    cache: ConversionCache,
+    registry: ModelRegistry,
+    hooks: typing.Tuple[instrumentation.ConversionHooks, ...] = (),
+) -> typing.Callable:
+    """
+    Lazy reference to the graphene class of a nested model.
+
+    Graphene calls it when the schema is assembled, so the nested class is
+    only converted then, and models referencing each other (or themselves)
+    find the classes already converted in the registry instead of
+    recursing forever.
+    """
+    graphene_class = None
+
+    def thunk() -> types.GrapheneObjectType:
+        nonlocal graphene_class
+        if graphene_class is not None:
+            return graphene_class
+
+        pydantic_model = model_reference()
+        graphene_class = registry.get(pydantic_model, graphene_type)
+        if graphene_class is not None:
+            return graphene_class
+
+        options = registry.get_options(pydantic_model) or {}
+        if isinstance(options, ToGrapheneOptions):
+            options = options.dict(exclude_unset=True)
+
+        graphene_class = ToGraphene(
+            pydantic_model,
+            graphene_type,
+            options={**inherited_options, **options},
+            cache=cache,
+            registry=registry,
+            hooks=hooks,
+        ).convert()
+        own_options = {
+            **{
+                k: v
+                for k, v in inherited_options.items()
+                if k in _CACHE_OPTIONS
+            },
+            **options,
+        }
+        _check_name_clash(
+            pydantic_model, graphene_type, graphene_class, own_options, cache
+        )
+        return graphene_class
+
+    return thunk
+
+
+def _check_name_clash(
+    pydantic_model: pydantic.BaseModel,
+    graphene_type: types.GrapheneObjectType,
+    graphene_class: types.GrapheneObjectType,
+    options: dict,
+    cache: ConversionCache,
+):
+    """
+    Raise when the model was also converted on its own, to another class
+    with the same name: a schema can not have both.
+    """
+    to_graphene = ToGraphene(
+        pydantic_model, graphene_type, options=options, cache=cache
+    )
+    cache_key = to_graphene._get_cache_key(
+        pydantic_model,
+        graphene_type,
+        to_graphene.options.fingerprint()
+        + to_graphene._get_type_registry_fingerprint(),
+    )
+    if cache_key not in cache:
+        return
+
+    own_class = cache[cache_key]
+    if own_class is not graphene_class and (
+        own_class._meta.name == graphene_class._meta.name
+    ):
+        raise errors.InvalidConfigClass(
+            f'"{graphene_class._meta.name}" is converted twice: on its own'
+            f" and as a nested model, with the type_registry and"
+            f" fast_resolvers options of its parent. Convert it with the"
+            f" same options, or give one of them another class_name"
+        )
+
+
+def _union_thunk(
+    member_thunks: typing.List[typing.Callable],
+) -> typing.Callable:
+    """
+    Lazy reference to the union of nested models, built once the member
+    classes are converted.
+    """
+    union_type = None
+
+    def thunk() -> typing.Type[graphene.Union]:
+        nonlocal union_type
+        if union_type is None:
+            union_type = unions.get_union_type(
+                [member_thunk() for member_thunk in member_thunks]
+            )
+
+        return union_type
 
-        self._cache[cache_key] = GrapheneClass
-        return GrapheneClass
+    return thunk
@@ -4,7 +4,11 @@ import typing
 import graphene
 import pydantic
 
-from . import converter, errors, fields, types
+from graphene import relay
+
+from . import converter, errors, fields, pagination, types
+from .cache import ConversionCache
+from .registry import ModelRegistry
 
 ToGrapheneOptions = converter.ToGrapheneOptions
 
@@ -13,12 +17,98 @@ def to_graphene(
     pydantic_model: pydantic.BaseModel,
     graphene_type: types.GrapheneObjectType = graphene.ObjectType,
     options: typing.Union[ToGrapheneOptions, dict] = None,
+    cache: typing.Union[ConversionCache, dict] = None,
 ) -> types.GrapheneObjectType:
     return converter.ToGraphene(
-        pydantic_model, graphene_type, options
+        pydantic_model, graphene_type, options, cache
     ).convert()
 
 
+def to_graphene_connection(
+    pydantic_model: pydantic.BaseModel,
+    options: typing.Union[ToGrapheneOptions, dict] = None,
+    cache: typing.Union[ConversionCache, dict] = None,
+) -> typing.Type[relay.Connection]:
+    """Relay connection of the object type converted from the model."""
+    return pagination.get_connection_type(
+        to_graphene(pydantic_model, graphene.ObjectType, options, cache)
+    )
+
+
+def _collect_models(
+    models: typing.Union[typing.Iterable[pydantic.BaseModel], object],
+) -> typing.List[pydantic.BaseModel]:
+    if not inspect.ismodule(models):
+        return list(models)
+
+    return [
+        value
+        for value in vars(models).values()
+        if fields.is_pydantic_base_model(value)
+        and value.__module__ == models.__name__
+    ]
+
+
+def _sort_by_dependencies(
+    models: typing.List[pydantic.BaseModel],
+) -> typing.List[pydantic.BaseModel]:
+    # depth first post-order, nested models come before the models using
+    # them; models reached again while being visited (cycles) are skipped
+    ordered = []
+    visited = set()
+
+    def visit(model):
+        if model in visited:
+            return
+
+        visited.add(model)
+        for nested_model in converter.get_nested_models(model):
+            visit(nested_model)
+        ordered.append(model)
+
+    for model in models:
+        visit(model)
+
+    return ordered
+
+
+def to_graphene_many(
+    models: typing.Union[typing.Iterable[pydantic.BaseModel], object],
+    graphene_type: types.GrapheneObjectType = graphene.ObjectType,
+    options: typing.Mapping[
+        pydantic.BaseModel, typing.Union[ToGrapheneOptions, dict]
+    ] = None,
+    cache: typing.Union[ConversionCache, dict] = None,
+    registry: ModelRegistry = None,
+) -> ModelRegistry:
+    """
+    Convert ``models`` (an iterable of models or a module) and the models
+    nested on them, dependencies first, sharing one cache and registry.
+    """
+    if registry is None:
+        registry = ModelRegistry(graphene_type)
+    for model, model_options in (options or {}).items():
+        registry.set_options(model, model_options)
+
+    for model in _sort_by_dependencies(_collect_models(models)):
+        if registry.get(model, graphene_type):
+            continue
+
+        converter.ToGraphene(
+            model,
+            graphene_type,
+            options=registry.get_options(model),
+            cache=cache,
+            registry=registry,
+        ).convert()
+
+    return registry
+
+
+def get_default_cache() -> ConversionCache:
+    return converter._module_cache
+
+
 class ConverterToGrapheneBase:
     @classmethod
     def as_class(
@@ -40,6 +130,22 @@ class ConverterToGrapheneBase:
             for attr, value in vars(cls).items()
             if fields.is_graphene_type(value)
         }
+        # resolve_<field> functions (or staticmethods), sync or async,
+        # resolve the fields of the generated class; other resolve_
+        # attributes, e.g. of unknown fields or classmethods, are left alone
+        field_names = set(model.__fields__).union(options["extra_fields"])
+        resolvers = {}
+        for attr, value in vars(cls).items():
+            name = attr.replace("resolve_", "", 1)
+            if isinstance(value, staticmethod):
+                value = value.__func__
+            if (
+                attr.startswith("resolve_")
+                and inspect.isfunction(value)
+                and name in field_names
+            ):
+                resolvers[name] = value
+        options["resolvers"] = {**options.get("resolvers", {}), **resolvers}
 
         params = {
             "pydantic_model": model,
@@ -0,0 +1,97 @@
+import asyncio
+import collections
+import concurrent.futures
+import functools
+import threading
+import typing
+
+DEFAULT_MAX_WORKERS = 8
+
+ExecutorStats = collections.namedtuple(
+    "ExecutorStats",
+    ["max_workers", "queued", "running", "completed", "failed"],
+)
+
+
+class BlockingExecutor:
+    """
+    Bounded thread pool running the blocking resolvers of async schemas
+    off the event loop. ``stats()`` tells how many calls wait for a
+    thread (``queued``), so a pool too small for the load shows up before
+    the latency does.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+
+        self.max_workers = max_workers
+        self._pool = None
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._started = 0
+        self._completed = 0
+        self._failed = 0
+
+    def _get_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        # threads are only started once a blocking resolver runs
+        with self._lock:
+            if self._pool is None:
+                self._pool = concurrent.futures.ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="pydantic2graphene"
+                )
+            return self._pool
+
+    def _call(self, fn: typing.Callable, *args, **kwargs):
+        with self._lock:
+            self._started += 1
+        try:
+            value = fn(*args, **kwargs)
+        except BaseException:
+            with self._lock:
+                self._failed += 1
+            raise
+
+        with self._lock:
+            self._completed += 1
+        return value
+
+    def submit(
+        self, fn: typing.Callable, *args, **kwargs
+    ) -> concurrent.futures.Future:
+        pool = self._get_pool()
+        with self._lock:
+            self._submitted += 1
+        return pool.submit(functools.partial(self._call, fn, *args, **kwargs))
+
+    async def run(self, fn: typing.Callable, *args, **kwargs):
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def stats(self) -> ExecutorStats:
+        with self._lock:
+            return ExecutorStats(
+                max_workers=self.max_workers,
+                queued=self._submitted - self._started,
+                running=self._started - self._completed - self._failed,
+                completed=self._completed,
+                failed=self._failed,
+            )
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+
+_default_executor = BlockingExecutor()
+
+
+def get_blocking_executor() -> BlockingExecutor:
+    return _default_executor
+
+
+def set_blocking_executor(executor: BlockingExecutor):
+    """Replace the executor used by types without ``blocking_executor``."""
+    global _default_executor
+    _default_executor = executor
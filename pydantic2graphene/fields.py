@@ -5,11 +5,15 @@ import inspect
 import ipaddress
 import typing
 import uuid
+import weakref
 
 import graphene
 import graphene.types.datetime
 import pydantic.fields
 
+from . import errors
+
+_NONE_TYPE = type(None)
 _NOT_SUPPORTED_SHAPES = None
 
 
@@ -162,16 +166,119 @@ _ENUM_TYPE = (
 )
 
 
-def get_grapehene_field_by_type(type_):
-    mapping = _get_type_mapping()
+class TypeRegistry:
+    """
+    Maps python types to graphene types.
+
+    Lookups of classes walk their MRO once and the result, including a
+    miss, is memoized per class until a type is registered on the registry
+    (or on one of its parents). A type registered for the class itself
+    always wins; when only its bases are registered the highest
+    ``priority`` wins, then the most specific base.
+    """
+
+    def __init__(self, parent: "TypeRegistry" = None):
+        self.parent = parent
+        self._types = {}
+        self._version = 0
+        self._resolved_classes = None
+        self._registered = None
+        self._resolved_version = None
+
+    @property
+    def version(self) -> tuple:
+        parent_version = self.parent.version if self.parent else ()
+        return parent_version + (self._version,)
+
+    def register_type(self, type_, graphene_type, priority: int = 0):
+        if not is_graphene_class(graphene_type):
+            raise errors.InvalidType(f"{graphene_type} is not a graphene type")
+
+        self._types[type_] = (graphene_type, priority)
+        self._version += 1
+
+    def unregister_type(self, type_):
+        del self._types[type_]
+        self._version += 1
+
+    def get_registered_types(self) -> dict:
+        registered = self.parent.get_registered_types() if self.parent else {}
+        registered.update(self._types)
+        return registered
+
+    def _refresh(self):
+        version = self.version
+        if self._resolved_version != version:
+            # constrained types (constr(), conint(), ...) are fresh classes,
+            # they are held weakly to not keep them alive
+            self._resolved_classes = weakref.WeakKeyDictionary()
+            self._registered = self.get_registered_types()
+            self._resolved_version = version
+
+    def get(self, type_):
+        self._refresh()
+        registered = self._registered
+        resolved_classes = None
+        if inspect.isclass(type_):
+            resolved_classes = self._resolved_classes
+            try:
+                return resolved_classes[type_]
+            except KeyError:
+                pass
+
+        if type_ in registered:
+            graphene_type = registered[type_][0]
+        elif resolved_classes is None:
+            return None
+        else:
+            graphene_type = self._resolve_by_mro(type_, registered)
+
+        if resolved_classes is not None:
+            resolved_classes[type_] = graphene_type
+
+        return graphene_type
+
+    def _resolve_by_mro(self, type_, registered: dict):
+        best = None
+        for parent_type in type_.mro():
+            if parent_type not in registered:
+                continue
+
+            graphene_type, priority = registered[parent_type]
+            if best is None or priority > best[1]:
+                best = (graphene_type, priority)
+
+        return best[0] if best else None
 
-    if type_ in mapping:
-        return mapping[type_]
 
-    if inspect.isclass(type_):
-        for pydantic_type in type_.mro():
-            if pydantic_type in mapping:
-                return mapping[pydantic_type]
+class _DefaultTypeRegistry(TypeRegistry):
+    # the built-in type mapping is the bottom layer of every registry
+    _type_mapping = None
+
+    @property
+    def version(self) -> tuple:
+        type_mapping = _get_type_mapping()
+        if type_mapping is not self._type_mapping:  # the mapping was rebuilt
+            self._type_mapping = type_mapping
+            self._version += 1
+
+        return (self._version,)
+
+    def get_registered_types(self) -> dict:
+        registered = {k: (v, 0) for k, v in _get_type_mapping().items()}
+        registered.update(self._types)
+        return registered
+
+
+default_type_registry = _DefaultTypeRegistry()
+
+
+def register_type(type_, graphene_type, priority: int = 0):
+    default_type_registry.register_type(type_, graphene_type, priority)
+
+
+def get_grapehene_field_by_type(type_, registry: TypeRegistry = None):
+    return (registry or default_type_registry).get(type_)
 
 
 def is_field_not_allowed_type(type_) -> bool:
@@ -194,5 +301,20 @@ def is_pydantic_base_model(type_) -> bool:
     return inspect.isclass(type_) and issubclass(type_, pydantic.BaseModel)
 
 
+def get_union_members(type_) -> typing.Optional[tuple]:
+    """
+    >>> get_union_members(typing.Union[Dog, Cat, None])
+    (Dog, Cat)
+    """
+    if getattr(type_, "__origin__", None) is not typing.Union:
+        return None
+
+    return tuple(arg for arg in type_.__args__ if arg is not _NONE_TYPE)
+
+
 def is_graphene_type(type_) -> bool:
     return "graphene.types" in repr(type_)
+
+
+def is_graphene_class(type_) -> bool:
+    return inspect.isclass(type_) and hasattr(type_, "_meta")
@@ -0,0 +1,243 @@
+import datetime
+import decimal
+import enum
+import operator
+import typing
+
+import graphene
+import pydantic
+
+from . import converter, inputs, plan, sqlalchemy_helpers, types
+from .cache import ConversionCache
+from .registry import DerivedTypes
+
+_RANGE_TYPES = tuple(
+    getattr(graphene, name)
+    for name in ("Int", "Float", "Decimal", "Date", "DateTime", "Time")
+    if hasattr(graphene, name)
+)
+
+
+# constrained type: type of its values; not every pydantic version has all
+_CONSTRAINED_TYPES = tuple(
+    (getattr(pydantic.types, name), base_type)
+    for name, base_type in (
+        ("ConstrainedBytes", bytes),
+        ("ConstrainedStr", str),
+        ("ConstrainedInt", int),
+        ("ConstrainedFloat", float),
+        ("ConstrainedDecimal", decimal.Decimal),
+        ("ConstrainedDate", datetime.date),
+    )
+    if hasattr(pydantic.types, name)
+)
+
+
+def _contains(value, operand) -> bool:
+    return value is not None and operand in value
+
+
+def _compare(compare: typing.Callable) -> typing.Callable:
+    def compare_not_none(value, operand) -> bool:
+        return value is not None and compare(value, operand)
+
+    return compare_not_none
+
+
+# operator: (python predicate, sqlalchemy clause); the sqlalchemy clauses
+# are built with the column operators, so sqlalchemy is not imported here
+_OPERATORS = {
+    "eq": (operator.eq, operator.eq),
+    "in_": (lambda value, operand: value in operand, lambda c, v: c.in_(v)),
+    # autoescape: "%" and "_" in the operand are matched literally
+    "contains": (_contains, lambda c, v: c.contains(v, autoescape=True)),
+    "gt": (_compare(operator.gt), operator.gt),
+    "gte": (_compare(operator.ge), operator.ge),
+    "lt": (_compare(operator.lt), operator.lt),
+    "lte": (_compare(operator.le), operator.le),
+}
+
+
+class FilterInputObjectType(graphene.InputObjectType):
+    """
+    Base of the filter input types generated by ``to_graphene_filter``.
+
+    A filter value is compiled with ``to_predicate(value)``, a function
+    telling whether an instance matches, or ``to_sqlalchemy(value,
+    orm_model)``, a clause for ``query.filter()``. Conditions are combined
+    with "and", unset and null operators are ignored.
+    """
+
+    class Meta:
+        abstract = True
+
+    # field name -> (attribute names, python enum or None, type of the
+    # model values when graphene gives another one, e.g. UUID, or None)
+    _filter_fields = {}
+
+    @classmethod
+    def _iter_conditions(cls, value: typing.Mapping, to_model_type: bool):
+        for name, field_value in (value or {}).items():
+            if field_value is None or name not in cls._filter_fields:
+                continue
+
+            attrs, python_enum, model_type = cls._filter_fields[name]
+            for op_name, operand in field_value.items():
+                if operand is None:
+                    continue
+
+                if to_model_type and model_type is not None:
+                    operand = _to_model_type(model_type, operand)
+                elif python_enum is not None:
+                    operand = _to_enum(python_enum, operand)
+                yield attrs, _OPERATORS[op_name], operand
+
+    @classmethod
+    def to_predicate(
+        cls, value: typing.Mapping
+    ) -> typing.Callable[[typing.Any], bool]:
+        checks = tuple(
+            (operator.attrgetter(attrs[0]), python_op, operand)
+            for attrs, (python_op, _), operand in cls._iter_conditions(
+                value, to_model_type=True
+            )
+        )
+
+        def predicate(obj) -> bool:
+            for getter, python_op, operand in checks:
+                if not python_op(getter(obj), operand):
+                    return False
+            return True
+
+        return predicate
+
+    @classmethod
+    def to_sqlalchemy(cls, value: typing.Mapping, orm_model):
+        sqlalchemy_helpers._require_sqlalchemy()
+        clauses = []
+        for attrs, (_, sql_op), operand in cls._iter_conditions(
+            value, to_model_type=False
+        ):
+            # the column has the field name, or its alias (as orm_mode)
+            column = getattr(orm_model, attrs[0], None)
+            if column is None:
+                column = getattr(orm_model, attrs[1])
+            clauses.append(sql_op(column, operand))
+
+        # and_() without clauses is deprecated, an empty filter matches all
+        sqlalchemy = sqlalchemy_helpers.sqlalchemy
+        return sqlalchemy.and_(sqlalchemy.true(), *clauses)
+
+
+def _to_model_type(model_type: type, operand):
+    # the model values are compared, e.g. UUID and not str, Decimal and
+    # not float
+    if isinstance(operand, (list, tuple)):
+        return [_to_model_type(model_type, v) for v in operand]
+
+    return pydantic.parse_obj_as(model_type, operand)
+
+
+def _get_model_type(pydantic_field: pydantic.fields.ModelField) -> type:
+    # without the constraints of the field, e.g. condecimal(gt=0) filtered
+    # with {gt: 0}
+    field_type = pydantic_field.type_
+    for constrained_type, base_type in _CONSTRAINED_TYPES:
+        if isinstance(field_type, type) and issubclass(
+            field_type, constrained_type
+        ):
+            return base_type
+
+    return field_type
+
+
+def _to_enum(python_enum: typing.Type[enum.Enum], operand):
+    # graphene 3 gives enum members, older versions their values
+    if isinstance(operand, (list, tuple)):
+        return [_to_enum(python_enum, v) for v in operand]
+
+    if isinstance(operand, python_enum):
+        return operand
+
+    return python_enum(operand)
+
+
+def _create_operator_type(graphene_type) -> types.GrapheneObjectType:
+    attrs = {
+        "eq": graphene.InputField(graphene_type),
+        "in_": graphene.List(graphene.NonNull(graphene_type), name="in"),
+    }
+    if issubclass(graphene_type, graphene.String):
+        attrs["contains"] = graphene.InputField(graphene_type)
+
+    if issubclass(graphene_type, _RANGE_TYPES):
+        for name in ("gt", "gte", "lt", "lte"):
+            attrs[name] = graphene.InputField(graphene_type)
+
+    name = f"{graphene_type._meta.name}Filter"
+    return type(name, (graphene.InputObjectType,), attrs)
+
+
+# one operators input type per scalar or enum
+_operator_types = DerivedTypes(_create_operator_type)
+
+
+def _create_filter_class(
+    to_graphene: converter.ToGraphene,
+) -> types.GrapheneObjectType:
+    attrs = {}
+    filter_fields = {}
+    for field_plan in to_graphene.get_model_plan().fields:
+        # nested models and lists need joins on the database, they are
+        # not filtered
+        if (
+            field_plan.error
+            or field_plan.kind in (plan.MODEL, plan.UNION)
+            or field_plan.is_list
+            or field_plan.name in to_graphene.options.exclude_fields
+        ):
+            continue
+
+        attrs[field_plan.name] = graphene.InputField(
+            _operator_types.get(field_plan.graphene_type)
+        )
+        python_enum = None
+        if field_plan.kind == plan.ENUM:
+            python_enum = field_plan.graphene_type._meta.enum
+        pydantic_field = to_graphene.pydantic_model.__fields__[field_plan.name]
+        model_type = None
+        if inputs.needs_coercion(field_plan, pydantic_field):
+            model_type = _get_model_type(pydantic_field)
+        filter_fields[field_plan.name] = (
+            (field_plan.name, field_plan.alias),
+            python_enum,
+            model_type,
+        )
+
+    attrs["_filter_fields"] = filter_fields
+    name = converter._get_pydantic_class_name(to_graphene.pydantic_model)
+    return type(f"{name}FilterGql", (FilterInputObjectType,), attrs)
+
+
+def to_graphene_filter(
+    pydantic_model: pydantic.BaseModel,
+    options: typing.Union[converter.ToGrapheneOptions, dict] = None,
+    cache: typing.Union[ConversionCache, dict] = None,
+) -> types.GrapheneObjectType:
+    """
+    Filter input type of ``pydantic_model``: one field per scalar or enum
+    field of the model, with ``eq`` and ``in`` operators, ``contains`` on
+    strings, and ``gt``, ``gte``, ``lt`` and ``lte`` on numbers and dates.
+    """
+    to_graphene = converter.ToGraphene(
+        pydantic_model, FilterInputObjectType, options, cache
+    )
+    cache_key = to_graphene._get_cache_key(
+        pydantic_model,
+        FilterInputObjectType,
+        to_graphene.options.fingerprint()
+        + to_graphene._get_type_registry_fingerprint(),
+    )
+    return to_graphene._get_or_create(
+        cache_key, lambda: _create_filter_class(to_graphene)
+    )
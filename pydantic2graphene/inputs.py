@@ -0,0 +1,123 @@
+import datetime
+import typing
+
+import graphene
+import pydantic
+
+from . import plan
+
+# python type of the values graphene's scalars give to resolvers
+_SCALAR_TYPES = {
+    graphene.String: str,
+    graphene.ID: str,
+    graphene.Int: int,
+    graphene.Float: float,
+    graphene.Boolean: bool,
+    graphene.types.datetime.DateTime: datetime.datetime,
+}
+# not on every graphene version
+try:
+    _SCALAR_TYPES[graphene.types.datetime.Date] = datetime.date
+    _SCALAR_TYPES[graphene.types.datetime.Time] = datetime.time
+except AttributeError:
+    pass
+
+# constrained types whose values are the plain python type
+_PLAIN_CONSTRAINED_TYPES = (
+    pydantic.types.ConstrainedStr,
+    pydantic.types.ConstrainedInt,
+    pydantic.types.ConstrainedFloat,
+)
+
+
+class InputField(typing.NamedTuple):
+    name: str
+    alias: str
+    is_list: bool
+    # thunk returning the input type of a nested model
+    nested: typing.Callable = None
+    # graphene gives another type than the model field, e.g. str for UUID
+    coerce: bool = False
+
+
+def needs_coercion(
+    field_plan: plan.FieldPlan, pydantic_field: pydantic.fields.ModelField
+) -> bool:
+    """Whether graphene's value is not of the type the model stores."""
+    if field_plan.kind == plan.MODEL:
+        return False
+
+    if field_plan.kind != plan.SCALAR:
+        # graphene 2 gives the enum values, not the members
+        return True
+
+    python_type = _SCALAR_TYPES.get(field_plan.graphene_type)
+    field_type = pydantic_field.type_
+    if python_type is None or not isinstance(field_type, type):
+        return True
+
+    if issubclass(field_type, _PLAIN_CONSTRAINED_TYPES):
+        return not issubclass(field_type, python_type)
+
+    return field_type is not python_type
+
+
+def _coerce(pydantic_model, name: str, value):
+    pydantic_field = pydantic_model.__fields__[name]
+    value, error = pydantic_field.validate(
+        value, {}, loc=pydantic_field.alias, cls=pydantic_model
+    )
+    if error:
+        raise pydantic.ValidationError([error], pydantic_model)
+
+    return value
+
+
+def make_to_pydantic(
+    model_reference: typing.Callable,
+    input_fields: typing.Iterable[InputField],
+) -> classmethod:
+    """
+    ``to_pydantic(value, trusted=False)`` of a generated input type,
+    building the model (and the nested ones) straight from the input
+    value graphene passes to the resolvers. ``trusted=True`` uses
+    ``construct()`` and skips the validation, for inputs only checked by
+    graphene's own type coercion. The fields graphene gives with another
+    type, e.g. UUID as str or Decimal as float, are still validated.
+    """
+    input_fields = tuple(input_fields)
+
+    def to_pydantic(
+        cls, value: typing.Mapping, trusted: bool = False
+    ) -> pydantic.BaseModel:
+        if value is None:
+            return None
+
+        pydantic_model = model_reference()
+        values = {}
+        for name, alias, is_list, nested, coerce in input_fields:
+            if name not in value:
+                continue
+
+            field_value = value[name]
+            if trusted and coerce and field_value is not None:
+                field_value = _coerce(pydantic_model, name, field_value)
+
+            if nested is not None and field_value is not None:
+                nested_to_pydantic = nested().to_pydantic
+                if is_list:
+                    field_value = [
+                        nested_to_pydantic(v, trusted) for v in field_value
+                    ]
+                else:
+                    field_value = nested_to_pydantic(field_value, trusted)
+
+            # construct() only takes field names, validation takes aliases
+            values[name if trusted else alias] = field_value
+
+        if trusted:
+            return pydantic_model.construct(**values)
+
+        return pydantic_model(**values)
+
+    return classmethod(to_pydantic)
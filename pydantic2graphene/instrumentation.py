@@ -0,0 +1,173 @@
+import collections
+import threading
+import typing
+
+import graphene
+import pydantic
+
+from . import plan, types
+from .cache import CacheKey
+
+
+class ConversionHooks:
+    """
+    Receives the conversion events, subclasses override the ones they
+    need. ``elapsed`` is in seconds.
+
+    Hooks run inline in the conversion, so they should be cheap and not
+    raise.
+    """
+
+    def on_model_start(
+        self,
+        pydantic_model: pydantic.BaseModel,
+        graphene_type: types.GrapheneObjectType,
+    ):
+        pass
+
+    def on_field_resolved(
+        self,
+        pydantic_model: pydantic.BaseModel,
+        graphene_type: types.GrapheneObjectType,
+        field_plan: plan.FieldPlan,
+        elapsed: float,
+    ):
+        pass
+
+    def on_cache_hit(self, cache_key: CacheKey):
+        pass
+
+    def on_cache_miss(self, cache_key: CacheKey):
+        pass
+
+    def on_class_created(
+        self,
+        pydantic_model: pydantic.BaseModel,
+        graphene_type: types.GrapheneObjectType,
+        graphene_class: types.GrapheneObjectType,
+        elapsed: float,
+    ):
+        pass
+
+
+# replaced instead of mutated, so the conversions iterate over a snapshot
+_hooks = ()
+_hooks_lock = threading.Lock()
+
+
+def add_hooks(hooks: ConversionHooks):
+    """Register ``hooks`` for every conversion."""
+    global _hooks
+    with _hooks_lock:
+        _hooks = _hooks + (hooks,)
+
+
+def remove_hooks(hooks: ConversionHooks):
+    global _hooks
+    with _hooks_lock:
+        if hooks not in _hooks:
+            raise ValueError(f"{hooks!r} is not registered")
+
+        _hooks = tuple(h for h in _hooks if h is not hooks)
+
+
+def get_hooks() -> typing.Tuple[ConversionHooks, ...]:
+    return _hooks
+
+
+ModelStats = collections.namedtuple(
+    "ModelStats", ["conversions", "fields", "time"]
+)
+
+ConversionStats = collections.namedtuple(
+    "ConversionStats",
+    [
+        "models_converted",
+        "time",
+        "cache_hits",
+        "cache_misses",
+        "cache_hit_ratio",
+        "models",
+    ],
+)
+
+
+def _get_model_name(pydantic_model: pydantic.BaseModel) -> str:
+    # models are named, not referenced, so the statistics never keep a
+    # model alive
+    return f"{pydantic_model.__module__}.{pydantic_model.__qualname__}"
+
+
+def _is_class_key(cache_key: CacheKey) -> bool:
+    return cache_key.graphene_type not in (plan.ModelPlan, graphene.Enum)
+
+
+class StatsCollector(ConversionHooks):
+    """
+    Aggregates the conversion events, ``models`` maps each model name to
+    its ``ModelStats``. The cache hits and misses are the ones of the
+    converted classes, not of the field plans and enums they use.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._models = {}
+            self._cache_hits = 0
+            self._cache_misses = 0
+
+    def on_cache_hit(self, cache_key: CacheKey):
+        if _is_class_key(cache_key):
+            with self._lock:
+                self._cache_hits += 1
+
+    def on_cache_miss(self, cache_key: CacheKey):
+        if _is_class_key(cache_key):
+            with self._lock:
+                self._cache_misses += 1
+
+    def on_class_created(
+        self,
+        pydantic_model: pydantic.BaseModel,
+        graphene_type: types.GrapheneObjectType,
+        graphene_class: types.GrapheneObjectType,
+        elapsed: float,
+    ):
+        name = _get_model_name(pydantic_model)
+        fields_count = len(graphene_class._meta.fields)
+        with self._lock:
+            conversions, _, total = self._models.get(name, (0, 0, 0.0))
+            self._models[name] = ModelStats(
+                conversions=conversions + 1,
+                fields=fields_count,
+                time=total + elapsed,
+            )
+
+    def snapshot(self) -> ConversionStats:
+        with self._lock:
+            models = dict(self._models)
+            lookups = self._cache_hits + self._cache_misses
+            return ConversionStats(
+                models_converted=len(models),
+                time=sum(m.time for m in models.values()),
+                cache_hits=self._cache_hits,
+                cache_misses=self._cache_misses,
+                cache_hit_ratio=self._cache_hits / lookups if lookups else 0.0,
+                models=models,
+            )
+
+
+_stats_collector = StatsCollector()
+add_hooks(_stats_collector)
+
+
+def stats() -> ConversionStats:
+    """Statistics of the conversions since the start or ``reset_stats``."""
+    return _stats_collector.snapshot()
+
+
+def reset_stats():
+    _stats_collector.reset()
@@ -0,0 +1,127 @@
+import asyncio
+import inspect
+import typing
+
+import graphene
+
+_IS_GRAPHENE_V3_OR_LATER = int(graphene.__version__[:1]) >= 3
+
+_CONTEXT_KEY = "pydantic2graphene_loaders"
+
+# python 3.6 has no get_running_loop, the loaders only run in coroutines
+_get_running_loop = getattr(
+    asyncio, "get_running_loop", asyncio.get_event_loop
+)
+
+BatchLoadFn = typing.Callable[[typing.List[typing.Any]], typing.Sequence]
+
+
+class DataLoader:
+    """
+    Minimal asyncio DataLoader: the keys loaded while the resolvers of a
+    level run are batched into one ``batch_load_fn(keys)`` call, which
+    returns (or resolves to) the values in the order of the keys.
+    """
+
+    def __init__(self, batch_load_fn: BatchLoadFn):
+        self.batch_load_fn = batch_load_fn
+        self._futures = {}
+        self._queue = []
+
+    def load(self, key) -> asyncio.Future:
+        future = self._futures.get(key)
+        if future is not None:
+            return future
+
+        loop = _get_running_loop()
+        future = self._futures[key] = loop.create_future()
+        self._queue.append((key, future))
+        if len(self._queue) == 1:
+            # runs once the sibling resolvers queued their keys
+            loop.call_soon(self._dispatch)
+
+        return future
+
+    def _dispatch(self):
+        queue, self._queue = self._queue, []
+        asyncio.ensure_future(self._load_batch(queue))
+
+    async def _load_batch(self, queue):
+        keys = [key for key, _ in queue]
+        try:
+            values = self.batch_load_fn(keys)
+            if inspect.isawaitable(values):
+                values = await values
+            values = list(values)
+            if len(values) != len(keys):
+                raise ValueError(
+                    f"{self.batch_load_fn} returned {len(values)} values for"
+                    f" {len(keys)} keys"
+                )
+        except Exception as error:
+            for _, future in queue:
+                future.set_exception(error)
+            return
+
+        for (_, future), value in zip(queue, values):
+            future.set_result(value)
+
+
+def _create_promise_loader(batch_load_fn: BatchLoadFn):
+    # graphene 2 executes promises, not coroutines
+    from promise import Promise
+    from promise.dataloader import DataLoader as PromiseDataLoader
+
+    return PromiseDataLoader(
+        lambda keys: Promise.resolve(list(batch_load_fn(keys)))
+    )
+
+
+def create_loader(batch_load_fn: BatchLoadFn):
+    if _IS_GRAPHENE_V3_OR_LATER:
+        return DataLoader(batch_load_fn)
+
+    return _create_promise_loader(batch_load_fn)
+
+
+def get_loader(context, batch_load_fn: BatchLoadFn):
+    """
+    Loader of ``batch_load_fn`` for the current request, kept in the
+    request ``context`` (a dict or an object), so values are never shared
+    between requests.
+    """
+    if context is None:
+        raise ValueError("loaders need a context, e.g. execute(context={})")
+
+    if isinstance(context, dict):
+        loaders = context.setdefault(_CONTEXT_KEY, {})
+    else:
+        loaders = getattr(context, _CONTEXT_KEY, None)
+        if loaders is None:
+            loaders = {}
+            setattr(context, _CONTEXT_KEY, loaders)
+
+    loader = loaders.get(batch_load_fn)
+    if loader is None:
+        loader = loaders[batch_load_fn] = create_loader(batch_load_fn)
+
+    return loader
+
+
+def make_loader_resolver(
+    batch_load_fn: BatchLoadFn, id_field_name: str
+) -> typing.Callable:
+    """
+    Resolver loading the field through the request loader of
+    ``batch_load_fn``, keyed by the ``id_field_name`` of the parent.
+    """
+
+    def resolve(root, info, *args, **kwargs):
+        if isinstance(root, dict):
+            key = root[id_field_name]
+        else:
+            key = getattr(root, id_field_name)
+
+        return get_loader(info.context, batch_load_fn).load(key)
+
+    return resolve
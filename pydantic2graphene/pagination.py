@@ -0,0 +1,186 @@
+import base64
+import json
+import re
+import typing
+
+from graphene import relay
+from graphene.types.utils import get_type
+
+try:
+    from graphql_relay import cursor_to_offset, offset_to_cursor
+except ImportError:  # graphql-relay 2, installed by graphene 2
+    from graphql_relay.connection.arrayconnection import (
+        cursor_to_offset,
+        offset_to_cursor,
+    )
+
+from . import types
+from .registry import DerivedTypes
+
+_KEYSET_PREFIX = "keyset:"
+
+
+def _create_connection_type(
+    node_type: types.GrapheneObjectType,
+) -> typing.Type[relay.Connection]:
+    base_name = re.sub("Gql$", "", node_type._meta.name)
+    return type(
+        f"{base_name}Connection",
+        (relay.Connection,),
+        {"Meta": type("Meta", (), {"node": node_type})},
+    )
+
+
+# one connection per node type
+_connection_types = DerivedTypes(_create_connection_type)
+
+
+def get_connection_type(
+    node_type: types.GrapheneObjectType,
+) -> typing.Type[relay.Connection]:
+    """Relay connection of ``node_type``, e.g. ``PetConnection``."""
+    return _connection_types.get(node_type)
+
+
+def _encode_keyset_cursor(value) -> str:
+    data = _KEYSET_PREFIX + json.dumps(value, default=str)
+    return base64.b64encode(data.encode()).decode()
+
+
+def _decode_keyset_cursor(cursor: str):
+    data = base64.b64decode(cursor.encode()).decode()
+    if not data.startswith(_KEYSET_PREFIX):
+        raise ValueError(f"Invalid cursor {cursor!r}")
+
+    return json.loads(data.replace(_KEYSET_PREFIX, "", 1))
+
+
+def _decode_offset_cursor(cursor: str) -> int:
+    offset = cursor_to_offset(cursor)
+    if offset is None:
+        raise ValueError(f"Invalid cursor {cursor!r}")
+
+    return offset
+
+
+def _is_query(source) -> bool:
+    return hasattr(source, "offset") and hasattr(source, "limit")
+
+
+def _build_connection(
+    connection_type: typing.Type[relay.Connection],
+    nodes: typing.Sequence,
+    cursors: typing.Sequence[str],
+    has_previous_page: bool,
+    has_next_page: bool,
+) -> relay.Connection:
+    edges = [
+        connection_type.Edge(node=node, cursor=cursor)
+        for node, cursor in zip(nodes, cursors)
+    ]
+    page_info = relay.PageInfo(
+        start_cursor=cursors[0] if cursors else None,
+        end_cursor=cursors[-1] if cursors else None,
+        has_previous_page=has_previous_page,
+        has_next_page=has_next_page,
+    )
+    return connection_type(edges=edges, page_info=page_info)
+
+
+def _paginate_sequence(connection_type, source, first, after, last, before):
+    length = len(source)
+    start = _decode_offset_cursor(after) + 1 if after else 0
+    end = min(_decode_offset_cursor(before), length) if before else length
+    if first is not None:
+        end = min(end, start + first)
+    if last is not None:
+        start = max(start, end - last)
+
+    nodes = source[start:end] if start < end else []
+    return _build_connection(
+        connection_type,
+        nodes,
+        [offset_to_cursor(start + i) for i in range(len(nodes))],
+        has_previous_page=start > 0,
+        has_next_page=end < length,
+    )
+
+
+def _paginate_query(connection_type, query, first, after, keyset):
+    if keyset is None:
+        start = _decode_offset_cursor(after) + 1 if after else 0
+        query = query.offset(start)
+    else:
+        query = query.order_by(keyset)
+        if after:
+            query = query.filter(keyset > _decode_keyset_cursor(after))
+
+    if first is not None:
+        # one more row tells whether there is a next page
+        query = query.limit(first + 1)
+
+    nodes = list(query)
+    has_next_page = first is not None and len(nodes) > first
+    nodes = nodes[:first] if has_next_page else nodes
+
+    if keyset is None:
+        cursors = [offset_to_cursor(start + i) for i in range(len(nodes))]
+        has_previous_page = start > 0
+    else:
+        cursors = [
+            _encode_keyset_cursor(getattr(node, keyset.key)) for node in nodes
+        ]
+        has_previous_page = bool(after)
+
+    return _build_connection(
+        connection_type, nodes, cursors, has_previous_page, has_next_page
+    )
+
+
+def paginate(
+    connection_type: typing.Type[relay.Connection],
+    source,
+    first: int = None,
+    after: str = None,
+    last: int = None,
+    before: str = None,
+    keyset=None,
+) -> relay.Connection:
+    """
+    One page of ``source`` as a ``connection_type`` instance, the value a
+    ``relay.ConnectionField`` resolver returns.
+
+    Sequences are sliced. SQLAlchemy queries get a LIMIT/OFFSET, or with
+    ``keyset`` (a column, e.g. ``Pet.id``) are ordered by it and filtered
+    after the key of the cursor, so only the rows of the page are loaded.
+    Queries are only paginated forwards, with ``first`` and ``after``.
+    """
+    if (first is not None and first < 0) or (last is not None and last < 0):
+        raise ValueError("first and last must be positive")
+
+    if not _is_query(source):
+        if keyset is not None:
+            raise ValueError("keyset is only supported on queries")
+
+        return _paginate_sequence(
+            connection_type, source, first, after, last, before
+        )
+
+    if last is not None or before:
+        raise ValueError("queries are only paginated with first and after")
+
+    return _paginate_query(connection_type, source, first, after, keyset)
+
+
+def connection_field(
+    node_type: typing.Union[types.GrapheneObjectType, typing.Callable],
+    **kwargs,
+) -> relay.ConnectionField:
+    """``ConnectionField`` of a node type, or of a thunk returning it."""
+    if isinstance(node_type, type):
+        return relay.ConnectionField(get_connection_type(node_type), **kwargs)
+
+    return relay.ConnectionField(
+        lambda: get_connection_type(get_type(node_type)),
+        **kwargs,
+    )
@@ -0,0 +1,131 @@
+import logging
+import typing
+
+import pydantic
+
+from . import errors, fields
+
+SCALAR = "scalar"
+ENUM = "enum"
+MODEL = "model"
+UNION = "union"
+
+
+class FieldPlan(typing.NamedTuple):
+    """
+    What a pydantic field converts to, independent of the graphene type
+    being emitted: ``graphene_type`` is the resolved scalar or enum, and
+    ``model`` the nested pydantic model (a tuple of models for unions),
+    resolved per graphene type.
+    """
+
+    name: str
+    alias: str
+    kind: str
+    graphene_type: typing.Any
+    model: typing.Any
+    is_list: bool
+    required: bool
+    default: typing.Any
+    error: Exception = None
+
+
+class ModelPlan(typing.NamedTuple):
+    # the model itself is not kept, plans are cached under the model and a
+    # reference to it would keep weakly cached models alive
+    fields: typing.Tuple[FieldPlan, ...]
+
+
+def compile_field_plan(
+    pydantic_field: pydantic.fields.ModelField,
+    convert_enum: typing.Callable,
+    type_registry: fields.TypeRegistry = None,
+) -> FieldPlan:
+    plan = FieldPlan(
+        name=pydantic_field.name,
+        alias=pydantic_field.alias,
+        kind=SCALAR,
+        graphene_type=None,
+        model=None,
+        is_list=fields.is_list_shape(pydantic_field.shape),
+        required=pydantic_field.required,
+        default=pydantic_field.default,
+    )
+
+    # unsupported fields only fail when emitted, so they can still be
+    # excluded from the conversion
+    try:
+        return _resolve_field_type(
+            plan, pydantic_field, convert_enum, type_registry
+        )
+    except errors.FieldNotSupported as error:
+        return plan._replace(error=error)
+
+
+def _resolve_field_type(
+    plan: FieldPlan,
+    pydantic_field: pydantic.fields.ModelField,
+    convert_enum: typing.Callable,
+    type_registry: fields.TypeRegistry,
+) -> FieldPlan:
+    shape = pydantic_field.shape
+    if fields.is_not_supported_shape(shape):
+        raise errors.FieldNotSupported(pydantic_field.name)
+
+    type_ = pydantic_field.type_
+    union_members = fields.get_union_members(type_)
+    if union_members and len(union_members) == 1:
+        # e.g. typing.List[typing.Optional[int]]
+        type_ = union_members[0]
+    elif union_members and all(
+        map(fields.is_pydantic_base_model, union_members)
+    ):
+        return plan._replace(kind=UNION, model=union_members)
+
+    type_args = getattr(type_, "__args__", [])
+
+    if plan.is_list and len(type_args):
+        type_ = type_args[0]
+        if len(type_args) > 1:
+            logging.warn(
+                "%s, has multiple only the first type was used",
+                pydantic_field.name,
+            )
+
+    if fields.is_enum_type(type_):
+        return plan._replace(kind=ENUM, graphene_type=convert_enum(type_))
+
+    if fields.is_pydantic_base_model(type_):
+        return plan._replace(kind=MODEL, model=type_)
+
+    field = fields.get_grapehene_field_by_type(type_, type_registry)
+    if field:
+        return plan._replace(graphene_type=field)
+
+    if fields.is_field_not_allowed_type(type_):
+        raise errors.InvalidListType(
+            "Lists must be type, e.g typing.List[int]"
+        )
+
+    outer_type_ = getattr(pydantic_field, "outer_type_", None)
+    if outer_type_:
+        field_outer = fields.get_grapehene_field_by_type(
+            outer_type_, type_registry
+        )
+        if field_outer:
+            return plan._replace(graphene_type=field_outer)
+
+    raise errors.FieldNotSupported(pydantic_field.name)
+
+
+def compile_model_plan(
+    pydantic_model: pydantic.BaseModel,
+    convert_enum: typing.Callable,
+    type_registry: fields.TypeRegistry = None,
+) -> ModelPlan:
+    return ModelPlan(
+        fields=tuple(
+            compile_field_plan(field, convert_enum, type_registry)
+            for field in pydantic_model.__fields__.values()
+        ),
+    )
@@ -0,0 +1,167 @@
+import typing
+
+import pydantic
+from graphene.utils.str_converters import to_camel_case, to_snake_case
+
+from . import converter, fields
+from .cache import ConversionCache
+
+# graphql-core 3 and graphql-core 2 node class names
+_FIELD_NODES = ("FieldNode", "Field")
+_FRAGMENT_SPREAD_NODES = ("FragmentSpreadNode", "FragmentSpread")
+_INLINE_FRAGMENT_NODES = ("InlineFragmentNode", "InlineFragment")
+
+_include_cache = ConversionCache(maxsize=256)
+
+# fields are included with ..., pydantic < 1.9 does not take True
+Include = typing.Dict[str, typing.Union[type(Ellipsis), "Include"]]
+
+
+def _get_field_nodes(info) -> list:
+    field_nodes = getattr(info, "field_nodes", None)
+    if field_nodes is None:  # graphql-core 2
+        field_nodes = info.field_asts
+
+    return field_nodes
+
+
+def _get_operation_key(info) -> tuple:
+    return (
+        id(info.operation),
+        tuple(id(node) for node in _get_field_nodes(info)),
+    )
+
+
+class _IncludeBuilder:
+    def __init__(self, info):
+        self.fragments = info.fragments
+        self.variables = info.variable_values or {}
+        # @skip and @include with variables make the tree depend on the
+        # request, it is not cached then
+        self.uses_variables = False
+
+    def _is_included(self, node) -> bool:
+        for directive in getattr(node, "directives", None) or ():
+            name = directive.name.value
+            if name not in ("skip", "include"):
+                continue
+
+            value = directive.arguments[0].value
+            if hasattr(value, "name"):
+                self.uses_variables = True
+                value = self.variables.get(value.name.value)
+            else:
+                value = value.value
+
+            if (name == "skip") == bool(value):
+                return False
+
+        return True
+
+    def _iter_fields(self, selections):
+        for node in selections:
+            if not self._is_included(node):
+                continue
+
+            kind = type(node).__name__
+            if kind in _FIELD_NODES:
+                yield node
+            elif kind in _FRAGMENT_SPREAD_NODES:
+                fragment = self.fragments[node.name.value]
+                yield from self._iter_fields(fragment.selection_set.selections)
+            elif kind in _INLINE_FRAGMENT_NODES:
+                yield from self._iter_fields(node.selection_set.selections)
+
+    def build(
+        self, selections, pydantic_model: pydantic.BaseModel = None
+    ) -> Include:
+        if pydantic_model is not None:
+            # the schema may be built with or without auto_camelcase
+            names = {name: name for name in pydantic_model.__fields__}
+            names.update(
+                (to_camel_case(name), name)
+                for name in pydantic_model.__fields__
+            )
+
+        include = {}
+        for node in self._iter_fields(selections):
+            graphql_name = node.name.value
+            if pydantic_model is None:
+                name = to_snake_case(graphql_name)
+            else:
+                name = names.get(graphql_name)
+                if name is None:  # e.g. __typename or extra fields
+                    continue
+
+            if node.selection_set is None:
+                include[name] = ...
+                continue
+
+            subtree = self._build_nested(node, name, pydantic_model)
+            previous = include.get(name)
+            include[name] = _merge(previous, subtree) if previous else subtree
+
+        return include
+
+    def _build_nested(self, node, name, pydantic_model) -> Include:
+        selections = node.selection_set.selections
+        if pydantic_model is None:
+            return self.build(selections)
+
+        pydantic_field = pydantic_model.__fields__[name]
+        nested_model = converter._get_field_type(pydantic_field)
+        if not fields.is_pydantic_base_model(nested_model):
+            return ...
+
+        subtree = self.build(selections, nested_model)
+        if fields.is_list_shape(pydantic_field.shape):
+            return {"__all__": subtree}
+
+        return subtree
+
+
+def _merge(first: Include, second: Include) -> Include:
+    if first is ... or second is ...:
+        return ...
+
+    merged = dict(first)
+    for key, value in second.items():
+        merged[key] = _merge(merged[key], value) if key in merged else value
+
+    return merged
+
+
+def get_include(info, pydantic_model: pydantic.BaseModel = None) -> Include:
+    """
+    The fields selected under the field being resolved, as a pydantic
+    ``include`` tree, e.g. ``item.dict(include=get_include(info, Item))``.
+
+    Fragments are followed and camel cased names, or the field names of
+    schemas without ``auto_camelcase``, are mapped back to the model
+    fields. With ``pydantic_model`` the names come from the model
+    and fields it does not have are left out, otherwise they are
+    converted with ``to_snake_case``.
+
+    The trees are cached per operation, so resolvers run for every row of
+    a list build them once.
+    """
+    key = _get_operation_key(info) + (pydantic_model,)
+    cached = _include_cache.get(key)
+    # the operation is kept with the tree, so its id is not reused while
+    # the entry exists
+    if cached is not None and cached[0] is info.operation:
+        return cached[1]
+
+    builder = _IncludeBuilder(info)
+    include = {}
+    for node in _get_field_nodes(info):
+        if node.selection_set is not None:
+            include = _merge(
+                include,
+                builder.build(node.selection_set.selections, pydantic_model),
+            )
+
+    if not builder.uses_variables:
+        _include_cache.set(key, (info.operation, include))
+
+    return include
@@ -0,0 +1,107 @@
+import threading
+import typing
+import weakref
+
+import graphene
+import pydantic
+
+from . import types
+
+
+class ModelRegistry:
+    """
+    Maps pydantic models to the graphene classes converted from them.
+
+    Lookups by model alone use ``graphene_type``, the registry default.
+    With ``weak=True`` the models are held by weak references.
+    """
+
+    def __init__(
+        self,
+        graphene_type: types.GrapheneObjectType = graphene.ObjectType,
+        weak: bool = False,
+    ):
+        self.graphene_type = graphene_type
+        mapping_class = weakref.WeakKeyDictionary if weak else dict
+        # model -> {graphene type: graphene class}
+        self._types = mapping_class()
+        self._options = mapping_class()
+
+    def __len__(self) -> int:
+        return len(self.models())
+
+    def __iter__(self):
+        return iter(self.models())
+
+    def __contains__(self, pydantic_model) -> bool:
+        return self.get(pydantic_model) is not None
+
+    def __getitem__(self, pydantic_model) -> types.GrapheneObjectType:
+        graphene_class = self.get(pydantic_model)
+        if graphene_class is None:
+            raise KeyError(pydantic_model)
+
+        return graphene_class
+
+    def get(
+        self,
+        pydantic_model: pydantic.BaseModel,
+        graphene_type: types.GrapheneObjectType = None,
+        default=None,
+    ) -> types.GrapheneObjectType:
+        converted = self._types.get(pydantic_model)
+        if not converted:
+            return default
+
+        return converted.get(graphene_type or self.graphene_type, default)
+
+    def register(
+        self,
+        pydantic_model: pydantic.BaseModel,
+        graphene_type: types.GrapheneObjectType,
+        graphene_class: types.GrapheneObjectType,
+    ):
+        converted = self._types.setdefault(pydantic_model, {})
+        converted[graphene_type] = graphene_class
+
+    def models(
+        self, graphene_type: types.GrapheneObjectType = None
+    ) -> typing.List[pydantic.BaseModel]:
+        graphene_type = graphene_type or self.graphene_type
+        return [
+            model
+            for model, converted in list(self._types.items())
+            if graphene_type in converted
+        ]
+
+    def items(self):
+        return [(m, self[m]) for m in self]
+
+    def set_options(self, pydantic_model: pydantic.BaseModel, options):
+        self._options[pydantic_model] = options
+
+    def get_options(self, pydantic_model: pydantic.BaseModel):
+        return self._options.get(pydantic_model)
+
+
+class DerivedTypes:
+    """
+    Graphene types derived from a key, e.g. the connection of a node type,
+    created once by ``create(key)`` as a schema can not have two types with
+    the same name. The types are held by weak references, an entry lives as
+    long as its type is used.
+    """
+
+    def __init__(self, create: typing.Callable[[typing.Any], type]):
+        self._create = create
+        self._types = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> type:
+        with self._lock:
+            derived_type = self._types.get(key)
+            if derived_type is None:
+                derived_type = self._create(key)
+                self._types[key] = derived_type
+
+            return derived_type
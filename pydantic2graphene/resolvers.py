@@ -0,0 +1,93 @@
+import typing
+import weakref
+
+
+def make_field_resolver(name: str, alias: str = None) -> typing.Callable:
+    """
+    Resolver of a converted field, reading the pydantic instance state
+    directly instead of graphene's default dict-then-getattr lookup.
+    Dicts are looked up by field name and then by alias.
+    """
+    alias = alias or name
+
+    def resolve(root, info, *args, **kwargs):
+        try:
+            return root.__dict__[name]
+        except (AttributeError, KeyError):
+            pass
+
+        if isinstance(root, dict):
+            return root.get(name, root.get(alias))
+
+        return getattr(root, name, None)
+
+    resolve.__name__ = f"resolve_{name}"
+    return resolve
+
+
+def make_blocking_resolver(
+    resolver: typing.Callable, get_executor: typing.Callable
+) -> typing.Callable:
+    """
+    Async resolver running ``resolver`` in the thread pool returned by
+    ``get_executor``, so it does not block the event loop.
+    """
+
+    async def resolve(root, info, *args, **kwargs):
+        return await get_executor().run(resolver, root, info, *args, **kwargs)
+
+    resolve.__name__ = getattr(resolver, "__name__", "resolve")
+    return resolve
+
+
+def _index_possible_types(schema, abstract_type_name: str) -> dict:
+    abstract_type = schema.get_type(abstract_type_name)
+    types = {}
+    for object_type in schema.get_possible_types(abstract_type):
+        graphene_type = getattr(object_type, "graphene_type", None)
+        get_model = getattr(graphene_type, "_get_pydantic_model", None)
+        pydantic_model = get_model() if get_model else None
+        if pydantic_model is not None:
+            types.setdefault(pydantic_model, graphene_type)
+
+    return types
+
+
+def _find_by_mro(types: dict, instance_type: type):
+    for base in instance_type.__mro__[1:]:
+        if base in types:
+            return types[base]
+
+    return None
+
+
+def make_resolve_type(fallback: typing.Callable) -> classmethod:
+    """
+    ``resolve_type`` of an interface or union, finding the object type of
+    a model instance with one dict lookup on its class, instead of trying
+    the ``is_type_of`` of every possible type. The model -> object type
+    map is built once per schema from its possible types, subclasses of
+    the models are added to it when first resolved.
+    """
+    types_by_schema = weakref.WeakKeyDictionary()
+
+    def resolve_type(cls, instance, info):
+        types = types_by_schema.get(info.schema)
+        if types is None:
+            types = _index_possible_types(info.schema, cls._meta.name)
+            types_by_schema[info.schema] = types
+
+        instance_type = type(instance)
+        try:
+            graphene_type = types[instance_type]
+        except KeyError:
+            graphene_type = types[instance_type] = _find_by_mro(
+                types, instance_type
+            )
+
+        if graphene_type is None:
+            return fallback(cls, instance, info)
+
+        return graphene_type
+
+    return classmethod(resolve_type)
@@ -0,0 +1,264 @@
+import enum
+import hashlib
+import importlib
+import json
+import os
+import pathlib
+import tempfile
+import typing
+import weakref
+
+import graphene
+import pydantic
+
+from . import errors, fields, plan
+from .version import VERSION
+
+_FORMAT_VERSION = 2
+
+
+class _NotPersistable(Exception):
+    pass
+
+
+def _get_path(obj) -> str:
+    qualname = getattr(obj, "__qualname__", None)
+    if not qualname or "<locals>" in qualname:
+        raise _NotPersistable(obj)
+
+    return f"{obj.__module__}:{qualname}"
+
+
+def _import_path(path: str):
+    module_name, qualname = path.split(":")
+    obj = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+
+    return obj
+
+
+def _describe_fields(pydantic_model: pydantic.BaseModel) -> tuple:
+    return tuple(
+        (
+            field.name,
+            field.alias,
+            repr(field.outer_type_),
+            # same named types with other bases resolve to other types
+            tuple(
+                _describe_type(base)
+                for base in getattr(field.type_, "__mro__", (field.type_,))
+            ),
+            field.shape,
+            field.required,
+            repr(field.default),
+        )
+        for field in pydantic_model.__fields__.values()
+    )
+
+
+def _describe_type(type_) -> str:
+    try:
+        return _get_path(type_)
+    except _NotPersistable:
+        return repr(type_)
+
+
+class SnapshotStore:
+    """
+    Directory of compiled field plans keyed by a fingerprint of each
+    model, so a warm start rebuilds the graphene classes from the stored
+    plans instead of resolving every field type again.
+
+    The fingerprint covers the names, aliases, outer types, resolved
+    type bases, required flags and defaults of the fields, and the
+    registered types; a model whose structure changed is compiled again.
+    It is computed once per model class.
+    """
+
+    def __init__(self, directory: typing.Union[str, pathlib.Path]):
+        self.directory = pathlib.Path(directory)
+        self._registry_descriptions = {}
+        # a model class does not change its fields
+        self._field_descriptions = weakref.WeakKeyDictionary()
+
+    def _describe_type_registry(
+        self, type_registry: fields.TypeRegistry
+    ) -> tuple:
+        key = (type_registry, type_registry.version)
+        description = self._registry_descriptions.get(key)
+        if description is None:
+            description = tuple(
+                sorted(
+                    (_describe_type(k), _describe_type(v[0]), v[1])
+                    for k, v in type_registry.get_registered_types().items()
+                )
+            )
+            self._registry_descriptions = {key: description}
+
+        return description
+
+    def _describe_fields(self, pydantic_model: pydantic.BaseModel) -> tuple:
+        description = self._field_descriptions.get(pydantic_model)
+        if description is None:
+            description = _describe_fields(pydantic_model)
+            self._field_descriptions[pydantic_model] = description
+
+        return description
+
+    def fingerprint(
+        self,
+        pydantic_model: pydantic.BaseModel,
+        type_registry: fields.TypeRegistry = None,
+    ) -> str:
+        type_registry = type_registry or fields.default_type_registry
+        structure = [
+            _FORMAT_VERSION,
+            VERSION,
+            graphene.__version__,
+            str(pydantic.VERSION),
+            _describe_type(pydantic_model),
+            self._describe_type_registry(type_registry),
+            self._describe_fields(pydantic_model),
+        ]
+        return hashlib.sha256(repr(structure).encode()).hexdigest()
+
+    def _get_file(self, fingerprint: str) -> pathlib.Path:
+        return self.directory / f"{fingerprint}.json"
+
+    def load_plan(
+        self, fingerprint: str, convert_enum: typing.Callable
+    ) -> typing.Optional[plan.ModelPlan]:
+        try:
+            data = json.loads(self._get_file(fingerprint).read_text())
+            # fields mostly share a few graphene types
+            import_path = _memoize(_import_path)
+            return plan.ModelPlan(
+                fields=tuple(
+                    _load_field_plan(field, convert_enum, import_path)
+                    for field in data["fields"]
+                )
+            )
+        except (
+            OSError,
+            ValueError,
+            KeyError,
+            TypeError,
+            AttributeError,
+            ImportError,
+        ):
+            return None
+
+    def save_plan(self, fingerprint: str, model_plan: plan.ModelPlan) -> bool:
+        try:
+            data = {"fields": [_dump_field_plan(f) for f in model_plan.fields]}
+        except _NotPersistable:
+            return False
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first, so concurrent workers never read
+        # a partial snapshot
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.directory))
+        with os.fdopen(fd, "w") as tmp_file:
+            json.dump(data, tmp_file)
+        os.replace(tmp_path, str(self._get_file(fingerprint)))
+        return True
+
+    def clear(self):
+        for path in self.directory.glob("*.json"):
+            path.unlink()
+
+
+def _dump_default(default) -> list:
+    """``[enum path, member name]`` or ``[None, value]``."""
+    if isinstance(default, enum.Enum):
+        return [_get_path(type(default)), default.name]
+
+    try:
+        if json.loads(json.dumps(default)) == default:
+            return [None, default]
+    except (TypeError, ValueError):
+        pass
+
+    raise _NotPersistable(default)
+
+
+def _load_default(data: list, import_path: typing.Callable):
+    enum_path, value = data
+    if enum_path is not None:
+        return getattr(import_path(enum_path), value)
+
+    return value
+
+
+def _dump_reference(field_plan: plan.FieldPlan):
+    if field_plan.error:
+        return [type(field_plan.error).__name__, str(field_plan.error)]
+
+    if field_plan.kind == plan.MODEL:
+        return _get_path(field_plan.model)
+
+    if field_plan.kind == plan.UNION:
+        return [_get_path(model) for model in field_plan.model]
+
+    if field_plan.kind == plan.ENUM:
+        return _get_path(field_plan.graphene_type._meta.enum)
+
+    return _get_path(field_plan.graphene_type)
+
+
+def _dump_field_plan(field_plan: plan.FieldPlan) -> list:
+    # a list per field keeps the files small and fast to parse
+    return [
+        field_plan.name,
+        field_plan.alias,
+        field_plan.kind,
+        field_plan.is_list,
+        field_plan.required,
+        _dump_default(field_plan.default),
+        bool(field_plan.error),
+        _dump_reference(field_plan),
+    ]
+
+
+def _memoize(function: typing.Callable) -> typing.Callable:
+    results = {}
+
+    def memoized(arg):
+        if arg not in results:
+            results[arg] = function(arg)
+        return results[arg]
+
+    return memoized
+
+
+def _load_field_plan(
+    data: list,
+    convert_enum: typing.Callable,
+    import_path: typing.Callable = _import_path,
+) -> plan.FieldPlan:
+    name, alias, kind, is_list, required, default, error, reference = data
+    graphene_type = model = None
+    if error:
+        error_class, message = reference
+        error = getattr(errors, error_class)(message)
+    elif kind == plan.MODEL:
+        model = import_path(reference)
+    elif kind == plan.UNION:
+        model = tuple(import_path(path) for path in reference)
+    elif kind == plan.ENUM:
+        graphene_type = convert_enum(import_path(reference))
+    else:
+        graphene_type = import_path(reference)
+
+    return plan.FieldPlan(
+        name,
+        alias,
+        kind,
+        graphene_type,
+        model,
+        is_list,
+        required,
+        _load_default(default, import_path),
+        error or None,
+    )
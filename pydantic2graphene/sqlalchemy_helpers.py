@@ -0,0 +1,59 @@
+import typing
+
+import pydantic
+
+from . import projection
+
+try:
+    # optional dependency
+    import sqlalchemy
+    import sqlalchemy.orm
+except ImportError:
+    sqlalchemy = None
+
+
+def _require_sqlalchemy():
+    if sqlalchemy is None:
+        raise ImportError(
+            "sqlalchemy is required by pydantic2graphene.sqlalchemy_helpers"
+        )
+
+
+def get_column_names(
+    info, pydantic_model: pydantic.BaseModel, orm_model
+) -> typing.List[str]:
+    """
+    Column attributes of ``orm_model`` behind the fields of
+    ``pydantic_model`` selected in ``info``, primary keys first. Fields are
+    matched to the attributes by name, then by alias (as ``orm_mode``
+    does); fields that are not columns, e.g. relationships, are left out.
+    """
+    _require_sqlalchemy()
+    mapper = sqlalchemy.inspect(orm_model)
+    columns = {attr.key for attr in mapper.column_attrs}
+    # the primary key is always loaded, the instances are identified by it
+    names = [
+        mapper.get_property_by_column(column).key
+        for column in mapper.primary_key
+    ]
+
+    for name in projection.get_include(info, pydantic_model):
+        pydantic_field = pydantic_model.__fields__[name]
+        for attr in (name, pydantic_field.alias):
+            if attr in columns:
+                if attr not in names:
+                    names.append(attr)
+                break
+
+    return names
+
+
+def load_only(query, info, pydantic_model: pydantic.BaseModel, orm_model):
+    """
+    Add a ``load_only`` option to ``query`` (an ORM ``Query`` or
+    ``select()``) so only the columns requested in ``info`` are fetched.
+    """
+    names = get_column_names(info, pydantic_model, orm_model)
+    return query.options(
+        sqlalchemy.orm.load_only(*(getattr(orm_model, n) for n in names))
+    )
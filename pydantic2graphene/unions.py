@@ -0,0 +1,37 @@
+import re
+import typing
+
+import graphene
+
+from . import resolvers, types
+from .registry import DerivedTypes
+
+
+def _create_union_type(
+    member_types: typing.Tuple[types.GrapheneObjectType, ...],
+) -> typing.Type[graphene.Union]:
+    base_name = "".join(
+        re.sub("Gql$", "", member_type._meta.name)
+        for member_type in member_types
+    )
+    return type(
+        f"{base_name}UnionGql",
+        (graphene.Union,),
+        {
+            "Meta": type("Meta", (), {"types": member_types}),
+            "resolve_type": resolvers.make_resolve_type(
+                graphene.Union.resolve_type.__func__
+            ),
+        },
+    )
+
+
+# one union per set of members
+_union_types = DerivedTypes(_create_union_type)
+
+
+def get_union_type(
+    member_types: typing.Sequence[types.GrapheneObjectType],
+) -> typing.Type[graphene.Union]:
+    """Union of the converted ``member_types``, e.g. ``DogCatUnionGql``."""
+    return _union_types.get(tuple(member_types))
@@ -0,0 +1,164 @@
+import decimal
+import enum
+import typing
+
+import graphene
+import pydantic
+import pytest
+
+import pydantic2graphene
+from pydantic2graphene import codegen
+
+
+class SpecieEnum(str, enum.Enum):
+    DOG = "DOG"
+    CAT = "CAT"
+
+
+class Pet(pydantic.BaseModel):
+    name: str
+    specie: SpecieEnum = SpecieEnum.DOG
+
+
+class Human(pydantic.BaseModel):
+    name: str
+    age: int = 18
+    pets: typing.List[Pet] = []
+    parent: "Human" = None
+
+
+Human.update_forward_refs()
+
+
+class Price(pydantic.BaseModel):
+    amount: decimal.Decimal = decimal.Decimal("1.5")
+
+
+def run_module(source: str) -> dict:
+    namespace = {}
+    exec(compile(source, "gql_types.py", "exec"), namespace)
+    return namespace
+
+
+class TestGenerateModule:
+    @pytest.mark.parametrize(
+        "graphene_type", [graphene.ObjectType, graphene.InputObjectType]
+    )
+    def test_generated_classes_match_the_converter(
+        self, normalize_sdl, graphene_type
+    ):
+        source = codegen.generate_module([Human], [graphene_type])
+        generated = run_module(source)
+
+        converted = pydantic2graphene.to_graphene(
+            Human, graphene_type, cache=pydantic2graphene.ConversionCache()
+        )
+        assert normalize_sdl(generated[converted.__name__]) == normalize_sdl(
+            converted
+        )
+
+    def test_applies_options(self):
+        source = codegen.generate_module(
+            [Pet],
+            options={
+                Pet: {
+                    "exclude_fields": {"specie"},
+                    "id_field_name": "id",
+                    "class_name": "Animal",
+                }
+            },
+        )
+        fields = run_module(source)["Animal"]._meta.fields
+
+        assert set(fields) == {"name", "id"}
+
+    def test_defaults_built_with_their_class(self):
+        source = codegen.generate_module([Price])
+        assert "default_value=decimal.Decimal('1.5')" in source
+
+        converted = pydantic2graphene.to_graphene(
+            Price, cache=pydantic2graphene.ConversionCache()
+        )
+        generated = run_module(source)[converted.__name__]
+        assert (
+            generated._meta.fields["amount"].default_value
+            == converted._meta.fields["amount"].default_value
+        )
+
+    def test_defaults_that_can_not_be_generated(self):
+        class Money(decimal.Decimal):
+            pass
+
+        class Price(pydantic.BaseModel):
+            amount: decimal.Decimal = Money("1.5")
+
+        with pytest.raises(pydantic2graphene.FieldNotSupported):
+            codegen.generate_module([Price])
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"extra_fields": {"x": graphene.Int()}},
+            {"interfaces": [graphene.relay.Node]},
+            {"inherit_interfaces": True},
+            {"fast_resolvers": True},
+            {"resolvers": {"name": lambda root, info: "rex"}},
+        ],
+    )
+    def test_options_that_can_not_be_generated(self, options):
+        with pytest.raises(pydantic2graphene.InvalidConfigClass):
+            codegen.generate_module([Pet], options={Pet: options})
+
+    def test_local_models_can_not_be_generated(self):
+        class Local(pydantic.BaseModel):
+            name: str
+
+        with pytest.raises(pydantic2graphene.InvalidConfigClass):
+            codegen.generate_module([Local])
+
+    def test_input_types_build_models(self):
+        source = codegen.generate_module([Human], [graphene.InputObjectType])
+        HumanInputGql = run_module(source)["HumanInputGql"]
+
+        human = HumanInputGql.to_pydantic(
+            {"name": "ana", "pets": [{"name": "rex", "specie": "CAT"}]}
+        )
+
+        assert human == Human(
+            name="ana", pets=[Pet(name="rex", specie=SpecieEnum.CAT)]
+        )
+
+    def test_interfaces_resolve_the_object_types(self):
+        source = codegen.generate_module(
+            [Pet], [graphene.Interface, graphene.ObjectType]
+        )
+        generated = run_module(source)
+
+        class PetGql(generated["PetGql"]):
+            class Meta:
+                interfaces = (generated["PetInterfaceGql"],)
+
+        class Query(graphene.ObjectType):
+            pet = graphene.Field(generated["PetInterfaceGql"])
+
+            def resolve_pet(root, info):
+                return Pet(name="rex")
+
+        schema = graphene.Schema(query=Query, types=[PetGql])
+        result = schema.execute("{ pet { __typename name } }")
+
+        assert not result.errors, result.errors
+        assert result.data == {"pet": {"__typename": "PetGql", "name": "rex"}}
+
+
+class TestCodegenCommand:
+    def test_writes_and_checks_the_output(self, tmp_path):
+        output = tmp_path / "gql_types.py"
+        args = ["codegen", __name__, "-o", str(output)]
+
+        assert codegen.main(args + ["--check"]) == 1
+        assert codegen.main(args) == 0
+        assert codegen.main(args + ["--check"]) == 0
+
+        output.write_text(output.read_text() + "\n# edited\n")
+        assert codegen.main(args + ["--check"]) == 1
@@ -1,3 +1,4 @@
+import asyncio
 import collections
 import re
 import typing
@@ -109,6 +110,16 @@ def is_graphene_1_or_2(graphene_version) -> bool:
     return graphene_version[:2] in ["1.", "2."]
 
 
+@pytest.fixture
+def run_async():
+    """Run a coroutine to completion, asyncio.run is not on python 3.6."""
+    loop = asyncio.new_event_loop()
+    try:
+        yield loop.run_until_complete
+    finally:
+        loop.close()
+
+
 @pytest.fixture
 def pydantic_version() -> str:
     return str(pydantic.VERSION)
@@ -0,0 +1,132 @@
+import threading
+import time
+
+import graphene
+import pydantic
+import pytest
+
+import pydantic2graphene
+
+pytestmark = pytest.mark.skipif(
+    graphene.__version__[:1] < "3", reason="async execution needs graphene 3"
+)
+
+
+class Human(pydantic.BaseModel):
+    name: str
+
+
+def execute(run_async, options, humans, query="{ humans { name } }"):
+    HumanGql = pydantic2graphene.to_graphene(
+        Human, options=options, cache=pydantic2graphene.ConversionCache()
+    )
+
+    class Query(graphene.ObjectType):
+        humans = graphene.List(HumanGql)
+
+        def resolve_humans(root, info):
+            return humans
+
+    result = run_async(graphene.Schema(query=Query).execute_async(query))
+    assert not result.errors, result.errors
+    return result.data
+
+
+class TestBlockingResolvers:
+    def test_field_resolver_runs_in_the_pool(self, run_async):
+        executor = pydantic2graphene.BlockingExecutor(max_workers=2)
+        threads = []
+
+        def resolve_name(root, info):
+            threads.append(threading.current_thread().name)
+            return root.name
+
+        data = execute(
+            run_async,
+            {
+                "resolvers": {"name": resolve_name},
+                "blocking_resolvers": {"name"},
+                "blocking_executor": executor,
+            },
+            [Human(name="ana"), Human(name="bob")],
+        )
+
+        assert data == {"humans": [{"name": "ana"}, {"name": "bob"}]}
+        assert all(name.startswith("pydantic2graphene") for name in threads)
+        assert executor.stats() == (2, 0, 0, 2, 0)
+
+    def test_default_resolver_and_default_executor(self, run_async):
+        executor = pydantic2graphene.get_blocking_executor()
+        completed = executor.stats().completed
+
+        data = execute(
+            run_async, {"blocking_resolvers": {"name"}}, [Human(name="ana")]
+        )
+
+        assert data == {"humans": [{"name": "ana"}]}
+        assert executor.stats().completed == completed + 1
+
+    def test_blocking_calls_run_concurrently(self, run_async):
+        executor = pydantic2graphene.BlockingExecutor(max_workers=8)
+
+        def resolve_name(root, info):
+            time.sleep(0.05)
+            return root.name
+
+        start = time.perf_counter()
+        execute(
+            run_async,
+            {
+                "resolvers": {"name": resolve_name},
+                "blocking_resolvers": {"name"},
+                "blocking_executor": executor,
+            },
+            [Human(name=str(i)) for i in range(8)],
+        )
+
+        assert time.perf_counter() - start < 8 * 0.05
+
+    def test_queue_depth(self):
+        executor = pydantic2graphene.BlockingExecutor(max_workers=1)
+        release = threading.Event()
+        executor.submit(release.wait)
+        executor.submit(lambda: None)
+        time.sleep(0.01)
+
+        assert executor.stats().running == 1
+        assert executor.stats().queued == 1
+
+        release.set()
+        executor.shutdown()
+        assert executor.stats().completed == 2
+
+    def test_failed_calls_are_not_completed(self):
+        executor = pydantic2graphene.BlockingExecutor(max_workers=1)
+        future = executor.submit(int, "not a number")
+        with pytest.raises(ValueError):
+            future.result()
+
+        stats = executor.stats()
+        assert (stats.running, stats.completed, stats.failed) == (0, 0, 1)
+        executor.shutdown()
+
+    def test_invalid_blocking_resolvers(self):
+        async def resolve_name(root, info):
+            return root.name
+
+        with pytest.raises(pydantic2graphene.InvalidConfigClass):
+            pydantic2graphene.to_graphene(
+                Human,
+                options={"blocking_resolvers": {"age"}},
+                cache=pydantic2graphene.ConversionCache(),
+            )
+
+        with pytest.raises(pydantic2graphene.InvalidConfigClass):
+            pydantic2graphene.to_graphene(
+                Human,
+                options={
+                    "resolvers": {"name": resolve_name},
+                    "blocking_resolvers": {"name"},
+                },
+                cache=pydantic2graphene.ConversionCache(),
+            )
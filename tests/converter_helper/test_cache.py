@@ -0,0 +1,236 @@
+import concurrent.futures
+import enum
+import gc
+import threading
+import time
+
+import graphene
+import pydantic
+import pytest
+
+import pydantic2graphene
+
+
+class Human(pydantic.BaseModel):
+    name: str
+    age: int
+
+
+class Pet(pydantic.BaseModel):
+    name: str
+
+
+class TestConversionCache:
+    def test_evicts_least_recently_used_entry(self):
+        cache = pydantic2graphene.ConversionCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.stats().evictions == 1
+
+    def test_counts_hits_and_misses(self):
+        cache = pydantic2graphene.ConversionCache()
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+    def test_unbounded_by_default(self):
+        cache = pydantic2graphene.ConversionCache()
+        for i in range(2000):
+            cache.set(i, i)
+
+        assert cache.stats().evictions == 0
+        assert cache.stats().maxsize is None
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            pydantic2graphene.ConversionCache(maxsize=0)
+
+
+class TestToGrapheneCache:
+    def test_returns_cached_class_for_same_options(self):
+        cache = pydantic2graphene.ConversionCache()
+        first = pydantic2graphene.to_graphene(Human, cache=cache)
+        second = pydantic2graphene.to_graphene(Human, cache=cache)
+
+        assert first is second
+        assert cache.stats().hits == 1
+
+    def test_options_are_part_of_the_cache_key(self, normalize_sdl):
+        cache = pydantic2graphene.ConversionCache()
+        full = pydantic2graphene.to_graphene(Human, cache=cache)
+        partial = pydantic2graphene.to_graphene(
+            Human,
+            options={"exclude_fields": {"age"}, "class_name": "HumanName"},
+            cache=cache,
+        )
+
+        assert full is not partial
+        assert normalize_sdl(partial) == normalize_sdl(
+            """
+            type HumanName {
+                name: String!
+            }
+            """
+        )
+
+    def test_extra_fields_are_part_of_the_cache_key(self):
+        cache = pydantic2graphene.ConversionCache()
+        first = pydantic2graphene.to_graphene(
+            Human,
+            options={"extra_fields": {"nickname": graphene.String()}},
+            cache=cache,
+        )
+        second = pydantic2graphene.to_graphene(
+            Human,
+            options={"extra_fields": {"score": graphene.Int()}},
+            cache=cache,
+        )
+
+        assert first is not second
+
+    def test_accepts_a_plain_dict(self):
+        storage = {}
+        value = pydantic2graphene.to_graphene(Human, cache=storage)
+
+        assert value in storage.values()
+
+
+class TestConversionCacheConcurrency:
+    def test_get_or_create_is_single_flight(self):
+        cache = pydantic2graphene.ConversionCache()
+        started = threading.Event()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            started.wait(timeout=1)
+            return object()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [
+                pool.submit(cache.get_or_create, "key", factory)
+                for _ in range(8)
+            ]
+            time.sleep(0.05)
+            started.set()
+            results = {id(f.result()) for f in futures}
+
+        assert len(calls) == 1
+        assert len(results) == 1
+
+    def test_failed_factory_lets_waiters_retry(self):
+        cache = pydantic2graphene.ConversionCache()
+
+        def failing_factory():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_create("key", failing_factory)
+
+        assert cache.get_or_create("key", lambda: 1) == 1
+
+    def test_concurrent_conversions_return_the_same_class(self):
+        cache = pydantic2graphene.ConversionCache()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [
+                pool.submit(pydantic2graphene.to_graphene, Human, cache=cache)
+                for _ in range(32)
+            ]
+            results = {f.result() for f in futures}
+
+        assert len(results) == 1
+
+
+class TestWeakConversionCache:
+    def test_entries_are_dropped_when_the_model_is_collected(self):
+        cache = pydantic2graphene.ConversionCache(weak=True)
+        Tenant = pydantic.create_model("Tenant", name=(str, ...))
+        pydantic2graphene.to_graphene(Tenant, cache=cache)
+        assert len(cache) > 0
+
+        del Tenant
+        gc.collect()
+
+        assert len(cache) == 0
+
+    def test_entries_of_collected_enums_are_dropped(self):
+        cache = pydantic2graphene.ConversionCache(weak=True)
+        Status = enum.Enum("Status", ["OPEN", "CLOSED"])
+        Ticket = pydantic.create_model("Ticket", status=(Status, ...))
+        pydantic2graphene.to_graphene(Ticket, cache=cache)
+        assert len(cache) > 0
+
+        del Ticket, Status
+        gc.collect()
+
+        assert len(cache) == 0
+
+    def test_entries_of_nested_models_are_dropped(self, normalize_sdl):
+        cache = pydantic2graphene.ConversionCache(weak=True)
+        Child = pydantic.create_model("Child", name=(str, ...))
+        Parent = pydantic.create_model("Parent", child=(Child, ...))
+        normalize_sdl(pydantic2graphene.to_graphene(Parent, cache=cache))
+        assert len(cache) > 2
+
+        del Parent, Child
+        gc.collect()
+
+        assert len(cache) == 0
+
+    def test_returns_cached_class_while_the_model_is_alive(self):
+        cache = pydantic2graphene.ConversionCache(weak=True)
+        first = pydantic2graphene.to_graphene(Human, cache=cache)
+
+        assert pydantic2graphene.to_graphene(Human, cache=cache) is first
+
+
+class TestCacheInvalidation:
+    @pytest.mark.parametrize("weak", [False, True])
+    def test_invalidate_removes_all_entries_of_a_model(self, weak):
+        cache = pydantic2graphene.ConversionCache(weak=weak)
+        pydantic2graphene.to_graphene(Pet, cache=cache)
+        pet_entries = len(cache)
+        first = pydantic2graphene.to_graphene(Human, cache=cache)
+        pydantic2graphene.to_graphene(
+            Human, graphene.InputObjectType, cache=cache
+        )
+
+        cache.invalidate(Human)
+
+        assert len(cache) == pet_entries
+        assert pydantic2graphene.to_graphene(Human, cache=cache) is not first
+
+    def test_clear_namespace(self):
+        cache = pydantic2graphene.ConversionCache()
+        pydantic2graphene.to_graphene(
+            Human,
+            options={"cache_namespace": "tenant-b", "class_name": "HumanB"},
+            cache=cache,
+        )
+        tenant_b_entries = len(cache)
+        pydantic2graphene.to_graphene(
+            Human, options={"cache_namespace": "tenant-a"}, cache=cache
+        )
+
+        cache.clear("tenant-a")
+
+        assert len(cache) == tenant_b_entries
+
+    def test_clear_everything(self):
+        cache = pydantic2graphene.ConversionCache()
+        pydantic2graphene.to_graphene(Human, cache=cache)
+
+        cache.clear()
+
+        assert len(cache) == 0
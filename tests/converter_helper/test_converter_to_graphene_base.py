@@ -1,5 +1,8 @@
+import asyncio
+
 import graphene
 import pydantic
+import pytest
 
 import pydantic2graphene
 
@@ -54,3 +57,94 @@ class TestConverterToGrapheneBase:
             }
         """
         assert normalize_sdl(value) == normalize_sdl(expected_value)
+
+    def test_resolve_methods_resolve_the_fields(self):
+        class HumanConverterResolvers(
+            pydantic2graphene.ConverterToGrapheneBase
+        ):
+            class Config:
+                model = Human
+                use_cache = False
+
+            greeting = graphene.String()
+
+            def resolve_greeting(root, info):
+                return f"hi {root.name}"
+
+            @staticmethod
+            def resolve_name(root, info):
+                return root.name.upper()
+
+        HumanGql = HumanConverterResolvers.as_class()
+
+        class Query(graphene.ObjectType):
+            human = graphene.Field(HumanGql)
+
+            def resolve_human(root, info):
+                return Human(name="ana")
+
+        result = graphene.Schema(query=Query).execute(
+            "{ human { name greeting } }"
+        )
+        assert result.data == {"human": {"name": "ANA", "greeting": "hi ana"}}
+
+    @pytest.mark.skipif(
+        graphene.__version__[:1] < "3",
+        reason="async execution needs graphene 3",
+    )
+    def test_async_resolve_methods(self, run_async):
+        class HumanConverterAsync(pydantic2graphene.ConverterToGrapheneBase):
+            class Config:
+                model = Human
+                use_cache = False
+
+            greeting = graphene.String()
+
+            async def resolve_greeting(root, info):
+                await asyncio.sleep(0)
+                return f"hi {root.name}"
+
+        HumanGql = HumanConverterAsync.as_class()
+
+        class Query(graphene.ObjectType):
+            humans = graphene.List(HumanGql)
+
+            def resolve_humans(root, info):
+                return [Human(name="ana"), Human(name="bob")]
+
+        result = run_async(
+            graphene.Schema(query=Query).execute_async(
+                "{ humans { greeting } }"
+            )
+        )
+        assert result.data == {
+            "humans": [{"greeting": "hi ana"}, {"greeting": "hi bob"}]
+        }
+
+    def test_resolvers_of_unknown_fields(self):
+        class HumanConverterInvalid(pydantic2graphene.ConverterToGrapheneBase):
+            class Config:
+                model = Human
+                use_cache = False
+                resolvers = {"age": lambda root, info: 1}
+
+        with pytest.raises(pydantic2graphene.InvalidConfigClass):
+            HumanConverterInvalid.as_class()
+
+    def test_other_resolve_attributes_are_left_alone(self):
+        class HumanConverterHelpers(pydantic2graphene.ConverterToGrapheneBase):
+            class Config:
+                model = Human
+                use_cache = False
+
+            def resolve_age(root, info):
+                return 1
+
+            @classmethod
+            def resolve_name(cls, root, info):
+                return "not a field resolver"
+
+        HumanGql = HumanConverterHelpers.as_class()
+
+        assert not hasattr(HumanGql, "resolve_name")
+        assert not hasattr(HumanGql, "resolve_age")
@@ -0,0 +1,107 @@
+import enum
+import typing
+
+import graphene
+import pydantic
+import pytest
+
+import pydantic2graphene
+
+
+class Color(enum.Enum):
+    RED = "RED"
+    BLUE = "BLUE"
+
+
+class Owner(pydantic.BaseModel):
+    name: str
+
+
+class Pet(pydantic.BaseModel):
+    name: str
+    kind: str = pydantic.Field(alias="type")
+    color: Color
+    owners: typing.List[Owner] = []
+
+
+PETS = [
+    Pet(name="rex", type="dog", color=Color.RED, owners=[Owner(name="ana")]),
+    Pet(name="tom", type="cat", color=Color.BLUE),
+]
+
+
+def execute(pets, options=None):
+    PetGql = pydantic2graphene.to_graphene(
+        Pet, options=options, cache=pydantic2graphene.ConversionCache()
+    )
+
+    class Query(graphene.ObjectType):
+        pets = graphene.List(PetGql)
+
+        def resolve_pets(root, info):
+            return pets
+
+    result = graphene.Schema(query=Query).execute(
+        "{ pets { name kind color owners { name } } }"
+    )
+    assert not result.errors
+    return result.data
+
+
+class TestFastResolvers:
+    def test_attaches_resolvers(self):
+        PetGql = pydantic2graphene.to_graphene(
+            Pet,
+            options={"fast_resolvers": True},
+            cache=pydantic2graphene.ConversionCache(),
+        )
+        assert PetGql.resolve_name(PETS[0], None) == "rex"
+        assert PetGql.resolve_kind(PETS[0], None) == "dog"
+
+    def test_default_resolvers_are_used_by_default(self):
+        PetGql = pydantic2graphene.to_graphene(
+            Pet, cache=pydantic2graphene.ConversionCache()
+        )
+        assert not hasattr(PetGql, "resolve_name")
+
+    def test_same_result_as_default_resolvers(self):
+        assert execute(PETS, {"fast_resolvers": True}) == execute(PETS)
+
+    def test_dicts_by_name_or_alias(self):
+        pets = [
+            {"name": "rex", "kind": "dog", "color": Color.RED},
+            {"name": "tom", "type": "cat", "color": Color.BLUE},
+        ]
+        data = execute(pets, {"fast_resolvers": True})
+        assert [pet["kind"] for pet in data["pets"]] == ["dog", "cat"]
+
+    def test_nested_models_use_the_option(self):
+        PetGql = pydantic2graphene.to_graphene(
+            Pet,
+            options={"fast_resolvers": True},
+            cache=pydantic2graphene.ConversionCache(),
+        )
+        OwnerGql = PetGql._meta.fields["owners"].type.of_type
+
+        assert OwnerGql.resolve_name(PETS[0].owners[0], None) == "ana"
+
+    def test_nested_model_converted_on_its_own(self):
+        cache = pydantic2graphene.ConversionCache()
+        pydantic2graphene.to_graphene(Owner, cache=cache)
+        PetGql = pydantic2graphene.to_graphene(
+            Pet, options={"fast_resolvers": True}, cache=cache
+        )
+
+        with pytest.raises(
+            pydantic2graphene.InvalidConfigClass, match="converted twice"
+        ):
+            PetGql._meta.fields["owners"].type.of_type
+
+    def test_not_attached_to_input_types(self):
+        PetInputGql = pydantic2graphene.to_graphene(
+            Pet,
+            graphene.InputObjectType,
+            options={"fast_resolvers": True},
+            cache=pydantic2graphene.ConversionCache(),
+        )
+        assert not hasattr(PetInputGql, "resolve_name")
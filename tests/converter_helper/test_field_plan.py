@@ -0,0 +1,70 @@
+import enum
+import typing
+
+import graphene
+import pydantic
+import pytest
+
+import pydantic2graphene
+from pydantic2graphene import converter, plan
+
+
+class Color(enum.Enum):
+    RED = "RED"
+
+
+class Tag(pydantic.BaseModel):
+    name: str
+
+
+class Item(pydantic.BaseModel):
+    name: str
+    color: Color
+    tags: typing.List[Tag] = []
+    metadata: dict = None
+
+
+class TestFieldPlan:
+    def test_compiles_every_field(self):
+        model_plan = converter.ToGraphene(
+            Item, cache=pydantic2graphene.ConversionCache()
+        ).get_model_plan()
+        name, color, tags, metadata = model_plan.fields
+
+        assert (name.kind, name.graphene_type) == (
+            plan.SCALAR,
+            graphene.String,
+        )
+        assert color.kind == plan.ENUM
+        assert issubclass(color.graphene_type, graphene.Enum)
+        assert (tags.kind, tags.model, tags.is_list) == (plan.MODEL, Tag, True)
+        assert (tags.required, tags.default) == (False, [])
+        assert isinstance(metadata.error, pydantic2graphene.FieldNotSupported)
+
+    def test_plan_is_shared_between_graphene_types(self, monkeypatch):
+        cache = pydantic2graphene.ConversionCache()
+        calls = []
+        compile_model_plan = plan.compile_model_plan
+
+        def counting_compile(pydantic_model, *args):
+            calls.append(pydantic_model)
+            return compile_model_plan(pydantic_model, *args)
+
+        monkeypatch.setattr(plan, "compile_model_plan", counting_compile)
+        options = {"exclude_fields": {"metadata"}}
+        for graphene_type in (
+            graphene.ObjectType,
+            graphene.InputObjectType,
+            graphene.Interface,
+        ):
+            pydantic2graphene.to_graphene(
+                Item, graphene_type, options=options, cache=cache
+            )
+
+        assert calls.count(Item) == 1
+
+    def test_unsupported_fields_fail_when_emitted(self):
+        with pytest.raises(pydantic2graphene.FieldNotSupported):
+            pydantic2graphene.to_graphene(
+                Item, cache=pydantic2graphene.ConversionCache()
+            )
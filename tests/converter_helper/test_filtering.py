@@ -0,0 +1,237 @@
+import datetime
+import decimal
+import enum
+import typing
+import uuid
+
+import graphene
+import pydantic
+import pytest
+
+import pydantic2graphene
+
+
+class Color(enum.Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class Tag(pydantic.BaseModel):
+    name: str
+
+
+class Item(pydantic.BaseModel):
+    name: str
+    price: float
+    color: Color
+    created_at: datetime.datetime
+    tags: typing.List[Tag] = []
+    main_tag: Tag = None
+
+
+ITEMS = [
+    Item(
+        name="blue pen",
+        price=1.5,
+        color=Color.BLUE,
+        created_at=datetime.datetime(2020, 1, 1),
+    ),
+    Item(
+        name="red pen",
+        price=2.5,
+        color=Color.RED,
+        created_at=datetime.datetime(2021, 1, 1),
+    ),
+    Item(
+        name="pencil",
+        price=0.5,
+        color=Color.RED,
+        created_at=datetime.datetime(2022, 1, 1),
+    ),
+]
+
+
+def filter_items(filters):
+    ItemFilterGql = pydantic2graphene.to_graphene_filter(
+        Item, cache=pydantic2graphene.ConversionCache()
+    )
+    names = []
+
+    class Query(graphene.ObjectType):
+        items = graphene.List(graphene.String, filters=ItemFilterGql())
+
+        def resolve_items(root, info, filters):
+            predicate = ItemFilterGql.to_predicate(filters)
+            names.extend(item.name for item in ITEMS if predicate(item))
+            return names
+
+    result = graphene.Schema(query=Query).execute(
+        f"{{ items(filters: {filters}) }}"
+    )
+    assert not result.errors, result.errors
+    return names
+
+
+class TestToGrapheneFilter:
+    def test_schema(self, normalize_sdl):
+        value = pydantic2graphene.to_graphene_filter(
+            Item, cache=pydantic2graphene.ConversionCache()
+        )
+        expected_value = """
+            input ItemFilterGql {
+                name: StringFilter
+                price: FloatFilter
+                color: ColorFilter
+                createdAt: DateTimeFilter
+            }
+
+            input StringFilter {
+                eq: String
+                in: [String!]
+                contains: String
+            }
+
+            input FloatFilter {
+                eq: Float
+                in: [Float!]
+                gt: Float
+                gte: Float
+                lt: Float
+                lte: Float
+            }
+
+            input ColorFilter {
+                eq: Color
+                in: [Color!]
+            }
+        """
+        value_sdl = normalize_sdl(value)
+        for type_sdl in expected_value.split("\n\n"):
+            assert normalize_sdl(type_sdl) in value_sdl
+
+    def test_eq_and_contains(self):
+        assert filter_items('{name: {contains: "pen"}}') == [
+            "blue pen",
+            "red pen",
+            "pencil",
+        ]
+        assert filter_items('{name: {eq: "pencil"}}') == ["pencil"]
+
+    def test_in_with_enums(self):
+        assert filter_items("{color: {in: [BLUE]}}") == ["blue pen"]
+
+    def test_range(self):
+        assert filter_items("{price: {gte: 1, lt: 2.5}}") == ["blue pen"]
+        assert filter_items(
+            '{createdAt: {gt: "2020-06-01T00:00:00"}, color: {eq: RED}}'
+        ) == ["red pen", "pencil"]
+
+    def test_empty_filter(self):
+        assert len(filter_items("{}")) == len(ITEMS)
+
+
+class Order(pydantic.BaseModel):
+    id: uuid.UUID
+    total: pydantic.condecimal(gt=0)
+
+
+ORDER_IDS = [uuid.UUID(int=1), uuid.UUID(int=2)]
+ORDERS = [
+    Order(id=ORDER_IDS[0], total=decimal.Decimal("1.1")),
+    Order(id=ORDER_IDS[1], total=decimal.Decimal("2.2")),
+]
+
+
+def filter_orders(filters: dict):
+    OrderFilterGql = pydantic2graphene.to_graphene_filter(
+        Order, cache=pydantic2graphene.ConversionCache()
+    )
+    predicate = OrderFilterGql.to_predicate(filters)
+    return [order.id for order in ORDERS if predicate(order)]
+
+
+class PositiveInt(pydantic.ConstrainedInt):
+    gt = 0
+
+
+class Stock(pydantic.BaseModel):
+    count: PositiveInt
+    total: pydantic.condecimal(gt=0)
+
+
+class TestModelTypes:
+    def test_uuid(self):
+        assert filter_orders({"id": {"eq": str(ORDER_IDS[1])}}) == [
+            ORDER_IDS[1]
+        ]
+        assert filter_orders({"id": {"in_": [str(ORDER_IDS[0])]}}) == [
+            ORDER_IDS[0]
+        ]
+
+    def test_decimal(self):
+        assert filter_orders({"total": {"eq": 1.1}}) == [ORDER_IDS[0]]
+        # the operand is not checked against the field constraints
+        assert filter_orders({"total": {"gt": 0}}) == ORDER_IDS
+
+    def test_constrained_subclass(self):
+        StockFilterGql = pydantic2graphene.to_graphene_filter(
+            Stock, cache=pydantic2graphene.ConversionCache()
+        )
+        stock = Stock(count=2, total=decimal.Decimal("1.5"))
+        predicate = StockFilterGql.to_predicate(
+            {"count": {"gt": 0}, "total": {"gte": 1.5}}
+        )
+        assert predicate(stock)
+        assert StockFilterGql._filter_fields["total"][2] is decimal.Decimal
+
+
+def query_rows(filters: dict, names: typing.List[str] = None):
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+    sqlalchemy_orm = pytest.importorskip("sqlalchemy.orm")
+    Base = sqlalchemy_orm.declarative_base()
+
+    class ItemRow(Base):
+        __tablename__ = "items"
+
+        id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+        name = sqlalchemy.Column(sqlalchemy.String)
+        price = sqlalchemy.Column(sqlalchemy.Float)
+
+    engine = sqlalchemy.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    ItemFilterGql = pydantic2graphene.to_graphene_filter(
+        Item, cache=pydantic2graphene.ConversionCache()
+    )
+    clause = ItemFilterGql.to_sqlalchemy(filters, ItemRow)
+
+    with sqlalchemy_orm.Session(engine) as session:
+        session.add_all(
+            ItemRow(name=name, price=1)
+            for name in names or [item.name for item in ITEMS]
+        )
+        query = session.query(ItemRow).filter(clause).order_by(ItemRow.id)
+        return [row.name for row in query]
+
+
+class TestToSqlalchemy:
+    def test_clause(self):
+        assert query_rows(
+            {"name": {"contains": "pen"}, "price": {"lt": 2}}
+        ) == [
+            "blue pen",
+            "red pen",
+            "pencil",
+        ]
+        assert (
+            query_rows({"name": {"contains": "pen"}, "price": {"gt": 2}}) == []
+        )
+
+    def test_empty_filter(self):
+        assert query_rows({}) == [item.name for item in ITEMS]
+
+    def test_contains_wildcards(self):
+        names = ["100% cotton", "1000 cotton", "a_b", "axb"]
+        assert query_rows({"name": {"contains": "0%"}}, names) == [
+            "100% cotton"
+        ]
+        assert query_rows({"name": {"contains": "a_"}}, names) == ["a_b"]
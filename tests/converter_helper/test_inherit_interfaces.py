@@ -0,0 +1,177 @@
+import typing
+
+import graphene
+import pydantic
+import pytest
+
+import pydantic2graphene
+
+
+class Item(pydantic.BaseModel):
+    name: str
+    price: float = None
+
+
+class ItemDB(Item):
+    id: int
+    price: float
+
+
+class PerishableItemDB(ItemDB):
+    expires_in_days: int
+
+
+class Code(str):
+    pass
+
+
+class Tagged(pydantic.BaseModel):
+    code: Code
+
+
+class TaggedDB(Tagged):
+    id: int
+
+
+def code_registry():
+    registry = pydantic2graphene.TypeRegistry(
+        parent=pydantic2graphene.default_type_registry
+    )
+    registry.register_type(Code, graphene.ID)
+    return registry
+
+
+def convert(model):
+    return pydantic2graphene.to_graphene(
+        model,
+        options={"inherit_interfaces": True, "fast_resolvers": True},
+        cache=pydantic2graphene.ConversionCache(),
+    )
+
+
+class TestInheritInterfaces:
+    def test_bases_become_interfaces(self, normalize_sdl, is_graphene_1_or_2):
+        value = convert(PerishableItemDB)
+        expected = """
+            type PerishableItemDBGql implements ItemInterfaceGql & ItemDBInterfaceGql {
+                name: String!
+                price: Float!
+                id: Int!
+                expiresInDays: Int!
+            }
+
+            interface ItemInterfaceGql {
+                name: String!
+                price: Float
+            }
+
+            interface ItemDBInterfaceGql {
+                name: String!
+                price: Float!
+                id: Int!
+            }
+        """  # noqa: E501
+        if is_graphene_1_or_2:
+            expected = """
+                interface ItemDBInterfaceGql {
+                    name: String!
+                    price: Float!
+                    id: Int!
+                }
+
+                interface ItemInterfaceGql {
+                    name: String!
+                    price: Float
+                }
+
+                type PerishableItemDBGql implements ItemInterfaceGql, ItemDBInterfaceGql {
+                    name: String!
+                    price: Float!
+                    id: Int!
+                    expiresInDays: Int!
+                }
+            """  # noqa: E501
+        assert normalize_sdl(value) == normalize_sdl(expected)
+
+    def test_only_new_and_changed_fields_are_declared(self):
+        value = convert(ItemDB)
+        assert set(vars(value)).intersection(Item.__fields__) == {"price"}
+
+        interface = value._meta.interfaces[0]
+        assert value._meta.fields["name"] is interface._meta.fields["name"]
+
+    def test_model_without_bases(self):
+        assert convert(Item)._meta.interfaces == ()
+
+    def test_excluded_base_fields_are_not_exposed(self):
+        with pytest.raises(pydantic2graphene.InvalidConfigClass):
+            pydantic2graphene.to_graphene(
+                ItemDB,
+                options={
+                    "inherit_interfaces": True,
+                    "exclude_fields": {"name"},
+                },
+                cache=pydantic2graphene.ConversionCache(),
+            )
+
+    def test_fields_of_the_model_can_be_excluded(self):
+        value = pydantic2graphene.to_graphene(
+            PerishableItemDB,
+            options={
+                "inherit_interfaces": True,
+                "exclude_fields": {"expires_in_days"},
+            },
+            cache=pydantic2graphene.ConversionCache(),
+        )
+        assert "expires_in_days" not in value._meta.fields
+
+    def test_resolves_through_interface(self):
+        ItemDBGql = convert(ItemDB)
+
+        class Query(graphene.ObjectType):
+            items = graphene.List(ItemDBGql._meta.interfaces[0])
+
+            def resolve_items(root, info) -> typing.List[Item]:
+                return [ItemDB(id=1, name="pen", price=1.5)]
+
+        schema = graphene.Schema(query=Query, types=[ItemDBGql])
+        result = schema.execute("{ items { __typename name } }")
+        assert not result.errors, result.errors
+        assert result.data == {
+            "items": [{"__typename": "ItemDBGql", "name": "pen"}]
+        }
+
+    def test_interfaces_use_the_type_registry(self):
+        value = pydantic2graphene.to_graphene(
+            TaggedDB,
+            options={
+                "inherit_interfaces": True,
+                "type_registry": code_registry(),
+            },
+            cache=pydantic2graphene.ConversionCache(),
+        )
+        interface = value._meta.interfaces[0]
+
+        assert "code" not in vars(value)
+        assert interface._meta.fields["code"].type.of_type is graphene.ID
+        assert value._meta.fields["code"] is interface._meta.fields["code"]
+
+    def test_base_converted_with_another_type_registry(self):
+        with pytest.raises(
+            pydantic2graphene.InvalidConfigClass, match='"code"'
+        ):
+            pydantic2graphene.to_graphene_many(
+                [TaggedDB],
+                options={
+                    TaggedDB: {
+                        "inherit_interfaces": True,
+                        "type_registry": code_registry(),
+                    },
+                    Tagged: {
+                        "type_registry": pydantic2graphene.TypeRegistry(
+                            parent=pydantic2graphene.default_type_registry
+                        )
+                    },
+                },
+                cache=pydantic2graphene.ConversionCache(),
+            )
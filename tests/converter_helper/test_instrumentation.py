@@ -0,0 +1,124 @@
+import graphene
+import pydantic
+import pytest
+
+import pydantic2graphene
+from pydantic2graphene import converter
+
+
+class Owner(pydantic.BaseModel):
+    name: str
+
+
+class Pet(pydantic.BaseModel):
+    name: str
+    age: int
+    owner: Owner
+
+
+class RecordingHooks(pydantic2graphene.ConversionHooks):
+    def __init__(self):
+        self.events = []
+
+    def on_model_start(self, pydantic_model, graphene_type):
+        self.events.append(("start", pydantic_model))
+
+    def on_field_resolved(
+        self, pydantic_model, graphene_type, field_plan, elapsed
+    ):
+        assert elapsed >= 0
+        self.events.append(("field", field_plan.name))
+
+    def on_cache_hit(self, cache_key):
+        if cache_key.graphene_type is graphene.ObjectType:
+            self.events.append(("hit", cache_key.model))
+
+    def on_cache_miss(self, cache_key):
+        if cache_key.graphene_type is graphene.ObjectType:
+            self.events.append(("miss", cache_key.model))
+
+    def on_class_created(
+        self, pydantic_model, graphene_type, graphene_class, elapsed
+    ):
+        assert elapsed >= 0
+        self.events.append(("created", graphene_class.__name__))
+
+
+class TestConversionHooks:
+    def test_events_of_a_conversion(self):
+        hooks = RecordingHooks()
+        cache = pydantic2graphene.ConversionCache()
+        converter.ToGraphene(Pet, cache=cache, hooks=[hooks]).convert()
+
+        assert hooks.events == [
+            ("miss", Pet),
+            ("start", Pet),
+            ("field", "name"),
+            ("field", "age"),
+            ("field", "owner"),
+            ("created", "PetGql"),
+        ]
+
+        hooks.events.clear()
+        converter.ToGraphene(Pet, cache=cache, hooks=[hooks]).convert()
+        assert hooks.events == [("hit", Pet)]
+
+    def test_nested_models_use_the_same_hooks(self):
+        hooks = RecordingHooks()
+        PetGql = converter.ToGraphene(
+            Pet, cache=pydantic2graphene.ConversionCache(), hooks=[hooks]
+        ).convert()
+        hooks.events.clear()
+
+        graphene.Schema(query=PetGql)
+
+        assert ("created", "OwnerGql") in hooks.events
+
+    def test_global_hooks(self):
+        hooks = RecordingHooks()
+        pydantic2graphene.add_hooks(hooks)
+        try:
+            pydantic2graphene.to_graphene(
+                Owner, cache=pydantic2graphene.ConversionCache()
+            )
+        finally:
+            pydantic2graphene.remove_hooks(hooks)
+
+        pydantic2graphene.to_graphene(
+            Owner, cache=pydantic2graphene.ConversionCache()
+        )
+        assert hooks.events.count(("created", "OwnerGql")) == 1
+
+    def test_remove_not_registered_hooks(self):
+        with pytest.raises(ValueError):
+            pydantic2graphene.remove_hooks(RecordingHooks())
+
+
+class TestStats:
+    def test_stats(self):
+        pydantic2graphene.reset_stats()
+        cache = pydantic2graphene.ConversionCache()
+        pydantic2graphene.to_graphene(Pet, cache=cache)
+        pydantic2graphene.to_graphene(Pet, cache=cache)
+
+        stats = pydantic2graphene.stats()
+        pet_stats = stats.models[f"{__name__}.Pet"]
+        assert stats.models_converted == 1
+        assert pet_stats.conversions == 1
+        assert pet_stats.fields == 3
+        assert pet_stats.time > 0
+        # the class lookups, not the ones of the field plan
+        assert stats.cache_hits == 1
+        assert stats.cache_misses == 1
+        assert stats.cache_hit_ratio == 0.5
+
+    def test_reset_stats(self):
+        pydantic2graphene.to_graphene(
+            Pet, cache=pydantic2graphene.ConversionCache()
+        )
+        pydantic2graphene.reset_stats()
+
+        stats = pydantic2graphene.stats()
+        assert stats.models_converted == 0
+        assert stats.cache_hits == stats.cache_misses == 0
+        assert stats.cache_hit_ratio == 0.0
@@ -0,0 +1,93 @@
+import graphene
+import pydantic
+
+import pydantic2graphene
+
+
+class Animal(pydantic.BaseModel):
+    name: str
+
+
+class Dog(Animal):
+    good_boy: bool
+
+
+class Cat(Animal):
+    lives: int
+
+
+def build_schema(animals):
+    cache = pydantic2graphene.ConversionCache()
+    AnimalGql = pydantic2graphene.to_graphene(
+        Animal, graphene.Interface, cache=cache
+    )
+    options = {"interfaces": [AnimalGql]}
+    DogGql = pydantic2graphene.to_graphene(Dog, options=options, cache=cache)
+    CatGql = pydantic2graphene.to_graphene(Cat, options=options, cache=cache)
+
+    class Query(graphene.ObjectType):
+        animals = graphene.List(AnimalGql)
+
+        def resolve_animals(root, info):
+            return animals
+
+    return graphene.Schema(query=Query, types=[DogGql, CatGql])
+
+
+QUERY = """
+{
+    animals {
+        __typename
+        name
+        ... on DogGql { goodBoy }
+        ... on CatGql { lives }
+    }
+}
+"""
+
+
+class TestInterfaces:
+    def test_implements_interface(self):
+        schema = build_schema([])
+        assert "type DogGql implements AnimalInterfaceGql" in str(schema)
+
+    def test_resolves_concrete_types(self):
+        schema = build_schema(
+            [Dog(name="Rex", good_boy=True), Cat(name="Tom", lives=7)]
+        )
+        result = schema.execute(QUERY)
+        assert not result.errors, result.errors
+        assert result.data == {
+            "animals": [
+                {"__typename": "DogGql", "name": "Rex", "goodBoy": True},
+                {"__typename": "CatGql", "name": "Tom", "lives": 7},
+            ]
+        }
+
+    def test_resolves_subclasses_of_the_models(self):
+        class Puppy(Dog):
+            pass
+
+        schema = build_schema([Puppy(name="Rex", good_boy=True)])
+        result = schema.execute(QUERY)
+        assert not result.errors, result.errors
+        assert result.data["animals"][0]["__typename"] == "DogGql"
+
+    def test_object_types_do_not_check_the_root_type(self):
+        class DogDB(pydantic.BaseModel):
+            name: str
+            good_boy: bool
+
+        DogGql = pydantic2graphene.to_graphene(
+            Dog, cache=pydantic2graphene.ConversionCache()
+        )
+
+        class Query(graphene.ObjectType):
+            dog = graphene.Field(DogGql)
+
+            def resolve_dog(root, info):
+                return DogDB(name="Rex", good_boy=True)
+
+        result = graphene.Schema(query=Query).execute("{ dog { name } }")
+        assert not result.errors, result.errors
+        assert result.data == {"dog": {"name": "Rex"}}
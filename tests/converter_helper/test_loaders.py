@@ -0,0 +1,139 @@
+import typing
+
+import graphene
+import pydantic
+import pytest
+
+import pydantic2graphene
+
+graphene_3_only = pytest.mark.skipif(
+    graphene.__version__[:1] < "3", reason="asyncio loaders need graphene 3"
+)
+graphene_2_only = pytest.mark.skipif(
+    graphene.__version__[:1] >= "3", reason="promise loaders are graphene 2"
+)
+
+
+class Toy(pydantic.BaseModel):
+    name: str
+
+
+class Pet(pydantic.BaseModel):
+    id: int
+    name: str
+    toys: typing.List[Toy] = []
+
+
+TOYS = {1: [Toy(name="ball")], 2: [Toy(name="bone"), Toy(name="rope")]}
+
+
+def make_schema(batch_load_fn):
+    class PetConverter(pydantic2graphene.ConverterToGrapheneBase):
+        class Config:
+            model = Pet
+            id_field_name = "id"
+            loaders = {"toys": batch_load_fn}
+
+    PetGql = PetConverter.as_class()
+
+    class Query(graphene.ObjectType):
+        pets = graphene.List(PetGql)
+
+        def resolve_pets(root, info):
+            return [Pet(id=1, name="rex"), Pet(id=2, name="tom")]
+
+    return graphene.Schema(query=Query)
+
+
+def execute(run_async, schema, context):
+    result = run_async(
+        schema.execute_async(
+            "{ pets { name toys { name } } }", context_value=context
+        )
+    )
+    assert not result.errors, result.errors
+    return result.data
+
+
+@graphene_3_only
+class TestLoaders:
+    def test_children_are_loaded_in_one_batch(self, run_async):
+        calls = []
+
+        def load_toys(pet_ids):
+            calls.append(pet_ids)
+            return [TOYS[pet_id] for pet_id in pet_ids]
+
+        data = execute(run_async, make_schema(load_toys), {})
+
+        assert calls == [[1, 2]]
+        assert data["pets"][1] == {
+            "name": "tom",
+            "toys": [{"name": "bone"}, {"name": "rope"}],
+        }
+
+    def test_async_batch_load_fn(self, run_async):
+        async def load_toys(pet_ids):
+            return [TOYS[pet_id] for pet_id in pet_ids]
+
+        data = execute(run_async, make_schema(load_toys), {})
+
+        assert data["pets"][0]["toys"] == [{"name": "ball"}]
+
+    def test_loaders_are_request_scoped(self, run_async):
+        calls = []
+
+        def load_toys(pet_ids):
+            calls.append(pet_ids)
+            return [TOYS[pet_id] for pet_id in pet_ids]
+
+        schema = make_schema(load_toys)
+        execute(run_async, schema, {})
+        execute(run_async, schema, {})
+
+        assert len(calls) == 2
+
+    def test_errors_are_set_on_the_fields(self, run_async):
+        def load_toys(pet_ids):
+            return []
+
+        result = run_async(
+            make_schema(load_toys).execute_async(
+                "{ pets { toys { name } } }", context_value={}
+            )
+        )
+
+        assert "returned 0 values for 2 keys" in result.errors[0].message
+
+
+@graphene_2_only
+class TestPromiseLoaders:
+    def test_children_are_loaded_in_one_batch(self):
+        calls = []
+
+        def load_toys(pet_ids):
+            calls.append(pet_ids)
+            return [TOYS[pet_id] for pet_id in pet_ids]
+
+        schema = make_schema(load_toys)
+        for _ in range(2):
+            result = schema.execute(
+                "{ pets { name toys { name } } }", context_value={}
+            )
+            assert not result.errors, result.errors
+
+        assert calls == [[1, 2], [1, 2]]
+        assert result.data["pets"][1] == {
+            "name": "tom",
+            "toys": [{"name": "bone"}, {"name": "rope"}],
+        }
+
+
+class TestLoadersConfig:
+    def test_needs_id_field_name(self):
+        with pytest.raises(pydantic2graphene.InvalidConfigClass):
+            pydantic2graphene.to_graphene(
+                Pet,
+                options={"loaders": {"toys": lambda keys: keys}},
+                cache=pydantic2graphene.ConversionCache(),
+            )
@@ -0,0 +1,177 @@
+import typing
+
+import graphene
+import pydantic
+import pytest
+
+import pydantic2graphene
+
+
+class Pet(pydantic.BaseModel):
+    name: str
+
+
+class Owner(pydantic.BaseModel):
+    name: str
+    pets: typing.List[Pet] = []
+
+
+PETS = [Pet(name=f"pet {i}") for i in range(5)]
+
+
+def execute(schema, query):
+    result = schema.execute(query)
+    assert not result.errors, result.errors
+    return result.data
+
+
+PAGE_QUERY = """{
+  pets(first: 2%s) {
+    edges { node { name } cursor }
+    pageInfo { hasNextPage hasPreviousPage endCursor }
+  }
+}"""
+
+
+def get_pages(resolve):
+    cache = pydantic2graphene.ConversionCache()
+    PetConnection = pydantic2graphene.to_graphene_connection(Pet, cache=cache)
+
+    class Query(graphene.ObjectType):
+        pets = graphene.relay.ConnectionField(PetConnection)
+
+        def resolve_pets(root, info, **kwargs):
+            return resolve(PetConnection, **kwargs)
+
+    schema = graphene.Schema(query=Query)
+    pages = []
+    after = ""
+    while True:
+        data = execute(schema, PAGE_QUERY % after)["pets"]
+        pages.append([edge["node"]["name"] for edge in data["edges"]])
+        if not data["pageInfo"]["hasNextPage"]:
+            return pages
+        after = f', after: "{data["pageInfo"]["endCursor"]}"'
+
+
+class TestConnections:
+    def test_connection_type(self):
+        PetConnection = pydantic2graphene.to_graphene_connection(
+            Pet, cache=pydantic2graphene.ConversionCache()
+        )
+
+        assert PetConnection.__name__ == "PetConnection"
+        assert PetConnection.Edge.__name__ == "PetEdge"
+
+    def test_connection_fields_option(self):
+        OwnerGql = pydantic2graphene.to_graphene(
+            Owner,
+            options={"connection_fields": {"pets"}},
+            cache=pydantic2graphene.ConversionCache(),
+        )
+
+        class Query(graphene.ObjectType):
+            owner = graphene.Field(OwnerGql)
+
+            def resolve_owner(root, info):
+                return Owner(name="ana", pets=PETS)
+
+        data = execute(
+            graphene.Schema(query=Query),
+            '{ owner { pets(first: 1, after: "YXJyYXljb25uZWN0aW9uOjA=") '
+            "{ edges { node { name } } } } }",
+        )
+        assert data == {
+            "owner": {"pets": {"edges": [{"node": {"name": "pet 1"}}]}}
+        }
+
+    def test_connection_fields_must_be_lists_of_models(self):
+        with pytest.raises(pydantic2graphene.FieldNotSupported):
+            pydantic2graphene.to_graphene(
+                Owner,
+                options={"connection_fields": {"name"}},
+                cache=pydantic2graphene.ConversionCache(),
+            )
+
+
+class TestPaginate:
+    def test_sequence(self):
+        pages = get_pages(
+            lambda connection, **kwargs: pydantic2graphene.paginate(
+                connection, PETS, **kwargs
+            )
+        )
+
+        assert pages == [["pet 0", "pet 1"], ["pet 2", "pet 3"], ["pet 4"]]
+
+    def test_last_and_before(self):
+        PetConnection = pydantic2graphene.to_graphene_connection(
+            Pet, cache=pydantic2graphene.ConversionCache()
+        )
+        page = pydantic2graphene.paginate(PetConnection, PETS, last=2)
+
+        assert [edge.node.name for edge in page.edges] == ["pet 3", "pet 4"]
+        assert page.page_info.has_previous_page
+        assert not page.page_info.has_next_page
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            pydantic2graphene.paginate(None, PETS, first=-1)
+
+        with pytest.raises(ValueError):
+            pydantic2graphene.paginate(None, PETS, after="invalid")
+
+
+class TestPaginateQuery:
+    @pytest.fixture
+    def session(self):
+        sqlalchemy = pytest.importorskip("sqlalchemy")
+        sqlalchemy_orm = pytest.importorskip("sqlalchemy.orm")
+        Base = sqlalchemy_orm.declarative_base()
+
+        class PetRow(Base):
+            __tablename__ = "pets"
+
+            id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+            name = sqlalchemy.Column(sqlalchemy.String)
+
+        engine = sqlalchemy.create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        statements = []
+        sqlalchemy.event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+        with sqlalchemy_orm.Session(engine) as session:
+            session.add_all(
+                PetRow(id=i, name=pet.name) for i, pet in enumerate(PETS)
+            )
+            session.commit()
+            statements.clear()
+            session.PetRow = PetRow
+            session.statements = statements
+            yield session
+
+    def test_limit_offset(self, session):
+        query = session.query(session.PetRow).order_by(session.PetRow.id)
+        pages = get_pages(
+            lambda connection, **kwargs: pydantic2graphene.paginate(
+                connection, query, **kwargs
+            )
+        )
+
+        assert pages == [["pet 0", "pet 1"], ["pet 2", "pet 3"], ["pet 4"]]
+        assert all("LIMIT" in statement for statement in session.statements)
+
+    def test_keyset(self, session):
+        query = session.query(session.PetRow)
+        pages = get_pages(
+            lambda connection, **kwargs: pydantic2graphene.paginate(
+                connection, query, keyset=session.PetRow.id, **kwargs
+            )
+        )
+
+        assert pages == [["pet 0", "pet 1"], ["pet 2", "pet 3"], ["pet 4"]]
+        assert "LIMIT" in session.statements[-1]
+        assert "pets.id >" in session.statements[-1]
@@ -0,0 +1,150 @@
+import typing
+
+import graphene
+import pydantic
+
+import pydantic2graphene
+
+
+class Tag(pydantic.BaseModel):
+    name: str
+    color: str = "red"
+
+
+class Owner(pydantic.BaseModel):
+    first_name: str
+    last_name: str
+
+
+class Item(pydantic.BaseModel):
+    name: str
+    is_offer: bool
+    price: float
+    owner: Owner
+    tags: typing.List[Tag] = []
+
+
+ITEM = Item(
+    name="pen",
+    is_offer=True,
+    price=1.5,
+    owner=Owner(first_name="ana", last_name="lee"),
+    tags=[Tag(name="a"), Tag(name="b")],
+)
+
+
+def get_includes(
+    query, pydantic_model=Item, variables=None, auto_camelcase=True
+):
+    cache = pydantic2graphene.ConversionCache()
+    ItemGql = pydantic2graphene.to_graphene(
+        Item,
+        cache=cache,
+        options={"extra_fields": {"slug": graphene.String()}},
+    )
+    includes = []
+
+    class Query(graphene.ObjectType):
+        item = graphene.Field(ItemGql)
+
+        def resolve_item(root, info):
+            includes.append(
+                pydantic2graphene.get_include(info, pydantic_model)
+            )
+            return ITEM
+
+    schema = graphene.Schema(query=Query, auto_camelcase=auto_camelcase)
+    result = schema.execute(query, variables=variables)
+    assert not result.errors, result.errors
+    return includes
+
+
+class TestGetInclude:
+    def test_nested_and_list_fields(self):
+        (include,) = get_includes(
+            "{ item { name isOffer owner { firstName } tags { name } } }"
+        )
+
+        assert include == {
+            "name": ...,
+            "is_offer": ...,
+            "owner": {"first_name": ...},
+            "tags": {"__all__": {"name": ...}},
+        }
+        assert ITEM.dict(include=include) == {
+            "name": "pen",
+            "is_offer": True,
+            "owner": {"first_name": "ana"},
+            "tags": [{"name": "a"}, {"name": "b"}],
+        }
+
+    def test_schema_without_auto_camelcase(self):
+        (include,) = get_includes(
+            "{ item { is_offer owner { first_name } } }",
+            auto_camelcase=False,
+        )
+
+        assert include == {"is_offer": ..., "owner": {"first_name": ...}}
+
+    def test_fragments(self):
+        (include,) = get_includes(
+            """
+            { item { ...itemFields ... on ItemGql { tags { color } } } }
+            fragment itemFields on ItemGql { name tags { name } }
+            """
+        )
+
+        assert include == {
+            "name": ...,
+            "tags": {"__all__": {"name": ..., "color": ...}},
+        }
+
+    def test_fields_not_on_the_model_are_left_out(self):
+        (include,) = get_includes("{ item { __typename slug price } }")
+
+        assert include == {"price": ...}
+
+    def test_without_model(self):
+        (include,) = get_includes(
+            "{ item { isOffer owner { lastName } } }", pydantic_model=None
+        )
+
+        assert include == {"is_offer": ..., "owner": {"last_name": ...}}
+
+    def test_skip_and_include_directives(self):
+        query = """
+            query ($withOwner: Boolean!) {
+                item {
+                    name @skip(if: true)
+                    price
+                    owner @include(if: $withOwner) { firstName }
+                }
+            }
+        """
+
+        (include,) = get_includes(query, variables={"withOwner": False})
+        assert include == {"price": ...}
+
+        (include,) = get_includes(query, variables={"withOwner": True})
+        assert include == {"price": ..., "owner": {"first_name": ...}}
+
+    def test_cached_per_operation(self):
+        ItemGql = pydantic2graphene.to_graphene(
+            Item, cache=pydantic2graphene.ConversionCache()
+        )
+        includes = []
+
+        class Query(graphene.ObjectType):
+            items = graphene.List(ItemGql)
+
+            def resolve_items(root, info):
+                includes.append(pydantic2graphene.get_include(info, Item))
+                includes.append(pydantic2graphene.get_include(info, Item))
+                return [ITEM]
+
+        schema = graphene.Schema(query=Query)
+        assert not schema.execute("{ items { name } }").errors
+        assert not schema.execute("{ items { price } }").errors
+
+        assert includes[0] is includes[1]
+        assert includes[2] == {"price": ...}
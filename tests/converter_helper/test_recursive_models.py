@@ -0,0 +1,93 @@
+import typing
+
+import graphene
+import pydantic
+
+import pydantic2graphene
+
+
+class Node(pydantic.BaseModel):
+    name: str
+    children: typing.List["Node"] = []
+
+
+Node.update_forward_refs()
+
+
+class Author(pydantic.BaseModel):
+    name: str
+    books: typing.List["Book"] = []
+
+
+class Book(pydantic.BaseModel):
+    title: str
+    author: Author = None
+
+
+Author.update_forward_refs()
+
+
+class TestRecursiveModels:
+    def test_self_referencing_model(self, normalize_sdl):
+        value = pydantic2graphene.to_graphene(
+            Node, cache=pydantic2graphene.ConversionCache()
+        )
+        expected_value = """
+            type NodeGql {
+                name: String!
+                children: [NodeGql]
+            }
+        """
+        assert normalize_sdl(value) == normalize_sdl(expected_value)
+
+    def test_mutually_referencing_models(self, normalize_sdl):
+        value = pydantic2graphene.to_graphene(
+            Author, cache=pydantic2graphene.ConversionCache()
+        )
+        expected_value = """
+            type AuthorGql {
+                name: String!
+                books: [BookGql]
+            }
+
+            type BookGql {
+                title: String!
+                author: AuthorGql
+            }
+        """
+        assert normalize_sdl(value) == normalize_sdl(expected_value)
+
+    def test_self_referencing_input_type(
+        self, normalize_sdl, is_graphene_1_or_2
+    ):
+        value = pydantic2graphene.to_graphene(
+            Node,
+            graphene.InputObjectType,
+            cache=pydantic2graphene.ConversionCache(),
+        )
+        expected_value = """
+            input NodeInputGql {
+                name: String!
+                children: [NodeInputGql]
+            }
+        """
+        if is_graphene_1_or_2:
+            expected_value = """
+                input NodeInputGql {
+                    name: String!
+                    children: [NodeInputGql] = []
+                }
+            """
+        assert normalize_sdl(value) == normalize_sdl(expected_value)
+
+    def test_nested_models_are_converted_when_the_schema_is_built(self):
+        cache = pydantic2graphene.ConversionCache()
+        registry = pydantic2graphene.ModelRegistry()
+        AuthorGql = pydantic2graphene.converter.ToGraphene(
+            Author, cache=cache, registry=registry
+        ).convert()
+        assert Book not in registry
+
+        graphene.Schema(query=AuthorGql)
+
+        assert Book in registry
@@ -0,0 +1,125 @@
+import enum
+import typing
+
+import pydantic
+
+import pydantic2graphene
+from pydantic2graphene import plan
+
+
+class Color(enum.Enum):
+    RED = "RED"
+    BLUE = "BLUE"
+
+
+class Tag(pydantic.BaseModel):
+    name: str
+
+
+class Item(pydantic.BaseModel):
+    name: str
+    color: Color = Color.RED
+    tags: typing.List[Tag] = []
+    price: float = None
+
+
+class Note(pydantic.BaseModel):
+    text: str
+
+
+class Pin(pydantic.BaseModel):
+    target: typing.Union[Tag, Note]
+
+
+def convert(model, snapshot):
+    return pydantic2graphene.to_graphene(
+        model,
+        options={"snapshot": snapshot},
+        cache=pydantic2graphene.ConversionCache(),
+    )
+
+
+class TestSnapshotStore:
+    def test_warm_start_uses_the_stored_plans(
+        self, tmp_path, monkeypatch, normalize_sdl
+    ):
+        cold = convert(Item, str(tmp_path))
+        cold_sdl = normalize_sdl(cold)  # converts the nested Tag model
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+        def fail(*args):
+            raise AssertionError("the plan should come from the snapshot")
+
+        monkeypatch.setattr(plan, "compile_model_plan", fail)
+        warm = convert(Item, str(tmp_path))
+
+        assert normalize_sdl(warm) == cold_sdl
+
+    def test_warm_start_restores_unions(
+        self, tmp_path, monkeypatch, normalize_sdl
+    ):
+        cold_sdl = normalize_sdl(convert(Pin, str(tmp_path)))
+
+        def fail(*args):
+            raise AssertionError("the plan should come from the snapshot")
+
+        monkeypatch.setattr(plan, "compile_model_plan", fail)
+        warm = convert(Pin, str(tmp_path))
+
+        assert normalize_sdl(warm) == cold_sdl
+
+    def test_fingerprint_changes_with_the_model_structure(self, tmp_path):
+        store = pydantic2graphene.SnapshotStore(tmp_path)
+
+        class Changed(pydantic.BaseModel):
+            name: str
+            color: Color = Color.BLUE
+
+        assert store.fingerprint(Item) == store.fingerprint(Item)
+        assert store.fingerprint(Item) != store.fingerprint(Changed)
+
+    def test_fingerprint_changes_with_the_field_type_bases(self, tmp_path):
+        store = pydantic2graphene.SnapshotStore(tmp_path)
+
+        def make_model(base: type):
+            # same name and module, e.g. a class edited in another module
+            Code = type("Code", (base,), {"__module__": __name__})
+            return pydantic.create_model("Model", code=(Code, ...))
+
+        assert store.fingerprint(make_model(str)) != store.fingerprint(
+            make_model(int)
+        )
+
+    def test_fingerprint_changes_with_the_type_registry(self, tmp_path):
+        store = pydantic2graphene.SnapshotStore(tmp_path)
+        registry = pydantic2graphene.TypeRegistry(
+            parent=pydantic2graphene.default_type_registry
+        )
+        before = store.fingerprint(Item, registry)
+
+        registry.register_type(float, pydantic2graphene.fields.graphene.String)
+
+        assert store.fingerprint(Item, registry) != before
+
+    def test_plans_referring_to_local_models_are_not_stored(self, tmp_path):
+        class Local(pydantic.BaseModel):
+            name: str
+
+        class Parent(pydantic.BaseModel):
+            child: Local
+
+        convert(Parent, str(tmp_path))
+
+        assert list(tmp_path.glob("*.json")) == []
+
+    def test_corrupted_snapshot_is_compiled_again(
+        self, tmp_path, normalize_sdl
+    ):
+        store = pydantic2graphene.SnapshotStore(tmp_path)
+        convert(Tag, store)
+        for path in tmp_path.glob("*.json"):
+            path.write_text("{")
+
+        value = convert(Tag, store)
+
+        assert "name:String!" in normalize_sdl(value)
@@ -0,0 +1,90 @@
+import graphene
+import pydantic
+import pytest
+
+import pydantic2graphene
+from pydantic2graphene import sqlalchemy_helpers
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+sqlalchemy_orm = pytest.importorskip("sqlalchemy.orm")
+
+Base = sqlalchemy_orm.declarative_base()
+
+
+class ItemRow(Base):
+    __tablename__ = "items"
+
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String)
+    description = sqlalchemy.Column(sqlalchemy.String)
+    is_offer = sqlalchemy.Column(sqlalchemy.Boolean)
+
+
+class Item(pydantic.BaseModel):
+    id: int
+    name: str
+    description: str
+    offer: bool = pydantic.Field(alias="is_offer")
+
+    class Config:
+        orm_mode = True
+
+
+@pytest.fixture
+def session():
+    engine = sqlalchemy.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with sqlalchemy_orm.Session(engine) as session:
+        session.add(
+            ItemRow(id=1, name="pen", description="blue", is_offer=True)
+        )
+        session.commit()
+        yield session
+
+
+def execute(query, resolve):
+    ItemGql = pydantic2graphene.to_graphene(
+        Item, cache=pydantic2graphene.ConversionCache()
+    )
+
+    class Query(graphene.ObjectType):
+        items = graphene.List(ItemGql)
+
+        def resolve_items(root, info):
+            return resolve(info)
+
+    result = graphene.Schema(query=Query).execute(query)
+    assert not result.errors, result.errors
+    return result.data
+
+
+class TestLoadOnly:
+    def test_column_names(self):
+        names = []
+
+        def resolve(info):
+            names.extend(
+                sqlalchemy_helpers.get_column_names(info, Item, ItemRow)
+            )
+            return []
+
+        execute("{ items { offer name } }", resolve)
+
+        assert names == ["id", "is_offer", "name"]
+
+    def test_only_requested_columns_are_loaded(self, session):
+        rows = []
+
+        def resolve(info):
+            query = sqlalchemy_helpers.load_only(
+                session.query(ItemRow), info, Item, ItemRow
+            )
+            rows.extend(query.all())
+            return rows
+
+        data = execute("{ items { name } }", resolve)
+
+        assert data == {"items": [{"name": "pen"}]}
+        loaded = set(rows[0].__dict__)
+        assert {"id", "name"} <= loaded
+        assert not {"description", "is_offer"} & loaded
@@ -0,0 +1,89 @@
+import sys
+import typing
+
+import graphene
+import pydantic
+
+import pydantic2graphene
+
+
+class Toy(pydantic.BaseModel):
+    name: str
+
+
+class Pet(pydantic.BaseModel):
+    name: str
+    toys: typing.List[Toy] = []
+
+
+class Human(pydantic.BaseModel):
+    name: str
+    pets: typing.List[Pet] = []
+
+
+class TestToGrapheneMany:
+    def test_converts_nested_models(self):
+        registry = pydantic2graphene.to_graphene_many(
+            [Human], cache=pydantic2graphene.ConversionCache()
+        )
+
+        assert set(registry) == {Human, Pet, Toy}
+        assert registry[Human].__name__ == "HumanGql"
+        pets_field = registry[Human]._meta.fields["pets"]
+        assert pets_field.type.of_type is registry[Pet]
+
+    def test_converts_every_model_of_a_module(self):
+        registry = pydantic2graphene.to_graphene_many(
+            sys.modules[__name__], cache=pydantic2graphene.ConversionCache()
+        )
+
+        assert set(registry) == {Human, Pet, Toy}
+
+    def test_nested_models_use_their_own_options(self, normalize_sdl):
+        registry = pydantic2graphene.to_graphene_many(
+            [Human],
+            options={
+                Pet: {"exclude_fields": {"toys"}, "class_name": "PetName"}
+            },
+            cache=pydantic2graphene.ConversionCache(),
+        )
+        expected_value = """
+            type HumanGql {
+                name: String!
+                pets: [PetName]
+            }
+
+            type PetName {
+                name: String!
+            }
+        """
+        assert normalize_sdl(registry[Human]) == normalize_sdl(expected_value)
+
+    def test_fills_the_given_empty_registry(self):
+        registry = pydantic2graphene.ModelRegistry()
+        value = pydantic2graphene.to_graphene_many(
+            [Human],
+            cache=pydantic2graphene.ConversionCache(),
+            registry=registry,
+        )
+
+        assert value is registry
+        assert set(registry) == {Human, Pet, Toy}
+
+    def test_input_object_types(self):
+        registry = pydantic2graphene.to_graphene_many(
+            [Human],
+            graphene.InputObjectType,
+            cache=pydantic2graphene.ConversionCache(),
+        )
+
+        assert registry[Pet].__name__ == "PetInputGql"
+        assert registry.get(Pet, graphene.ObjectType) is None
+
+    def test_shares_the_cache(self):
+        cache = pydantic2graphene.ConversionCache()
+        pydantic2graphene.to_graphene_many([Human, Pet, Toy], cache=cache)
+
+        # a graphene class and a field plan per model
+        assert cache.stats().size == 6
+        assert cache.stats().hits == 0
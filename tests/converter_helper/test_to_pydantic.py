@@ -0,0 +1,121 @@
+import decimal
+import enum
+import typing
+import uuid
+
+import graphene
+import pydantic
+import pytest
+
+import pydantic2graphene
+
+
+class Tag(pydantic.BaseModel):
+    name: str
+
+
+class Item(pydantic.BaseModel):
+    name: str
+    price: float = pydantic.Field(alias="cost")
+    tags: typing.List[Tag] = []
+    main_tag: Tag = None
+
+
+def run_query(query, trusted=False):
+    ItemInputGql = pydantic2graphene.to_graphene(
+        Item,
+        graphene.InputObjectType,
+        cache=pydantic2graphene.ConversionCache(),
+    )
+    received = []
+
+    class Query(graphene.ObjectType):
+        item = graphene.String(item=ItemInputGql(required=True))
+
+        def resolve_item(root, info, item):
+            received.append(ItemInputGql.to_pydantic(item, trusted=trusted))
+            return "ok"
+
+    result = graphene.Schema(query=Query).execute(query)
+    assert not result.errors, result.errors
+    return received[0]
+
+
+QUERY = """{
+  item(item: {
+    name: "pen", price: 1.5, tags: [{name: "a"}, {name: "b"}],
+    mainTag: {name: "c"}
+  })
+}"""
+
+
+class TestToPydantic:
+    def test_builds_model_with_nested_inputs(self):
+        item = run_query(QUERY)
+
+        assert item == Item(
+            name="pen",
+            cost=1.5,
+            tags=[Tag(name="a"), Tag(name="b")],
+            main_tag=Tag(name="c"),
+        )
+
+    def test_trusted_uses_construct(self):
+        item = run_query(QUERY, trusted=True)
+
+        assert isinstance(item, Item)
+        assert isinstance(item.main_tag, Tag)
+        assert [tag.name for tag in item.tags] == ["a", "b"]
+        assert item.price == 1.5
+
+    def test_trusted_coerces_values_graphene_gives_with_another_type(self):
+        class Color(enum.Enum):
+            RED = "RED"
+
+        class Order(pydantic.BaseModel):
+            id: uuid.UUID
+            total: decimal.Decimal
+            color: Color
+            ids: typing.List[uuid.UUID] = []
+
+        OrderInputGql = pydantic2graphene.to_graphene(
+            Order,
+            graphene.InputObjectType,
+            cache=pydantic2graphene.ConversionCache(),
+        )
+        order_id = uuid.uuid4()
+        order = OrderInputGql.to_pydantic(
+            {
+                "id": str(order_id),
+                "total": 1.5,
+                "color": "RED",
+                "ids": [str(order_id)],
+            },
+            trusted=True,
+        )
+
+        assert order.id == order_id
+        assert order.total == decimal.Decimal("1.5")
+        assert order.color is Color.RED
+        assert order.ids == [order_id]
+
+    def test_missing_values_use_the_model_defaults(self):
+        item = run_query('{ item(item: {name: "pen", price: 2}) }')
+
+        assert item.tags == []
+        assert item.main_tag is None
+
+    def test_validates_when_not_trusted(self):
+        ItemInputGql = pydantic2graphene.to_graphene(
+            Item,
+            graphene.InputObjectType,
+            cache=pydantic2graphene.ConversionCache(),
+        )
+        with pytest.raises(pydantic.ValidationError):
+            ItemInputGql.to_pydantic({"name": "pen"})
+
+    def test_only_on_input_types(self):
+        ItemGql = pydantic2graphene.to_graphene(
+            Item, cache=pydantic2graphene.ConversionCache()
+        )
+        assert not hasattr(ItemGql, "to_pydantic")
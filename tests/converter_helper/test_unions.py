@@ -0,0 +1,106 @@
+import typing
+
+import graphene
+import pydantic
+import pytest
+
+import pydantic2graphene
+
+
+class Photo(pydantic.BaseModel):
+    url: str
+
+
+class Post(pydantic.BaseModel):
+    text: str
+
+
+class Feed(pydantic.BaseModel):
+    items: typing.List[typing.Union[Photo, Post]]
+    pinned: typing.Optional[typing.Union[Photo, Post]]
+
+
+QUERY = """
+{
+    feed {
+        items {
+            __typename
+            ... on PhotoGql { url }
+            ... on PostGql { text }
+        }
+        pinned { __typename }
+    }
+}
+"""
+
+
+def build_schema(feed):
+    FeedGql = pydantic2graphene.to_graphene(
+        Feed, cache=pydantic2graphene.ConversionCache()
+    )
+
+    class Query(graphene.ObjectType):
+        feed = graphene.Field(FeedGql)
+
+        def resolve_feed(root, info):
+            return feed
+
+    return graphene.Schema(query=Query)
+
+
+class TestUnions:
+    def test_union_type(self):
+        schema = str(build_schema(None))
+        assert "union PhotoPostUnionGql = PhotoGql | PostGql" in schema
+        assert "items: [PhotoPostUnionGql!]!" in schema
+        assert "pinned: PhotoPostUnionGql\n" in schema
+
+    def test_resolves_members(self):
+        feed = Feed(
+            items=[Photo(url="cat.png"), Post(text="hello")],
+            pinned=Post(text="hello"),
+        )
+        result = build_schema(feed).execute(QUERY)
+        assert not result.errors, result.errors
+        assert result.data == {
+            "feed": {
+                "items": [
+                    {"__typename": "PhotoGql", "url": "cat.png"},
+                    {"__typename": "PostGql", "text": "hello"},
+                ],
+                "pinned": {"__typename": "PostGql"},
+            }
+        }
+
+    @pytest.mark.parametrize(
+        "graphene_type", [graphene.ObjectType, graphene.InputObjectType]
+    )
+    def test_optional_members_are_not_unions(
+        self, normalize_sdl, graphene_type
+    ):
+        class Album(pydantic.BaseModel):
+            ratings: typing.List[typing.Optional[int]]
+            photos: typing.List[typing.Optional[Photo]] = None
+
+        value = normalize_sdl(
+            pydantic2graphene.to_graphene(
+                Album,
+                graphene_type,
+                cache=pydantic2graphene.ConversionCache(),
+            )
+        )
+
+        assert "ratings:[Int!]!" in value
+        assert "photos:[Photo" in value
+        assert "Union" not in value
+
+    def test_union_of_scalars_not_supported(self):
+        class Value(pydantic.BaseModel):
+            value: typing.Union[Photo, int]
+
+        with pytest.raises(pydantic2graphene.FieldNotSupported):
+            pydantic2graphene.to_graphene(Value)
+
+    def test_input_union_not_supported(self):
+        with pytest.raises(pydantic2graphene.FieldNotSupported):
+            pydantic2graphene.to_graphene(Feed, graphene.InputObjectType)
@@ -0,0 +1,49 @@
+import graphene
+import pydantic
+
+import pydantic2graphene.fields as fields
+
+
+class CountingMroMeta(type):
+    calls = 0
+
+    def mro(cls):
+        CountingMroMeta.calls += 1
+        return super().mro()
+
+
+class TestTypeDispatchMemoization:
+    def test_constrained_type(self):
+        constrained = pydantic.constr(max_length=10)
+
+        value = fields.get_grapehene_field_by_type(constrained)
+
+        assert value is graphene.String
+
+    def test_mro_is_walked_once_per_class(self):
+        class Money(str, metaclass=CountingMroMeta):
+            pass
+
+        CountingMroMeta.calls = 0
+        for _ in range(3):
+            value = fields.get_grapehene_field_by_type(Money)
+            assert value is graphene.String
+
+        assert CountingMroMeta.calls == 1
+
+    def test_negative_results_are_memoized(self):
+        class Unknown:
+            pass
+
+        assert fields.get_grapehene_field_by_type(Unknown) is None
+        assert Unknown in fields.default_type_registry._resolved_classes
+
+    def test_memo_is_reset_with_the_type_mapping(self):
+        class Custom(int):
+            pass
+
+        fields.get_grapehene_field_by_type(Custom)
+        fields._TYPE_MAPPING = None
+        fields.get_grapehene_field_by_type(int)
+
+        assert Custom not in fields.default_type_registry._resolved_classes
@@ -0,0 +1,123 @@
+import graphene
+import pydantic
+import pytest
+
+import pydantic2graphene
+
+
+class ObjectId(str):
+    pass
+
+
+class Money(float):
+    pass
+
+
+class Mixin:
+    pass
+
+
+class Price(Money, Mixin):
+    pass
+
+
+def to_pydantic_class(field_type):
+    class Fake(pydantic.BaseModel):
+        field: field_type
+
+    return Fake
+
+
+class TestTypeRegistry:
+    def test_registered_type_is_used(self):
+        registry = pydantic2graphene.TypeRegistry()
+        registry.register_type(ObjectId, graphene.ID)
+
+        assert registry.get(ObjectId) is graphene.ID
+
+    def test_registration_invalidates_memoized_lookups(self):
+        registry = pydantic2graphene.TypeRegistry()
+        assert registry.get(Price) is None
+
+        registry.register_type(Money, graphene.Float)
+
+        assert registry.get(Price) is graphene.Float
+
+    def test_highest_priority_base_wins(self):
+        registry = pydantic2graphene.TypeRegistry()
+        registry.register_type(Money, graphene.Float)
+        registry.register_type(Mixin, graphene.String, priority=10)
+
+        assert registry.get(Price) is graphene.String
+
+    def test_parent_registry_is_used(self):
+        parent = pydantic2graphene.TypeRegistry()
+        child = pydantic2graphene.TypeRegistry(parent=parent)
+        assert child.get(ObjectId) is None
+
+        parent.register_type(ObjectId, graphene.ID)
+
+        assert child.get(ObjectId) is graphene.ID
+
+    def test_invalid_graphene_type(self):
+        registry = pydantic2graphene.TypeRegistry()
+        with pytest.raises(pydantic2graphene.InvalidType):
+            registry.register_type(ObjectId, str)
+
+
+class TestScopedTypeRegistry:
+    def test_converter_uses_its_registry(self, normalize_sdl):
+        registry = pydantic2graphene.TypeRegistry(
+            parent=pydantic2graphene.default_type_registry
+        )
+        registry.register_type(ObjectId, graphene.ID)
+        model = to_pydantic_class(ObjectId)
+
+        value = pydantic2graphene.to_graphene(
+            model,
+            options={"type_registry": registry},
+            cache=pydantic2graphene.ConversionCache(),
+        )
+        expected_value = """
+            type FakeGql {
+                field: ID!
+            }
+        """
+        assert normalize_sdl(value) == normalize_sdl(expected_value)
+
+    def test_registration_invalidates_cached_classes(self, normalize_sdl):
+        registry = pydantic2graphene.TypeRegistry(
+            parent=pydantic2graphene.default_type_registry
+        )
+        model = to_pydantic_class(ObjectId)
+        cache = pydantic2graphene.ConversionCache()
+        options = {"type_registry": registry}
+
+        before = pydantic2graphene.to_graphene(
+            model, options=options, cache=cache
+        )
+        registry.register_type(ObjectId, graphene.ID, priority=1)
+        after = pydantic2graphene.to_graphene(
+            model, options=options, cache=cache
+        )
+
+        assert before is not after
+        assert "field:ID!" in normalize_sdl(after)
+
+    def test_nested_models_use_the_registry(self, normalize_sdl):
+        registry = pydantic2graphene.TypeRegistry(
+            parent=pydantic2graphene.default_type_registry
+        )
+        registry.register_type(ObjectId, graphene.ID)
+        model = to_pydantic_class(ObjectId)
+
+        class Parent(pydantic.BaseModel):
+            child: model
+
+        value = pydantic2graphene.to_graphene(
+            Parent,
+            options={"type_registry": registry},
+            cache=pydantic2graphene.ConversionCache(),
+        )
+
+        assert "field:ID!" in normalize_sdl(value)